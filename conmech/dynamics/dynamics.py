@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
+from scipy import sparse
 
 from conmech.dynamics.factory.dynamics_factory_method import (
     get_dynamics,
@@ -18,8 +19,11 @@ class Dynamics:
     def __init__(
         self,
         body: "Body",
+        parallel: bool = False,
     ):
         self.body = body
+        # assemble element integrals with numba.prange over all available threads
+        self.parallel = parallel
         self.body.dynamics = self
 
         self.force = BodyForces(body)
@@ -28,23 +32,27 @@ class Dynamics:
         )
         self.factory = get_factory(body.mesh.dimension)
         self.element_initial_volume: np.ndarray
-        self.volume_at_nodes: np.ndarray
-        self.acceleration_operator: np.ndarray
-        self.elasticity: np.ndarray
-        self.viscosity: np.ndarray
-        self._w_matrix: Optional[np.ndarray] = None
+        self.volume_at_nodes: sparse.csr_matrix
+        self.acceleration_operator: sparse.csr_matrix
+        self.elasticity: sparse.csr_matrix
+        self.viscosity: sparse.csr_matrix
+        self._w_matrix: Optional[np.ndarray] = None  # object array of sparse matrices
         self._local_stifness_matrices: Optional[np.ndarray] = None
-        self.__relaxation: Optional[np.ndarray] = None
+        self.__relaxation: Optional[sparse.csr_matrix] = None
         self.__relaxation_tensor: Optional[float] = None
-        self.thermal_expansion: np.ndarray
-        self.thermal_conductivity: np.ndarray
-        self.piezoelectricity: np.ndarray
-        self.permittivity: np.ndarray
-        self.poisson_operator: np.ndarray
+        self._relaxation_basis: Optional[Tuple[sparse.csr_matrix, np.ndarray]] = None
+        self.thermal_expansion: sparse.csr_matrix
+        self.thermal_conductivity: sparse.csr_matrix
+        self.piezoelectricity: sparse.csr_matrix
+        self.permittivity: sparse.csr_matrix
+        self.poisson_operator: sparse.csr_matrix
+        # incremented whenever matrices are reassembled, e.g. with new density
+        self.version: int = 0
 
         self.reinitialize_matrices()
 
     def reinitialize_matrices(self, elements_density: Optional[np.ndarray] = None):
+        self.version += 1
         (
             self.element_initial_volume,
             self.volume_at_nodes,
@@ -53,11 +61,13 @@ class Dynamics:
             self._w_matrix,
             self._local_stifness_matrices,
         ) = get_basic_matrices(
-            elements=self.body.mesh.elements, nodes=self.body.mesh.nodes
+            elements=self.body.mesh.elements, nodes=self.body.mesh.nodes, parallel=self.parallel
         )  # + self.displacement_old)
 
         if elements_density is not None:
             self._w_matrix = self.asembly_w_matrix_with_density(elements_density)
+        self._relaxation_basis = None
+        self.__relaxation_tensor = None
 
         (
             self.acceleration_operator,
@@ -77,14 +87,22 @@ class Dynamics:
         )
 
     def asembly_w_matrix_with_density(self, elements_density: np.ndarray):
-        w_matrix = np.zeros_like(self._w_matrix)
-        for element_index, element in enumerate(self.body.mesh.elements):
-            for i, global_i in enumerate(element):
-                for j, global_j in enumerate(element):
-                    w_matrix[:, :, global_i, global_j] += (
-                        elements_density[element_index]
-                        * self._local_stifness_matrices[:, :, element_index, i, j]
-                    )
+        elements = self.body.mesh.elements
+        nodes_count = self.body.mesh.nodes_count
+        element_size = elements.shape[1]
+        # (global_i, global_j) for each pair of element nodes in the same order as local matrices
+        rows = np.repeat(elements, element_size, axis=1).ravel()
+        columns = np.tile(elements, (1, element_size)).ravel()
+        local_matrices = elements_density[:, None, None] * self._local_stifness_matrices
+
+        dimension = len(local_matrices)
+        w_matrix = np.empty((dimension, dimension), dtype=object)
+        for k in range(dimension):
+            for j in range(dimension):
+                w_matrix[k, j] = sparse.csr_matrix(
+                    (local_matrices[k, j].ravel(), (rows, columns)),
+                    shape=(nodes_count, nodes_count),
+                )
         return w_matrix
 
     def relaxation(self, time: float = 0):
@@ -93,10 +111,21 @@ class Dynamics:
             relaxation_tensor = self.body.properties.relaxation(time)
             if (relaxation_tensor != self.__relaxation_tensor).any():
                 self.__relaxation_tensor = relaxation_tensor
-                self.__relaxation = self.factory.get_relaxation_tensor(
-                    self._w_matrix, relaxation_tensor
-                )
+                self.__relaxation = self.relaxation_operator(relaxation_tensor)
         else:
             raise TypeError("There is no relaxation operator!")
 
         return self.__relaxation
+
+    def relaxation_operator(self, coefficients: np.ndarray) -> sparse.csr_matrix:
+        """
+        Relaxation operator with given coefficients, as their linear combination with operators
+        of unit coefficients. These are assembled from W once, so changing coefficients
+        costs O(nnz) instead of reassembly.
+        """
+        if self._relaxation_basis is None:
+            self._relaxation_basis = self.factory.get_relaxation_basis(self._w_matrix)
+        pattern, basis = self._relaxation_basis
+        return sparse.csr_matrix(
+            (basis @ np.ravel(coefficients), pattern.indices, pattern.indptr), shape=pattern.shape
+        )
@@ -1,38 +1,96 @@
-from typing import Tuple
+from typing import List, Tuple
+
 import numpy as np
+from scipy import sparse
+
+
+def to_sparse_features(
+    rows: np.ndarray, columns: np.ndarray, edges_features: np.ndarray, nodes_count: int
+) -> List[sparse.csr_matrix]:
+    return [
+        sparse.csr_matrix((values, (rows, columns)), shape=(nodes_count, nodes_count))
+        for values in edges_features
+    ]
 
 
 class AbstractDynamicsFactory:
+    """
+    Builds operators of the body from sparse U, V and W features.
+
+    V and W are object arrays of (sparse or dense) matrices, indexed as V[i] and W[i, j].
+    All returned operators are sparse matrices in CSR format.
+    """
+
     @property
     def dimension(self) -> int:
         raise NotImplementedError()
 
-    def get_edges_features_matrix(self, elements, nodes) -> Tuple:
+    def get_edges_features_matrix(self, elements, nodes, parallel: bool = False) -> Tuple:
         raise NotImplementedError()
 
     def calculate_constitutive_matrices(
         self, W: np.ndarray, mu: float, lambda_: float
-    ) -> np.ndarray:
+    ) -> sparse.csr_matrix:
         raise NotImplementedError()
 
-    def get_relaxation_tensor(self, W: np.ndarray, coeff: np.ndarray):
+    def get_relaxation_tensor(self, W: np.ndarray, coeff: np.ndarray) -> sparse.csr_matrix:
         raise NotImplementedError()
 
-    def calculate_acceleration(self, U: np.ndarray, density: float) -> np.ndarray:
-        raise NotImplementedError()
+    def get_relaxation_basis(self, W: np.ndarray) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """
+        Relaxation tensor decomposed into operators of unit coefficients.
 
-    def calculate_thermal_expansion(self, V: np.ndarray, coeff: np.ndarray) -> np.ndarray:
-        raise NotImplementedError()
+        Returns `pattern`, holding union of sparsity patterns of the operators, and `basis` of
+        their values on it, so that values of `get_relaxation_tensor(W, coeff)` on `pattern`
+        are `basis @ coeff.ravel()`.
+        """
+        dim = self.dimension
+        operators = []
+        for unit in np.eye(dim**3).reshape(-1, dim, dim, dim):
+            operator = self.get_relaxation_tensor(W, unit).tocsr()
+            operator.eliminate_zeros()
+            operators.append(operator)
+        pattern = sparse.csr_matrix(sum(abs(operator) for operator in operators))
+        pattern.sort_indices()
 
-    def calculate_thermal_conductivity(self, W: np.ndarray, coeff: np.ndarray) -> np.ndarray:
-        raise NotImplementedError()
+        def keys(matrix):
+            rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+            return rows * matrix.shape[1] + matrix.indices
 
-    def get_piezoelectric_tensor(self, W: np.ndarray, coeff: np.ndarray) -> np.ndarray:
-        raise NotImplementedError()
+        pattern_keys = keys(pattern)
+        basis = np.zeros((pattern.nnz, len(operators)))
+        for i, operator in enumerate(operators):
+            operator.sum_duplicates()
+            basis[np.searchsorted(pattern_keys, keys(operator)), i] = operator.data
+        return pattern, basis
 
-    def get_permittivity_tensor(self, W: np.ndarray, coeff: np.ndarray) -> np.ndarray:
-        raise NotImplementedError()
+    def calculate_acceleration(self, U: sparse.spmatrix, density: float) -> sparse.csr_matrix:
+        return density * sparse.block_diag((U,) * self.dimension, format="csr")
+
+    def calculate_thermal_expansion(self, V: np.ndarray, coeff: np.ndarray) -> sparse.csr_matrix:
+        dim = self.dimension
+        return sparse.hstack(
+            [sum(coeff[i][j] * V[j] for j in range(dim)) for i in range(dim)], format="csr"
+        )
+
+    def calculate_thermal_conductivity(self, W: np.ndarray, coeff: np.ndarray) -> sparse.csr_matrix:
+        dim = self.dimension
+        return sparse.csr_matrix(sum(coeff[i][j] * W[i, j] for i in range(dim) for j in range(dim)))
+
+    def get_piezoelectric_tensor(self, W: np.ndarray, coeff: np.ndarray) -> sparse.csr_matrix:
+        dim = self.dimension
+        return sparse.hstack(
+            [
+                sum(coeff[i][k][j] * W[k, j] for k in range(dim) for j in range(dim))
+                for i in range(dim)
+            ],
+            format="csr",
+        )
+
+    def get_permittivity_tensor(self, W: np.ndarray, coeff: np.ndarray) -> sparse.csr_matrix:
+        dim = self.dimension
+        return sparse.csr_matrix(sum(coeff[i][j] * W[i, j] for i in range(dim) for j in range(dim)))
 
     @staticmethod
-    def calculate_poisson_matrix(W: np.ndarray) -> np.ndarray:
-        return np.sum(W.diagonal(), axis=2)
+    def calculate_poisson_matrix(W: np.ndarray) -> sparse.csr_matrix:
+        return sparse.csr_matrix(sum(W[i, i] for i in range(len(W))))
@@ -21,7 +21,7 @@ def get_factory(dimension: int):
     return factory
 
 
-def get_basic_matrices(elements: np.ndarray, nodes: np.ndarray):
+def get_basic_matrices(elements: np.ndarray, nodes: np.ndarray, parallel: bool = False):
     dimension = len(elements[0]) - 1
     factory = get_factory(dimension)
 
@@ -29,21 +29,18 @@ def get_basic_matrices(elements: np.ndarray, nodes: np.ndarray):
         edges_features_matrix,
         element_initial_volume,
         local_stifness_matrices,
-    ) = factory.get_edges_features_matrix(elements, nodes)
+    ) = factory.get_edges_features_matrix(elements, nodes, parallel=parallel)
 
     volume_at_nodes = edges_features_matrix[0]
     U = edges_features_matrix[1]
 
-    V = np.asarray([edges_features_matrix[2 + j] for j in range(factory.dimension)])
-    W = np.asarray(
-        [
-            [
-                edges_features_matrix[2 + factory.dimension * (k + 1) + j]
-                for j in range(factory.dimension)
-            ]
-            for k in range(factory.dimension)
-        ]
-    )
+    # sparse operators are kept in object arrays, so they can be indexed like tensors, e.g. W[0, 1]
+    V = np.empty(factory.dimension, dtype=object)
+    W = np.empty((factory.dimension, factory.dimension), dtype=object)
+    for k in range(factory.dimension):
+        V[k] = edges_features_matrix[2 + k]
+        for j in range(factory.dimension):
+            W[k, j] = edges_features_matrix[2 + factory.dimension * (k + 1) + j]
     return element_initial_volume, volume_at_nodes, U, V, W, local_stifness_matrices
 
 
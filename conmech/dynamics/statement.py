@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 import numpy as np
+from scipy import sparse
+
+from conmech.properties.body_properties import PronyRelaxation
 
 
 @dataclass
@@ -22,6 +25,19 @@ class Statement:
         self.left_hand_side = None
         self.right_hand_side = None
         self.dirichlet_cond_name = "dirichlet"
+        self._dirichlet_partition: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # (left hand side before elimination, after it, its product with lifting vector)
+        self._eliminated: Optional[Tuple] = None
+        # incremented whenever left hand side is rebuilt, so that caches depending on it
+        # (factorisations, Schur complements) can tell it changed
+        self.left_hand_side_version: int = 0
+        self._left_hand_side_inputs: Optional[tuple] = None
+        self._reduced_left_hand_side: Optional[Tuple[int, Any]] = None
+
+    # pylint: disable=unused-argument # 'var'
+    def left_hand_side_inputs(self, var: Variables) -> tuple:
+        """Values left hand side depends on; it is rebuilt only when they change."""
+        return (self.body.dynamics.version,)
 
     def update_left_hand_side(self, var: Variables):
         raise NotImplementedError()
@@ -30,23 +46,93 @@ class Statement:
         raise NotImplementedError()
 
     def update(self, var: Variables):
-        self.update_left_hand_side(var)
+        inputs = self.left_hand_side_inputs(var)
+        if self.left_hand_side is None or inputs != self._left_hand_side_inputs:
+            self.update_left_hand_side(var)
+            self._left_hand_side_inputs = inputs
+            self.left_hand_side_version += 1
         self.update_right_hand_side(var)
         self.apply_dirichlet_condition()
 
+    @property
+    def dirichlet_partition(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mask of constrained degrees of freedom and lifting vector holding their values.
+
+        Mesh and its conditions do not change, so they are computed once per statement.
+        """
+        if self._dirichlet_partition is None:
+            size = self.left_hand_side.shape[0]
+            constrained = np.zeros(size, dtype=bool)
+            lifting = np.zeros(size)
+            for dirichlet_cond in self.find_dirichlet_conditions():
+                c = self.body.mesh.boundaries.boundaries[dirichlet_cond].node_condition
+                node_count = self.body.mesh.nodes_count
+                for i, j in self.body.mesh.boundaries.get_all_boundary_indices(
+                    dirichlet_cond, node_count, self.dimension
+                ):
+                    constrained[i] = True
+                    lifting[i] = c[j]
+            self._dirichlet_partition = constrained, lifting
+        return self._dirichlet_partition
+
+    @property
+    def free_dofs(self) -> np.ndarray:
+        return np.flatnonzero(~self.dirichlet_partition[0])
+
+    @property
+    def reduced_left_hand_side(self):
+        """Left hand side restricted to free degrees of freedom."""
+        if (
+            self._reduced_left_hand_side is None
+            or self._reduced_left_hand_side[0] != self.left_hand_side_version
+        ):
+            free = self.free_dofs
+            if sparse.issparse(self.left_hand_side):
+                reduced = self.left_hand_side[free][:, free]
+            else:
+                reduced = self.left_hand_side[np.ix_(free, free)]
+            self._reduced_left_hand_side = self.left_hand_side_version, reduced
+        return self._reduced_left_hand_side[1]
+
+    def expand(self, reduced_vector: np.ndarray) -> np.ndarray:
+        """Vector of all degrees of freedom with given free ones and constrained by conditions."""
+        result = self.dirichlet_partition[1].copy()
+        result[self.free_dofs] = reduced_vector
+        return result
+
     def apply_dirichlet_condition(self):
-        for dirichlet_cond in self.find_dirichlet_conditions():
-            c = self.body.mesh.boundaries.boundaries[dirichlet_cond].node_condition
-            node_count = self.body.mesh.nodes_count
-            for i, j in self.body.mesh.boundaries.get_all_boundary_indices(
-                dirichlet_cond, node_count, self.dimension
-            ):
-                self.right_hand_side[:] -= self.left_hand_side[:, i] @ c[j]
-                self.left_hand_side[:, i] = 0
-                self.left_hand_side[i, :] = 0
-                # have to be "[i][:, i]" instead of just a "[i, i]" because the i may be ndarray
-                self.left_hand_side[i][:, i] = np.eye(j.stop - j.start)
-                self.right_hand_side[i] = c[j]
+        constrained, lifting = self.dirichlet_partition
+        if not constrained.any():
+            return
+
+        # elimination depends only on the matrix, so it is redone only for a new one
+        if self._eliminated is None or all(
+            matrix is not self.left_hand_side for matrix in self._eliminated[:2]
+        ):
+            self._eliminated = (
+                self.left_hand_side,
+                self._eliminate(self.left_hand_side, constrained),
+                self.left_hand_side @ lifting,
+            )
+        _, self.left_hand_side, lifting_correction = self._eliminated
+
+        self.right_hand_side[:] -= lifting_correction
+        self.right_hand_side[constrained] = lifting[constrained]
+
+    @staticmethod
+    def _eliminate(left_hand_side, constrained: np.ndarray):
+        if sparse.issparse(left_hand_side):
+            # zeroing rows and columns in place would change sparsity structure of the matrix
+            free = sparse.diags((~constrained).astype(np.double))
+            return (
+                free @ left_hand_side @ free + sparse.diags(constrained.astype(np.double))
+            ).tocsr()
+        left_hand_side = left_hand_side.copy()
+        left_hand_side[:, constrained] = 0
+        left_hand_side[constrained, :] = 0
+        left_hand_side[constrained, constrained] = 1
+        return left_hand_side
 
     def find_dirichlet_conditions(self):
         boundaries = self.body.mesh.boundaries.boundaries
@@ -86,24 +172,97 @@ class StaticDisplacementStatement(Statement):
 
 
 class QuasistaticRelaxationStatement(Statement):
+    """
+    Relaxation term of kernels given by `PronyRelaxation` is the hereditary integral
+    sum_k C_k int_0^t exp(-(t - s) / tau_k) u(s) ds, whose terms are updated recursively
+    from increments of absement, at cost O(nnz) per step. Other kernels R, evaluated
+    at current time (once per step), multiply absement.
+    """
+
     def __init__(self, body):
         super().__init__(body, 2)
+        # (time, absement, integrals of terms) as of the last step of Prony kernel
+        self._relaxation_memory: Optional[Tuple[float, np.ndarray, np.ndarray]] = None
+        self._relaxation_operators: Optional[Tuple[int, list]] = None
+        # (time, dynamics version, relaxation tensor, its operator) as of the last evaluation
+        self._relaxation: Optional[Tuple[float, int, np.ndarray, sparse.csr_matrix]] = None
+
+    @property
+    def prony_kernel(self) -> Optional[PronyRelaxation]:
+        relaxation = self.body.properties.relaxation
+        return relaxation if isinstance(relaxation, PronyRelaxation) else None
+
+    def relaxation(self, time: float) -> Tuple[np.ndarray, sparse.csr_matrix]:
+        """
+        Relaxation tensor at `time` and its operator. The tensor is evaluated once per time
+        and the operator is rebuilt only when the tensor (or dynamics) changes.
+        """
+        version = self.body.dynamics.version
+        cached = self._relaxation
+        if cached is None or cached[0] != time or cached[1] != version:
+            tensor = np.asarray(self.body.properties.relaxation(time))
+            if cached is not None and cached[1] == version and np.array_equal(tensor, cached[2]):
+                operator = cached[3]
+            else:
+                operator = self.body.dynamics.relaxation_operator(tensor)
+            self._relaxation = time, version, tensor, operator
+        return self._relaxation[2], self._relaxation[3]
+
+    def left_hand_side_inputs(self, var: Variables) -> tuple:
+        if self.prony_kernel is not None:
+            # only instantaneous relaxation enters left hand side
+            return self.body.dynamics.version, var.time_step
+        return (
+            self.body.dynamics.version,
+            var.time_step,
+            self.relaxation(var.time)[0].tobytes(),
+        )
 
     def update_left_hand_side(self, var: Variables):
         assert var.time_step is not None
 
+        time = 0 if self.prony_kernel is not None else var.time
         self.left_hand_side = (
-            self.body.dynamics.elasticity.copy()
-            + self.body.dynamics.relaxation(var.time) * var.time_step
+            self.body.dynamics.elasticity.copy() + self.relaxation(time)[1] * var.time_step
         )
 
     def update_right_hand_side(self, var: Variables):
         assert var.absement is not None
         assert var.time is not None
 
-        self.right_hand_side = (
-            self.body.dynamics.force.integrate(time=var.time)
-            - self.body.dynamics.relaxation(var.time) @ var.absement.T
+        self.right_hand_side = self.body.dynamics.force.integrate(
+            time=var.time
+        ) - self.relaxation_term(var)
+
+    def relaxation_term(self, var: Variables) -> np.ndarray:
+        kernel = self.prony_kernel
+        if kernel is None:
+            return self.relaxation(var.time)[1] @ var.absement.T
+
+        assert var.time_step is not None
+        absement = np.ravel(var.absement)
+        decay = kernel.decay(var.time_step)
+        if self._relaxation_memory is None:
+            self._relaxation_memory = (
+                None,
+                np.zeros_like(absement),
+                np.zeros((len(decay), len(absement))),
+            )
+        time, last_absement, memory = self._relaxation_memory
+        if var.time != time:
+            # integrals decay over the step and gain displacement integrated in it
+            memory = decay[:, None] * memory + (absement - last_absement)
+            self._relaxation_memory = var.time, absement.copy(), memory
+
+        version = self.body.dynamics.version
+        if self._relaxation_operators is None or self._relaxation_operators[0] != version:
+            self._relaxation_operators = version, [
+                self.body.dynamics.relaxation_operator(coefficients)
+                for coefficients in np.asarray(kernel.coefficients)
+            ]
+        return sum(
+            factor * (operator @ integral)
+            for factor, operator, integral in zip(decay, self._relaxation_operators[1], memory)
         )
 
 
@@ -111,6 +270,9 @@ class QuasistaticVelocityStatement(Statement):
     def __init__(self, body):
         super().__init__(body, 2)
 
+    def left_hand_side_inputs(self, var: Variables) -> tuple:
+        return self.body.dynamics.version, var.time_step
+
     def update_left_hand_side(self, var: Variables):
         assert var.time_step is not None
 
@@ -132,6 +294,9 @@ class DynamicVelocityStatement(Statement):
     def __init__(self, body):
         super().__init__(body, 2)
 
+    def left_hand_side_inputs(self, var: Variables) -> tuple:
+        return self.body.dynamics.version, var.time_step
+
     def update_left_hand_side(self, var):
         assert var.time_step is not None
 
@@ -169,6 +334,9 @@ class TemperatureStatement(Statement):
     def __init__(self, body):
         super().__init__(body, 1)
 
+    def left_hand_side_inputs(self, var: Variables) -> tuple:
+        return self.body.dynamics.version, var.time_step
+
     def update_left_hand_side(self, var):
         assert var.time_step is not None
 
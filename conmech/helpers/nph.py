@@ -1,7 +1,6 @@
 """
 numpy helpers
 """
-from ctypes import ArgumentError
 from typing import Optional, Tuple
 
 import numba
@@ -101,14 +100,6 @@ def get_in_base(vectors: np.ndarray, base: np.ndarray) -> np.ndarray:
     return vectors @ base.T
 
 
-@numba.njit
-def get_node_index_numba(node, nodes):
-    for i, n in enumerate(nodes):
-        if np.sum(np.abs(node - n)) < 0.0001:
-            return i
-    raise ArgumentError
-
-
 def generate_normal(rows: int, columns: int, scale: float) -> np.ndarray:
     return np.random.normal(loc=0.0, scale=scale * 0.5, size=[rows, columns])
 
@@ -0,0 +1,40 @@
+"""
+pointwise evaluation of user functions (sources, indicators)
+"""
+from typing import Callable
+
+import numba
+import numpy as np
+
+
+def vectorized(function: Callable) -> Callable:
+    """
+    Marks function of a point as evaluated at once for many points: called with (m, dim) array
+    of points (and further arguments), it returns an array of m values.
+    """
+    function.vectorized = True
+    return function
+
+
+@numba.njit
+def evaluate_pointwise_numba(function, points, args, values):
+    for i, point in enumerate(points):
+        values[i] = function(point, *args)
+
+
+def evaluate_pointwise(function: Callable, points: np.ndarray, *args, dtype=float) -> np.ndarray:
+    """
+    Values of `function(point, *args)` at each of `points`. Functions marked as `vectorized` are
+    called once, numba compiled ones in a compiled loop and other ones point by point.
+    """
+    if getattr(function, "vectorized", False):
+        return np.asarray(function(points, *args), dtype=dtype)
+    if len(points) == 0:
+        return np.empty(0, dtype=dtype)
+    values = np.empty((len(points), *np.shape(function(points[0], *args))), dtype=dtype)
+    if isinstance(function, numba.core.registry.CPUDispatcher):
+        evaluate_pointwise_numba(function, points, args, values)
+    else:
+        for i, point in enumerate(points):
+            values[i] = function(point, *args)
+    return values
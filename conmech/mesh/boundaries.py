@@ -17,6 +17,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301,
 # USA.
 
+from dataclasses import dataclass
 from typing import Dict
 
 import numpy as np
@@ -66,6 +67,61 @@ def get_boundary_surfaces_normals(nodes, boundary_surfaces, boundary_internal_in
     return unoriented_normals * external_orientation
 
 
+@dataclass(frozen=True)
+class ContactGeometry:
+    """
+    Geometry of the contact boundary, computed once per mesh and shared by all contact kernels.
+
+    Parameters:
+    ----------
+    surfaces : np.ndarray
+        Node indices of contact surfaces (edges in 2D, triangles in 3D).
+
+    measures : np.ndarray
+        Lengths (2D) or areas (3D) of contact surfaces.
+
+    normals : np.ndarray
+        Outer unit normals of contact surfaces.
+
+    tangential_projections : np.ndarray
+        Projections onto tangent spaces of contact surfaces, `I - n n^T`; rows of them
+        are tangential parts of the unit vectors.
+
+    max_node_ids : np.ndarray
+        The largest node index of each surface. Unknowns are ordered so that degrees of freedom
+        (of a vector with `offset` nodes) come first, so a surface has all its nodes being
+        degrees of freedom iff `max_node_ids < offset`.
+    """
+
+    surfaces: np.ndarray
+    measures: np.ndarray
+    normals: np.ndarray
+    tangential_projections: np.ndarray
+    max_node_ids: np.ndarray
+
+    @staticmethod
+    def from_surfaces(nodes, surfaces, normals) -> "ContactGeometry":
+        surfaces_nodes = nodes[surfaces]
+        if surfaces.shape[1] == 2:
+            measures = np.linalg.norm(surfaces_nodes[:, 1] - surfaces_nodes[:, 0], axis=-1)
+        else:
+            measures = 0.5 * np.linalg.norm(
+                np.cross(
+                    surfaces_nodes[:, 1] - surfaces_nodes[:, 0],
+                    surfaces_nodes[:, 2] - surfaces_nodes[:, 0],
+                ),
+                axis=-1,
+            )
+        tangential_projections = np.eye(nodes.shape[1]) - np.einsum("si,sj->sij", normals, normals)
+        return ContactGeometry(
+            surfaces=surfaces,
+            measures=measures,
+            normals=normals,
+            tangential_projections=tangential_projections,
+            max_node_ids=surfaces.max(axis=1, initial=-1),
+        )
+
+
 class Boundaries:
     def __init__(self, nodes, boundary_internal_indices: np.ndarray, **kwargs):
         self.boundaries: Dict[str, Boundary] = {}
@@ -80,6 +136,12 @@ class Boundaries:
             self.boundary_surfaces,
             self.boundary_internal_indices,
         )
+        self.contact_geometry = ContactGeometry.from_surfaces(
+            nodes,
+            self.contact_boundary,
+            # contact surfaces come first in boundary surfaces
+            np.ascontiguousarray(self.surface_normals[: len(self.contact_boundary)]),
+        )
 
     @property
     def boundary_surfaces(self):
@@ -102,7 +164,7 @@ class Boundaries:
 
     @property
     def contact_normals(self):
-        return self.surface_normals[: self.contact_nodes_count]
+        return self.contact_geometry.normals
 
     @property
     def neumann_boundary(self):
@@ -2,12 +2,29 @@ from typing import Callable, Dict, Optional
 
 import numpy as np
 
+from conmech.helpers.pointwise import evaluate_pointwise, vectorized
+
+
+def get_indicator_mask(indicator: Callable, points: np.ndarray) -> np.ndarray:
+    """
+    Mask of `points` for which `indicator` holds, see `evaluate_pointwise`.
+    """
+    return evaluate_pointwise(indicator, points, dtype=bool).reshape(len(points))
+
 
 class BoundariesDescription:
+    """
+    Indicators of boundaries (and conditions on them) given as keyword arguments.
+
+    Indicators are called with a single point unless marked as `vectorized`, which calls them
+    once with all boundary points. Plain Python indicators are thus evaluated point by point
+    in Python, so on large meshes they should be vectorized or numba compiled.
+    """
+
     def __init__(self, **kwargs):
         self.indicators: Dict[str, Callable[[np.ndarray], bool]] = {
-            "contact": lambda _: False,
-            "dirichlet": lambda _: False,
+            "contact": vectorized(lambda x: np.zeros(len(x), dtype=bool)),
+            "dirichlet": vectorized(lambda x: np.zeros(len(x), dtype=bool)),
         }
         self.conditions: Dict[str, Callable[[np.ndarray], Optional[float]]] = {
             "dirichlet": lambda x: np.zeros(x.shape[0]),
@@ -23,3 +40,6 @@ class BoundariesDescription:
 
     def __getitem__(self, item):
         return self.indicators[item]
+
+    def mask(self, item, points: np.ndarray) -> np.ndarray:
+        return get_indicator_mask(self.indicators[item], points)
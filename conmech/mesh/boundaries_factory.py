@@ -7,6 +7,7 @@ import numba
 import numpy as np
 
 from conmech.mesh.boundaries import Boundaries
+from conmech.mesh.boundaries_description import get_indicator_mask
 from conmech.mesh.boundary import Boundary
 
 
@@ -47,77 +48,55 @@ def extract_unique_elements(elements, opposing_indices):
     return elements[unique_indices], opposing_indices[unique_indices]
 
 
-def apply_predicate_to_surfaces(surfaces, nodes, predicate: Callable):
-    mask = [predicate(m) for m in np.mean(nodes[surfaces], axis=1)]  # TODO: #65 Use numba (?)
-    return surfaces[mask]
-
+def reorder_boundary_nodes(nodes, elements, is_contact: Callable, is_dirichlet: Callable):
+    """
+    Moves boundary nodes to the top, then contact nodes to the very top and finally dirichlet
+    nodes to the bottom. Each move keeps order of moved nodes and reverses order of the other
+    ones. Boundary is identified once and all moves are composed into a single permutation,
+    which is then applied to nodes and elements.
 
-def reorder_boundary_nodes(nodes, elements, is_contact, is_dirichlet):
-    # move boundary nodes to the top
-    nodes, elements, boundary_nodes_count = reorder(nodes, elements, lambda _: True, to_top=True)
-    # then move contact nodes to the top
-    nodes, elements, contact_nodes_count = reorder(nodes, elements, is_contact, to_top=True)
-    # finally move dirichlet nodes to the bottom
-    nodes, elements, dirichlet_nodes_count = reorder(nodes, elements, is_dirichlet, to_top=False)
+    Returns also boundary surfaces and their internal indices, as for reordered elements.
+    """
+    boundary_surfaces, boundary_internal_indices, boundary_indices = get_boundary_surfaces(elements)
+    boundary_nodes = nodes[boundary_indices]
+    is_boundary = np.zeros(len(nodes), dtype=bool)
+    is_boundary[boundary_indices] = True
+    is_contact_node = np.zeros(len(nodes), dtype=bool)
+    is_contact_node[boundary_indices] = get_indicator_mask(is_contact, boundary_nodes)
+    is_dirichlet_node = np.zeros(len(nodes), dtype=bool)
+    is_dirichlet_node[boundary_indices] = get_indicator_mask(is_dirichlet, boundary_nodes)
+
+    order = np.arange(len(nodes))
+    order = move_nodes(order, is_boundary, to_top=True)
+    order = move_nodes(order, is_contact_node, to_top=True)
+    order = move_nodes(order, is_dirichlet_node, to_top=False)
+    new_indices = np.empty_like(order)
+    new_indices[order] = np.arange(len(order))
+
+    boundary_surfaces = np.sort(new_indices[boundary_surfaces], axis=1)
+    # same order as of unique surfaces of reordered elements
+    surfaces_order = np.lexsort(boundary_surfaces.T[::-1])
     return (
-        nodes,
-        elements,
-        boundary_nodes_count,
-        contact_nodes_count,
-        dirichlet_nodes_count,
+        nodes[order],
+        np.sort(new_indices[elements], axis=1),
+        np.count_nonzero(is_boundary),
+        np.count_nonzero(is_contact_node),
+        np.count_nonzero(is_dirichlet_node),
+        boundary_surfaces[surfaces_order],
+        new_indices[boundary_internal_indices][surfaces_order],
     )
 
 
-def reorder(
-    unordered_nodes: np.ndarray,
-    unordered_elements: np.ndarray,
-    predicate: Callable,
-    to_top: bool,
-):
-    selected_indices = apply_predicate_to_boundary_nodes(
-        unordered_elements, unordered_nodes, predicate
-    )
-    return reorder_numba(unordered_nodes, unordered_elements, selected_indices, to_top)
-
-
-def apply_predicate_to_boundary_nodes(elements, nodes, predicate: Callable):
-    *_, boundary_indices = get_boundary_surfaces(elements)
-    mask = [predicate(n) for n in nodes[boundary_indices]]  # TODO: #65 Use numba (?)
-    return boundary_indices[mask]
-
-
-@numba.njit
-def reorder_numba(
-    unordered_nodes: np.ndarray,
-    unordered_elements: np.ndarray,
-    selected_indices: np.ndarray,
-    to_top: bool,
-):
-    nodes_count = len(unordered_nodes)
-    last_index = nodes_count - 1
-
-    nodes = np.zeros((nodes_count, unordered_nodes.shape[1]))
-    # initially encode all indices to negative values minus one
-    elements = -unordered_elements.copy() - 1
-
-    selected_index = 0 if to_top else last_index
-    other_index = last_index if to_top else 0
-    index_change = 1 if to_top else -1
-
-    # fill array with selected nodes from top and other from bottom (or vice versa)
-    for old_index in range(nodes_count):
-        if old_index in selected_indices:
-            new_index = selected_index
-            selected_index += index_change
-        else:
-            new_index = other_index
-            other_index -= index_change
-
-        nodes[new_index] = unordered_nodes[old_index]
-        # change encoded old index to new one
-        elements = np.where((elements == -old_index - 1), new_index, elements)
-
-    return nodes, elements, len(selected_indices)
+def move_nodes(order: np.ndarray, selected: np.ndarray, to_top: bool) -> np.ndarray:
+    """
+    Order of nodes after moving `selected` ones to the top (or bottom): moved nodes keep
+    their order, while the other ones are placed from the opposite end, so reversed.
+    """
+    is_selected = selected[order]
+    chosen, others = order[is_selected], order[~is_selected]
+    if to_top:
+        return np.concatenate((chosen, others[::-1]))
+    return np.concatenate((others, chosen[::-1]))
 
 
 class BoundariesFactory:
@@ -132,34 +111,29 @@ class BoundariesFactory:
     def identify_boundaries_and_reorder_nodes(
         unordered_nodes, unordered_elements, boundaries_description
     ) -> Tuple[np.ndarray, np.ndarray, Boundaries]:
-        is_contact = boundaries_description["contact"]
-        is_dirichlet = boundaries_description["dirichlet"]
         (
             initial_nodes,
             elements,
             boundary_nodes_count,
             contact_nodes_count,
             dirichlet_nodes_count,
+            boundary_surfaces,
+            boundary_internal_indices,
         ) = reorder_boundary_nodes(
             unordered_nodes,
             unordered_elements,
-            is_contact=is_contact,
-            is_dirichlet=is_dirichlet,
+            is_contact=boundaries_description["contact"],
+            is_dirichlet=boundaries_description["dirichlet"],
         )
 
         neumann_nodes_count = boundary_nodes_count - contact_nodes_count - dirichlet_nodes_count
 
-        (boundary_surfaces, boundary_internal_indices, *_) = get_boundary_surfaces(elements)
-
-        contact_boundary = apply_predicate_to_surfaces(boundary_surfaces, initial_nodes, is_contact)
-        dirichlet_boundary = apply_predicate_to_surfaces(
-            boundary_surfaces, initial_nodes, is_dirichlet
-        )
-        neumann_boundary = apply_predicate_to_surfaces(
-            boundary_surfaces,
-            initial_nodes,
-            lambda n: not is_contact(n) and not is_dirichlet(n),
-        )
+        surfaces_centers = np.mean(initial_nodes[boundary_surfaces], axis=1)
+        is_contact_surface = boundaries_description.mask("contact", surfaces_centers)
+        is_dirichlet_surface = boundaries_description.mask("dirichlet", surfaces_centers)
+        contact_boundary = boundary_surfaces[is_contact_surface]
+        dirichlet_boundary = boundary_surfaces[is_dirichlet_surface]
+        neumann_boundary = boundary_surfaces[~is_contact_surface & ~is_dirichlet_surface]
 
         contact_boundary = Boundary(
             surfaces=contact_boundary,
@@ -182,9 +156,9 @@ class BoundariesFactory:
         )
 
         other_boundaries = {}
-        for name, indicator in boundaries_description.indicators.items():
+        for name in boundaries_description.indicators:
             if name not in ("contact", "dirichlet"):
-                surfaces = apply_predicate_to_surfaces(boundary_surfaces, initial_nodes, indicator)
+                surfaces = boundary_surfaces[boundaries_description.mask(name, surfaces_centers)]
                 node_indices = np.unique(surfaces)
                 if len(node_indices):
                     other_boundaries[name] = Boundary(
@@ -1,86 +1,60 @@
+from typing import Optional
+
 import numba
 import numpy as np
+from scipy import sparse
 
-from conmech.helpers import nph
 from conmech.mesh import mesh_builders
 from conmech.mesh.boundaries_description import BoundariesDescription
 from conmech.mesh.boundaries_factory import BoundariesFactory
 from conmech.mesh.boundaries import Boundaries
+from conmech.mesh.mesh_cache import MeshCache
+from conmech.mesh.spatial_index import SpatialIndex
 from conmech.properties.mesh_description import MeshDescription
 from conmech.mesh.zoo.raw_mesh import RawMesh
 
 
-@numba.njit
-def get_edges_matrix(nodes_count: int, elements: np.ndarray):
-    edges_matrix = np.zeros((nodes_count, nodes_count), dtype=np.int32)
-    element_vertices_number = len(elements[0])
-    for element in elements:  # TODO: #65 prange?
-        for i in range(element_vertices_number):
-            for j in range(element_vertices_number):
-                if i != j:
-                    edges_matrix[element[i], element[j]] += 1.0
-    return edges_matrix
+def get_edges(elements: np.ndarray) -> np.ndarray:
+    """Unique edges (i, j), i < j, of all elements, in lexicographic order."""
+    nodes_count = int(elements.max()) + 1
+    local_i, local_j = np.triu_indices(elements.shape[1], k=1)
+    first, second = elements[:, local_i].ravel(), elements[:, local_j].ravel()
+    keys = np.unique(
+        np.minimum(first, second).astype(np.int64) * nodes_count + np.maximum(first, second)
+    )
+    return np.column_stack(np.divmod(keys, nodes_count))
 
 
-@numba.njit
-def get_edges_list_numba(edges_matrix):
-    nodes_count = edges_matrix.shape[0]
-    edges = np.array(
-        [
-            (i, j)
-            for i, j in np.ndindex((nodes_count, nodes_count))
-            if j > i and edges_matrix[i, j] > 0
-        ],
-        dtype=np.int64,
+def get_node_adjacency(edges: np.ndarray, nodes_count: int) -> sparse.csr_matrix:
+    """Symmetric node-to-node adjacency (without diagonal) of nodes connected by `edges`."""
+    rows = np.concatenate((edges[:, 0], edges[:, 1]))
+    columns = np.concatenate((edges[:, 1], edges[:, 0]))
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=bool), (rows, columns)), shape=(nodes_count, nodes_count)
     )
-    return edges
 
 
 @numba.njit
 def remove_unconnected_nodes_numba(nodes, elements):
-    nodes_count = len(nodes)
-    index = 0
-    while index < nodes_count:
-        if index in elements:
-            index += 1
-        else:
-            nodes = np.vstack((nodes[:index], nodes[index + 1 :]))
-            for i in range(elements.shape[0]):
-                for j in range(elements.shape[1]):
-                    if elements[i, j] > index:
-                        elements[i, j] -= 1
-            nodes_count -= 1
-    return nodes, elements
-
-
-@numba.njit
-def get_closest_to_axis_numba(nodes, variable):
-    min_error = 1.0
-    final_i, final_j = 0, 0
-    nodes_count = len(nodes)
-    for i in range(nodes_count):
-        for j in range(i + 1, nodes_count):
-            error = nph.euclidean_norm_numba(
-                np.delete(nodes[i], variable) - np.delete(nodes[j], variable)
-            )
-            if error < min_error:
-                min_error, final_i, final_j = error, i, j
-
-    correct_order = nodes[final_i, variable] < nodes[final_j, variable]
-    indices = (final_i, final_j) if correct_order else (final_j, final_i)
-    return np.array([min_error, indices[0], indices[1]])
-
-
-@numba.njit
-def get_base_seed_indices_numba(nodes):
-    dim = nodes.shape[1]
-    base_seed_indices = np.zeros((dim, 2), dtype=np.int64)
-    errors = np.zeros(dim)
-    for i in range(dim):
-        result = get_closest_to_axis_numba(nodes, i)
-        errors[i] = result[0]
-        base_seed_indices[i] = result[1:].astype(np.int64)
-    return base_seed_indices, int(np.argmin(errors))
+    used = np.zeros(len(nodes), dtype=np.bool_)
+    for element in elements:
+        for node in element:
+            used[node] = True
+    # remaining nodes keep their order, so each is moved by the number of removed ones before it
+    new_indices = np.cumsum(used) - 1
+    for i in range(elements.shape[0]):
+        for j in range(elements.shape[1]):
+            elements[i, j] = new_indices[elements[i, j]]
+    return nodes[np.flatnonzero(used)], elements
+
+
+def get_closest_to_axis(nodes, variable):
+    distance, i, j = SpatialIndex(np.delete(nodes, variable, axis=1)).closest_pair()
+    if distance >= 1.0:
+        distance, i, j = 1.0, 0, 0
+    correct_order = nodes[i, variable] < nodes[j, variable]
+    indices = (i, j) if correct_order else (j, i)
+    return np.array([distance, indices[0], indices[1]])
 
 
 class Mesh(RawMesh):
@@ -88,25 +62,47 @@ class Mesh(RawMesh):
         self,
         mesh_descr: MeshDescription,
         boundaries_description: BoundariesDescription,
+        cache: Optional[MeshCache] = None,
+        cache_key: Optional[str] = None,
     ):
+        """
+        :param cache: if given, mesh is loaded from it when already built, and stored otherwise
+        :param cache_key: identifies the mesh in `cache` instead of hash of boundary indicators
+        """
         self.edges: np.ndarray
+        self.node_adjacency: sparse.csr_matrix
 
         self.boundaries: Boundaries
+        self._spatial_index: Optional[SpatialIndex] = None
 
-        input_nodes, input_elements = mesh_builders.build_mesh(mesh_descr=mesh_descr)
-        super().__init__(input_nodes, input_elements)
-        unordered_nodes, unordered_elements = remove_unconnected_nodes_numba(
-            input_nodes, input_elements
-        )
-        (
-            self.nodes,
-            self.elements,
-            self.boundaries,
-        ) = BoundariesFactory.identify_boundaries_and_reorder_nodes(
-            unordered_nodes, unordered_elements, boundaries_description
-        )
-        edges_matrix = get_edges_matrix(nodes_count=len(self.nodes), elements=self.elements)
-        self.edges = get_edges_list_numba(edges_matrix)
+        key = None if cache is None else cache.key(mesh_descr, boundaries_description, cache_key)
+        cached = None if cache is None else cache.load(key)
+        if cached is not None:
+            self.nodes, self.elements, self.edges, self.boundaries = cached
+        else:
+            input_nodes, input_elements = mesh_builders.build_mesh(mesh_descr=mesh_descr)
+            unordered_nodes, unordered_elements = remove_unconnected_nodes_numba(
+                input_nodes, input_elements
+            )
+            (
+                self.nodes,
+                self.elements,
+                self.boundaries,
+            ) = BoundariesFactory.identify_boundaries_and_reorder_nodes(
+                unordered_nodes, unordered_elements, boundaries_description
+            )
+            self.edges = get_edges(self.elements)
+        super().__init__(self.nodes, self.elements)
+        self.node_adjacency = get_node_adjacency(self.edges, nodes_count=len(self.nodes))
+        if cache is not None and cached is None:
+            cache.store(key, self)
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """Index for geometric queries on (reference) nodes and elements, built on first use."""
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self.nodes, self.elements)
+        return self._spatial_index
 
     @property
     def dimension(self):
@@ -0,0 +1,219 @@
+"""
+Created at 18.10.2026
+"""
+import dataclasses
+import hashlib
+import os
+import sys
+import tempfile
+import types
+from typing import Callable, Dict, Optional, Set, Tuple
+
+import numpy as np
+
+from conmech.mesh.boundaries import Boundaries
+from conmech.mesh.boundaries_description import BoundariesDescription
+from conmech.mesh.boundary import Boundary
+
+FORMAT_VERSION = 2
+
+
+# values hashed by their representation, which does not depend on memory addresses
+PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes, np.generic)
+
+
+def _hash_value(digest, value, seen: Set[int]) -> None:
+    if isinstance(value, PLAIN_TYPES):
+        digest.update(f"{type(value).__name__}{value!r}".encode())
+    elif isinstance(value, np.ndarray):
+        digest.update(f"array{value.dtype}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, types.ModuleType):
+        # contents of imported modules are assumed not to change between runs
+        digest.update(f"module{value.__name__}".encode())
+    elif callable(value):
+        _hash_callable(digest, value, seen)
+    elif dataclasses.is_dataclass(value):
+        digest.update(type(value).__qualname__.encode())
+        for field in dataclasses.fields(value):
+            digest.update(field.name.encode())
+            _hash_value(digest, getattr(value, field.name), seen)
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _hash_value(digest, item, seen)
+    else:
+        raise ValueError(
+            f"Cannot hash {type(value).__name__} value of mesh description or boundary functions,"
+            " give an explicit cache key"
+        )
+
+
+def _hash_code(digest, code: types.CodeType) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _hash_callable(digest, function: Callable, seen: Set[int]) -> None:
+    """
+    Hashes code of `function` (or of the Python function of a numba dispatcher) with values
+    it closes over, its defaults and global values it refers to, including other functions
+    (recursively) and modules (by name).
+    """
+    function = getattr(function, "py_func", function)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        if not isinstance(function, (type, types.BuiltinFunctionType, np.ufunc)):
+            raise ValueError(
+                f"Cannot hash callable {type(function).__name__}, give an explicit cache key"
+            )
+        digest.update(f"{function.__module__}.{function.__qualname__}".encode())
+        return
+    if id(function) in seen:
+        # recursive reference, hashed already
+        digest.update(function.__qualname__.encode())
+        return
+    seen.add(id(function))
+    _hash_code(digest, code)
+    for cell in function.__closure__ or ():
+        _hash_value(digest, cell.cell_contents, seen)
+    _hash_value(digest, function.__defaults__, seen)
+    for name in code.co_names:
+        # names of attributes are among `co_names` too, but not among globals
+        if name in function.__globals__:
+            digest.update(name.encode())
+            _hash_value(digest, function.__globals__[name], seen)
+
+
+def _hash_file(digest, path: str) -> None:
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(2**20), b""):
+            digest.update(block)
+
+
+class MeshCache:
+    """
+    Content-addressed on-disk cache of built meshes: reordered nodes, elements, edges and
+    boundaries are stored in one `.npz` file per key in directory `path`.
+
+    Keys hash fields of the mesh description (and content of an imported mesh file) with code
+    of boundary indicators and conditions, with functions they call. Values that cannot be
+    hashed (e.g. objects they call) raise ValueError, an explicit `key` should be given then.
+    Least recently used entries are removed once files exceed `max_size` bytes.
+    """
+
+    def __init__(self, path: str, max_size: int = 2**30):
+        self.path: str = path
+        self.max_size: int = max_size
+        os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def key(
+        mesh_descr,
+        boundaries_description: BoundariesDescription,
+        key: Optional[str] = None,
+    ) -> str:
+        digest = hashlib.sha256(f"{FORMAT_VERSION}{sys.version_info[:2]}".encode())
+        _hash_value(digest, mesh_descr, set())
+        path = getattr(mesh_descr, "path", None)
+        if isinstance(path, str) and os.path.isfile(path):
+            _hash_file(digest, path)
+        if key is not None:
+            digest.update(f"key{key}".encode())
+        else:
+            for name, indicator in boundaries_description.indicators.items():
+                digest.update(name.encode())
+                _hash_callable(digest, indicator, set())
+            for name, condition in boundaries_description.conditions.items():
+                digest.update(name.encode())
+                _hash_callable(digest, condition, set())
+        return digest.hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.npz")
+
+    def load(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, Boundaries]]:
+        """Nodes, elements, edges and boundaries stored under `key`, or None if there are none."""
+        file_path = self._file(key)
+        if not os.path.isfile(file_path):
+            return None
+        with np.load(file_path) as data:
+            arrays = dict(data)
+        # mark as recently used
+        os.utime(file_path)
+
+        boundaries = {}
+        for name in arrays["boundary_names"]:
+            prefix = f"boundary.{name}."
+            if prefix + "node_slice" in arrays:
+                node_indices = slice(*arrays[prefix + "node_slice"].tolist())
+            else:
+                node_indices = arrays[prefix + "node_indices"]
+            boundaries[str(name)] = Boundary(
+                surfaces=arrays[prefix + "surfaces"],
+                node_indices=node_indices,
+                node_count=int(arrays[prefix + "node_count"]),
+                node_condition=arrays.get(prefix + "node_condition"),
+            )
+        nodes = arrays["nodes"]
+        return (
+            nodes,
+            arrays["elements"],
+            arrays["edges"],
+            Boundaries(
+                nodes=nodes,
+                boundary_internal_indices=arrays["boundary_internal_indices"],
+                **boundaries,
+            ),
+        )
+
+    def store(self, key: str, mesh) -> None:
+        arrays: Dict[str, np.ndarray] = {
+            "nodes": mesh.nodes,
+            "elements": mesh.elements,
+            "edges": mesh.edges,
+            "boundary_internal_indices": mesh.boundaries.boundary_internal_indices,
+            "boundary_names": np.array(list(mesh.boundaries.boundaries)),
+        }
+        for name, boundary in mesh.boundaries.boundaries.items():
+            prefix = f"boundary.{name}."
+            arrays[prefix + "surfaces"] = boundary.surfaces
+            if isinstance(boundary.node_indices, slice):
+                arrays[prefix + "node_slice"] = np.array(
+                    [boundary.node_indices.start, boundary.node_indices.stop]
+                )
+            else:
+                arrays[prefix + "node_indices"] = boundary.node_indices
+            arrays[prefix + "node_count"] = np.array(boundary.node_count)
+            if boundary.node_condition is not None:
+                arrays[prefix + "node_condition"] = np.asarray(boundary.node_condition)
+
+        # file is replaced at once, so that a concurrent reader never sees it partially written
+        with tempfile.NamedTemporaryFile(dir=self.path, suffix=".tmp", delete=False) as file:
+            try:
+                np.savez(file, **arrays)
+            except BaseException:
+                file.close()
+                os.remove(file.name)
+                raise
+        os.replace(file.name, self._file(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used entries until the cache fits in `max_size` bytes."""
+        entries = []
+        for file_name in os.listdir(self.path):
+            if file_name.endswith(".npz"):
+                stat = os.stat(os.path.join(self.path, file_name))
+                entries.append((stat.st_mtime, stat.st_size, file_name))
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, file_name in sorted(entries):
+            if size <= self.max_size:
+                break
+            os.remove(os.path.join(self.path, file_name))
+            size -= file_size
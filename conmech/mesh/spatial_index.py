@@ -0,0 +1,99 @@
+"""
+Created at 18.10.2026
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import spatial
+
+from conmech.mesh.utils import get_elements_geometry
+
+
+class SpatialIndex:
+    """
+    Geometric queries on nodes (and elements) of a mesh, backed by KD-trees.
+
+    Trees and element geometry are built lazily, on the first query that needs them,
+    so the index is cheap to attach to every mesh.
+    """
+
+    def __init__(self, nodes: np.ndarray, elements: Optional[np.ndarray] = None):
+        self.nodes: np.ndarray = nodes
+        self.elements: Optional[np.ndarray] = elements
+        self._nodes_tree: Optional[spatial.cKDTree] = None
+        self._elements_tree: Optional[spatial.cKDTree] = None
+        self._barycentric_coefficients: Optional[np.ndarray] = None
+
+    @property
+    def nodes_tree(self) -> spatial.cKDTree:
+        if self._nodes_tree is None:
+            self._nodes_tree = spatial.cKDTree(self.nodes)
+        return self._nodes_tree
+
+    @property
+    def elements_tree(self) -> spatial.cKDTree:
+        """Tree of element centroids."""
+        if self._elements_tree is None:
+            if self.elements is None:
+                raise ValueError("Spatial index built without elements")
+            self._elements_tree = spatial.cKDTree(self.nodes[self.elements].mean(axis=1))
+        return self._elements_tree
+
+    @property
+    def barycentric_coefficients(self) -> np.ndarray:
+        if self._barycentric_coefficients is None:
+            self._barycentric_coefficients, _, _ = get_elements_geometry(self.elements, self.nodes)
+        return self._barycentric_coefficients
+
+    def nearest_node(self, points: np.ndarray, tolerance: float = np.inf) -> np.ndarray:
+        """
+        Indices of nodes closest to `points` (one index for a single point).
+        Raises ValueError if any of them is further than `tolerance`.
+        """
+        distances, indices = self.nodes_tree.query(points)
+        if np.any(distances > tolerance):
+            raise ValueError(f"No node within {tolerance} of some of the points")
+        return indices
+
+    def nodes_within(self, point: np.ndarray, radius: float) -> np.ndarray:
+        """Sorted indices of nodes within `radius` of `point`."""
+        return np.sort(self.nodes_tree.query_ball_point(point, radius))
+
+    def closest_pair(self, tie_tolerance: float = 1e-12) -> Tuple[float, int, int]:
+        """
+        Distance and indices (i < j) of the two distinct nodes closest to each other.
+        Of pairs equally close (up to relative `tie_tolerance`), the first in lexicographic
+        order of (i, j) is returned.
+        """
+        distances, _ = self.nodes_tree.query(self.nodes, k=2)
+        distance = distances[:, 1].min()
+        pairs = self.nodes_tree.query_pairs(distance * (1 + tie_tolerance), output_type="ndarray")
+        i, j = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))[0]]
+        return float(np.linalg.norm(self.nodes[i] - self.nodes[j])), int(i), int(j)
+
+    def locate(
+        self, points: np.ndarray, candidates_count: int = 8
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Elements containing `points` and barycentric coordinates of points in them.
+
+        Each point is located in the element, among those with the closest centroids, that it
+        lies the deepest inside. For points outside of the mesh this is the nearby element
+        they are the least outside of, with some of the coordinates negative.
+        """
+        candidates_count = min(candidates_count, len(self.elements))
+        _, candidates = self.elements_tree.query(points, k=candidates_count)
+        candidates = candidates.reshape(len(points), candidates_count)
+
+        affine_points = np.hstack((np.ones((len(points), 1)), points))
+        weights = np.einsum(
+            "pcij,pj->pci", self.barycentric_coefficients[candidates], affine_points
+        )
+        best = np.argmax(weights.min(axis=-1), axis=1)
+        points_indices = np.arange(len(points))
+        return candidates[points_indices, best], weights[points_indices, best]
+
+    def contains(self, points: np.ndarray, tolerance: float = 1e-10) -> np.ndarray:
+        """Whether `points` lie inside of (or on the boundary of) any element."""
+        _, weights = self.locate(points)
+        return weights.min(axis=1) >= -tolerance
@@ -16,6 +16,9 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301,
 # USA.
+import math
+from typing import Tuple
+
 import numpy as np
 
 
@@ -29,3 +32,27 @@ def interpolate_nodes(scaled_nodes, corner_vectors):
             coordinate_i * corner_vectors[i] + (1 - coordinate_i) * corner_vectors[i + input_dim]
         ) / input_dim
     return values
+
+
+def get_elements_geometry(
+    elements: np.ndarray, nodes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes, in one batched pass over all elements, the data the element integrals are built from.
+
+    barycentric_coefficients[e, i] are coefficients of the (linear) shape function
+    phi_i = c_0 + c_1 * x + c_2 * y (+ c_3 * z) of node i of element e,
+    gradients[e, i] is its (constant) gradient and volumes[e] is the volume of element e.
+    """
+    elements_nodes = nodes[elements]
+    elements_count, element_size, dimension = elements_nodes.shape
+    # rows (1, x_i) of the affine map; its inverse holds coefficients of phi_i in the columns
+    affine_matrices = np.concatenate(
+        (np.ones((elements_count, element_size, 1)), elements_nodes), axis=-1
+    )
+    barycentric_coefficients = np.ascontiguousarray(
+        np.linalg.inv(affine_matrices).transpose(0, 2, 1)
+    )
+    gradients = np.ascontiguousarray(barycentric_coefficients[:, :, 1:])
+    volumes = np.abs(np.linalg.det(affine_matrices)) / math.factorial(dimension)
+    return barycentric_coefficients, gradients, volumes
@@ -1,7 +1,7 @@
 import numba
 import numpy as np
 
-from conmech.helpers import nph
+from conmech.mesh.spatial_index import SpatialIndex
 from conmech.mesh.zoo.raw_mesh import RawMesh
 from conmech.properties.mesh_description import CrossMeshDescription
 
@@ -30,40 +30,34 @@ class CrossMesh(RawMesh):
         CrossMesh._set_cross_nodes_ordered_numba(
             nodes, size_x, size_y, edge_len_x, edge_len_y, min_
         )
-        CrossMesh._set_cross_elements_numba(
-            nodes, elements, size_x, size_y, edge_len_x, edge_len_y, min_
-        )
+        CrossMesh._set_cross_elements(nodes, elements, size_x, size_y, edge_len_x, edge_len_y, min_)
         return nodes, elements
 
     @staticmethod
-    @numba.njit
-    def _set_cross_elements_numba(
+    def _set_cross_elements(
         nodes, elements, size_x, size_y, edge_len_x, edge_len_y, left_bottom_node
     ):
-        index = 0
-        for i in range(size_x):
-            for j in range(size_y):
-                left_bottom = np.array((i * edge_len_x, j * edge_len_y)) + left_bottom_node
-
-                lb = nph.get_node_index_numba(left_bottom, nodes)
-                rb = nph.get_node_index_numba(left_bottom + np.array((edge_len_x, 0.0)), nodes)
-                c = nph.get_node_index_numba(
-                    left_bottom + np.array((0.5 * edge_len_x, 0.5 * edge_len_y)),
-                    nodes,
-                )
-                lt = nph.get_node_index_numba(left_bottom + np.array((0.0, edge_len_y)), nodes)
-                rt = nph.get_node_index_numba(
-                    left_bottom + np.array((edge_len_x, edge_len_y)), nodes
-                )
-
-                elements[index] = np.array((lb, rb, c))
-                index += 1
-                elements[index] = np.array((rb, rt, c))
-                index += 1
-                elements[index] = np.array((rt, lt, c))
-                index += 1
-                elements[index] = np.array((lt, lb, c))
-                index += 1
+        i, j = np.meshgrid(np.arange(size_x), np.arange(size_y), indexing="ij")
+        left_bottom = np.column_stack((i.ravel() * edge_len_x, j.ravel() * edge_len_y))
+        left_bottom += left_bottom_node
+
+        index = SpatialIndex(nodes)
+        lb, rb, c, lt, rt = (
+            index.nearest_node(left_bottom + offset, tolerance=0.0001)
+            for offset in (
+                (0.0, 0.0),
+                (edge_len_x, 0.0),
+                (0.5 * edge_len_x, 0.5 * edge_len_y),
+                (0.0, edge_len_y),
+                (edge_len_x, edge_len_y),
+            )
+        )
+        # four elements of each square, one after another
+        elements[:] = (
+            np.array(((lb, rb, c), (rb, rt, c), (rt, lt, c), (lt, lb, c)))
+            .transpose(2, 0, 1)
+            .reshape(-1, 3)
+        )
 
     @staticmethod
     @numba.njit
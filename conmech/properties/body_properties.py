@@ -26,6 +26,26 @@ class RelaxationBodyProperties:
     relaxation: Callable[[float], np.ndarray]
 
 
+@dataclass
+class PronyRelaxation:
+    """
+    Relaxation kernel sum_k coefficients[k] * exp(-time / relaxation_times[k]).
+
+    Bodies with such kernel have relaxation term in the form of hereditary integral,
+    updated recursively step by step (see `QuasistaticRelaxationStatement`).
+    Infinite relaxation time gives constant term.
+    """
+
+    coefficients: np.ndarray  # terms x dim x dim x dim
+    relaxation_times: np.ndarray  # terms
+
+    def decay(self, time: float) -> np.ndarray:
+        return np.exp(-time / np.asarray(self.relaxation_times, dtype=float))
+
+    def __call__(self, time: float = 0) -> np.ndarray:
+        return np.tensordot(self.decay(time), np.asarray(self.coefficients), axes=1)
+
+
 @dataclass
 class PiezoelectricBodyProperties:
     piezoelectricity: np.ndarray
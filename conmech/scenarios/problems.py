@@ -7,6 +7,7 @@ from typing import Optional, Callable
 
 import numpy as np
 
+from conmech.helpers.pointwise import vectorized
 from conmech.mesh.boundaries_description import BoundariesDescription
 from conmech.properties.mesh_description import MeshDescription
 
@@ -14,6 +15,11 @@ from conmech.properties.mesh_description import MeshDescription
 
 
 class ContactLaw:
+    # whether subderivatives are derivatives of potentials (the tangential one of
+    # `potential_tangential_direction`, if defined), so that they may differentiate cost functionals
+    # analytically; otherwise potentials are differentiated by central differences
+    subderivatives_of_potentials: bool = False
+
     @staticmethod
     def potential_normal_direction(u_nu: float) -> float:
         raise NotImplementedError()
@@ -37,6 +43,10 @@ class Problem(ABC):
     # pylint: disable=unused-argument
     mesh_descr: MeshDescription
     boundaries: BoundariesDescription
+    # optional MeshCache the mesh is loaded from (and stored in), with key identifying it there
+    # instead of hash of boundaries indicators
+    mesh_cache = None
+    mesh_cache_key = None
 
     @staticmethod
     def inner_forces(
@@ -75,12 +85,14 @@ class PoissonProblem(StaticProblem, ABC):  # TODO: rename
         return np.zeros_like(len(x))
 
     @staticmethod
+    @vectorized
     def internal_temperature(x: np.ndarray, t: Optional[float] = None) -> np.ndarray:
-        return np.zeros_like(len(x))
+        return np.zeros((len(x), 1))
 
     @staticmethod
+    @vectorized
     def outer_temperature(x: np.ndarray, t: Optional[float] = None) -> np.ndarray:
-        return np.zeros_like(len(x))
+        return np.zeros((len(x), 1))
 
 
 @dataclass
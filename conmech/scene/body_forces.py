@@ -1,12 +1,14 @@
 import dataclasses
 import enum
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 from ctypes import ArgumentError
 
 import numpy as np
 import numba
+from scipy import sparse
 
 from conmech.helpers import nph
+from conmech.helpers.pointwise import evaluate_pointwise
 
 
 @numba.njit
@@ -41,43 +43,98 @@ class Field(enum.Enum):
     ELECTRIC = "ELECTRIC"
 
 
+def time_invariant(source: Callable) -> Callable:
+    """
+    Marks source as independent of time, so that its integral is computed only once.
+    """
+    source.time_factor = None
+    return source
+
+
+def separable(
+    spatial_source: Callable[[np.ndarray], np.ndarray], time_factor: Callable[[float], float]
+) -> Callable:
+    """
+    Source `spatial_source(x) * time_factor(t)`; its integral is computed once and then
+    only scaled by `time_factor`. Spatial source may be marked as `vectorized`.
+    """
+
+    def source(x, t=None):
+        return spatial_source(x) * time_factor(t)
+
+    def spatial(x, t=None):  # pylint: disable=unused-argument
+        return spatial_source(x)
+
+    source.vectorized = spatial.vectorized = getattr(spatial_source, "vectorized", False)
+    source.spatial_source = spatial
+    source.time_factor = time_factor
+    return source
+
+
 @dataclasses.dataclass()
 class FieldSource:
     source: Optional[Callable[[np.ndarray, float], np.ndarray]] = None
     cache: Optional[np.ndarray] = None
     timestamp: Optional[float] = None
+    # (source, quadrature, integral of source) of time invariant or separable source
+    integrated: Optional[Tuple] = None
 
     def node_source(self, nodes, time: float):
-        # pylint: disable=not-callable
-        if time != self.timestamp:
-            self.cache = np.array([self.source(nodes[i], time) for i in range(len(nodes))])
+        if time != self.timestamp or self.cache is None:
+            self.cache = evaluate_pointwise(self.source, nodes, time)
             self.timestamp = time
         return self.cache
 
+    def integrate(self, quadrature: sparse.spmatrix, nodes: np.ndarray, time: float) -> np.ndarray:
+        source = self.source
+        if not hasattr(source, "time_factor"):
+            return quadrature @ self.node_source(nodes, time)
+
+        if (
+            self.integrated is None
+            or self.integrated[0] is not source
+            or self.integrated[1] is not quadrature
+        ):
+            spatial_source = getattr(source, "spatial_source", source)
+            values = evaluate_pointwise(spatial_source, nodes, time)
+            self.integrated = source, quadrature, quadrature @ values
+        if source.time_factor is None:
+            return self.integrated[2]
+        return source.time_factor(time) * self.integrated[2]
+
 
 class BodyForces:
     def __init__(self, body: "Body"):
         self.body = body
         self.inner = FieldSource()
         self.outer = FieldSource()
+        # mesh and lumped quadrature of its Neumann boundary
+        self._boundary_quadrature: Optional[Tuple] = None
 
     def clear(self):
-        self.inner.cache = None
-        self.outer.cache = None
+        for field_source in (self.inner, self.outer):
+            field_source.cache = None
+            field_source.integrated = None
+
+    @property
+    def boundary_quadrature(self) -> sparse.csr_matrix:
+        """Diagonal matrix of surfaces of Neumann boundary per node, computed once per mesh."""
+        mesh = self.body.mesh
+        if self._boundary_quadrature is None or self._boundary_quadrature[0] is not mesh:
+            neumann_surfaces = get_surface_per_boundary_node_numba(
+                boundary_surfaces=mesh.neumann_boundary,
+                considered_nodes_count=mesh.nodes_count,
+                moved_nodes=mesh.nodes,
+            )
+            self._boundary_quadrature = mesh, sparse.diags(neumann_surfaces.ravel(), format="csr")
+        return self._boundary_quadrature[1]
 
     def get_integrated_inner_forces(self, time: float):
-        inner_forces = self.inner.node_source(self.body.mesh.nodes, time)
         # TODO: should be only on boundary!
-        return self.body.dynamics.volume_at_nodes @ inner_forces
+        return self.inner.integrate(self.body.dynamics.volume_at_nodes, self.body.mesh.nodes, time)
 
     def get_integrated_outer_forces(self, time: float):
-        neumann_surfaces = get_surface_per_boundary_node_numba(
-            boundary_surfaces=self.body.mesh.neumann_boundary,
-            considered_nodes_count=self.body.mesh.nodes_count,
-            moved_nodes=self.body.mesh.nodes,
-        )
-        outer_forces = self.outer.node_source(self.body.mesh.nodes, time)
-        return neumann_surfaces * outer_forces
+        return self.outer.integrate(self.boundary_quadrature, self.body.mesh.nodes, time)
 
     def get_integrated_field_sources_column(self, time: float):
         integrated_inner_forces = self.get_integrated_inner_forces(time)
@@ -45,9 +45,12 @@ from conmech.scenarios.problems import (
 )
 from conmech.solvers import SchurComplementOptimization
 from conmech.solvers._solvers import SolversRegistry
+from conmech.solvers.linear_solver import get_linear_solver
+from conmech.solvers.multigrid import get_prolongations
 from conmech.solvers.solver import Solver
 from conmech.solvers.validator import Validator
 from conmech.state.state import State, TemperatureState, PiezoelectricState
+from conmech.state.trajectory import Trajectory
 
 
 class Body:
@@ -74,6 +77,8 @@ class ProblemSolver:
         mesh = Mesh(
             mesh_descr=problem.mesh_descr,
             boundaries_description=problem.boundaries,
+            cache=problem.mesh_cache,
+            cache_key=problem.mesh_cache_key,
         )
         self.body = Body(body_properties, mesh)
         self.schedule = None
@@ -92,12 +97,19 @@ class ProblemSolver:
         self.step_solver: Optional[Solver] = None
         self.second_step_solver: Optional[Solver] = None
         self.validator: Optional[Validator] = None
+        self.linear_solver_method: str = "direct"
+        self.linear_solver_options: dict = {}
 
-        self.penetration = []
+        # (time, penetration) of steps done, in a buffer allocated for steps to do
+        self._penetration: np.ndarray = np.empty((0, 2))
 
         self.done = 0
         self.to_do = 1
 
+    @property
+    def penetration(self) -> np.ndarray:
+        return self._penetration[: self.done]
+
     @property
     def solving_method(self) -> str:
         return str(self.step_solver)
@@ -111,6 +123,24 @@ class ProblemSolver:
         self.__set_step_solver(self.solving_method)
         self.__set_second_step_solver(self.solving_method)
 
+    def set_linear_solver(self, method: str = "direct", **options) -> None:
+        """Selects backend of linear systems solved by step solvers.
+
+        :param method: 'direct', 'cg', 'minres' or 'gmres'
+        :param options: passed to `KrylovLinearSolver`, e.g. preconditioner='ilu';
+            with preconditioner='multigrid' option `levels` (default 3) is the number of meshes
+            in the hierarchy built from the problem mesh description
+        """
+        if options.get("preconditioner") == "multigrid" and "prolongations" not in options:
+            options["prolongations"] = get_prolongations(
+                self.problem.mesh_descr, self.body.mesh.nodes, levels=options.pop("levels", 3)
+            )
+        self.linear_solver_method = method
+        self.linear_solver_options = options
+        for solver in (self.step_solver, self.second_step_solver):
+            if solver is not None:
+                solver.linear_solver = get_linear_solver(method, **options)
+
     def __set_step_solver(self, value):
         solver_class: Type[Solver] = SolversRegistry.get_by_name(
             solver_name=value, problem=self.problem
@@ -150,6 +180,9 @@ class ProblemSolver:
             contact_law,
             friction_bound,
         )
+        self.step_solver.linear_solver = get_linear_solver(
+            self.linear_solver_method, **self.linear_solver_options
+        )
         self.validator = Validator(self.step_solver)
 
     def __set_second_step_solver(self, value):
@@ -182,6 +215,10 @@ class ProblemSolver:
             )
         else:
             self.second_step_solver = None
+            return
+        self.second_step_solver.linear_solver = get_linear_solver(
+            self.linear_solver_method, **self.linear_solver_options
+        )
 
     def solve(self, **kwargs):
         raise NotImplementedError()
@@ -192,6 +229,10 @@ class ProblemSolver:
         :param n_steps: number of steps
         :param verbose: show prints
         """
+        if len(self._penetration) < self.done + n_steps:
+            penetration = np.empty((max(self.to_do, self.done + n_steps), 2))
+            penetration[: self.done] = self.penetration
+            self._penetration = penetration
         for _ in range(n_steps):
             self.step_solver.current_time += self.step_solver.time_step
 
@@ -219,7 +260,7 @@ class ProblemSolver:
             else:
                 raise ValueError(f"Unknown coordinates: {self.coordinates}")
 
-            self.penetration.append((state.time, state.penetration))
+            self._penetration[self.done] = state.time, state.penetration
             self.step_solver.iterate()
             self.done += 1
             print(f"{self.done / self.to_do * 100:.2f}%", end="\r")
@@ -351,7 +392,7 @@ class StaticSolver(ProblemSolver):
         """Solves general Contact Mechanics problem.
 
         :param problem:
-        :param solving_method: 'schur', 'optimization', 'direct'
+        :param solving_method: 'schur', 'optimization', 'direct', 'semismooth newton'
         """
         body_prop = ElasticProperties(
             mass_density=1.0,
@@ -419,19 +460,21 @@ class QuasistaticRelaxation(ProblemSolver):
         initial_absement: Callable,
         initial_displacement: Callable,
         output_step: Optional[iter] = None,
+        trajectory_path: Optional[str] = None,
         verbose: bool = False,
         **kwargs,
-    ) -> List[State]:
+    ) -> Trajectory:
         """
         :param n_steps: number of time-step in simulation
         :param output_step: from which time-step we want to get copy of State,
                             default (n_steps-1,)
                             example: for Setup.time-step = 2, n_steps = 10,  output_step = (2, 6, 9)
                                      we get 3 shared copy of State for time-steps 4, 12 and 18
+        :param trajectory_path: directory of memory-mapped arrays of the trajectory, if any
         :param initial_absement: for the solver
         :param initial_displacement: for the solver
         :param verbose: show prints
-        :return: state
+        :return: states at output steps
         """
         output_step = (0, *output_step) if output_step else (0, n_steps)  # 0 for diff
 
@@ -445,12 +488,12 @@ class QuasistaticRelaxation(ProblemSolver):
         self.step_solver.u_vector[:] = state.displacement.T.ravel().copy()
 
         output_step = np.diff(output_step)
-        results = []
+        results = Trajectory(state, len(output_step), path=trajectory_path)
         self.done = 0
         self.to_do = n_steps
         for n in output_step:
             self.run(state, n_steps=n, verbose=verbose, **kwargs)
-            results.append(state.copy())
+            results.append(state)
 
         return results
 
@@ -460,7 +503,7 @@ class TimeDependentSolver(ProblemSolver):
         """Solves general Contact Mechanics problem.
 
         :param problem:
-        :param solving_method: 'schur', 'optimization', 'direct'
+        :param solving_method: 'schur', 'optimization', 'direct', 'semismooth newton'
         """
         body_prop = ViscoelasticProperties(
             mass_density=1.0,
@@ -485,19 +528,21 @@ class TimeDependentSolver(ProblemSolver):
         initial_displacement: Callable,
         initial_velocity: Callable,
         output_step: Optional[iter] = None,
+        trajectory_path: Optional[str] = None,
         verbose: bool = False,
         **kwargs,
-    ) -> List[State]:
+    ) -> Trajectory:
         """
         :param n_steps: number of time-step in simulation
         :param output_step: from which time-step we want to get copy of State,
                             default (n_steps-1,)
                             example: for Setup.time-step = 2, n_steps = 10,  output_step = (2, 6, 9)
                                      we get 3 shared copy of State for time-steps 4, 12 and 18
+        :param trajectory_path: directory of memory-mapped arrays of the trajectory, if any
         :param initial_displacement: for the solver
         :param initial_velocity: for the solver
         :param verbose: show prints
-        :return: state
+        :return: states at output steps
         """
         output_step = (0, *output_step) if output_step else (0, n_steps)  # 0 for diff
 
@@ -511,12 +556,12 @@ class TimeDependentSolver(ProblemSolver):
         self.step_solver.v_vector[:] = state.velocity.T.ravel().copy()
 
         output_step = np.diff(output_step)
-        results = []
+        results = Trajectory(state, len(output_step), path=trajectory_path)
         self.done = 0
         self.to_do = n_steps
         for n in output_step:
             self.run(state, n_steps=n, verbose=verbose, **kwargs)
-            results.append(state.copy())
+            results.append(state)
 
         return results
 
@@ -648,18 +693,20 @@ class PiezoelectricTimeDependentSolver(ProblemSolver):
         initial_velocity: Callable,
         initial_electric_potential: Callable,
         output_step: Optional[iter] = None,
+        trajectory_path: Optional[str] = None,
         **kwargs,
-    ) -> List[PiezoelectricState]:
+    ) -> Trajectory:
         """
         :param n_steps: number of time-step in simulation
         :param output_step: from which time-step we want to get copy of State,
                             default (n_steps-1,)
                             example: for Setup.time-step = 2, n_steps = 10,  output_step = (2, 6, 9)
                                      we get 3 shared copy of State for time-steps 4, 12 and 18
+        :param trajectory_path: directory of memory-mapped arrays of the trajectory, if any
         :param initial_displacement: for the solver
         :param initial_velocity: for the solver
         :param initial_electric_potential: for the solver
-        :return: state
+        :return: states at output steps
         """
         output_step = (0, *output_step) if output_step else (0, n_steps)  # 0 for diff
 
@@ -684,7 +731,7 @@ class PiezoelectricTimeDependentSolver(ProblemSolver):
         self.second_step_solver.p_vector[:] = state.electric_potential.T.ravel().copy()
 
         output_step = np.diff(output_step)
-        results = []
+        results = Trajectory(state, len(output_step), path=trajectory_path)
         done = 0
         for n in output_step:
             for _ in range(n):
@@ -704,6 +751,6 @@ class PiezoelectricTimeDependentSolver(ProblemSolver):
                     state.set_electric_potential(solution_t)
                 else:
                     raise ValueError(f"Unknown coordinates: {self.coordinates}")
-            results.append(state.copy())
+            results.append(state)
 
         return results
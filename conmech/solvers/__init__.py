@@ -9,3 +9,4 @@ from conmech.solvers.solver import Solver
 from conmech.solvers.direct import Direct
 from conmech.solvers.optimization.global_optimization import GlobalOptimization
 from conmech.solvers.optimization.schur_complement import SchurComplementOptimization
+from conmech.solvers.semismooth_newton import SemismoothNewton
@@ -6,7 +6,7 @@ from typing import Optional, Callable
 import numpy as np
 import scipy.optimize
 
-from conmech.dynamics.statement import Statement
+from conmech.dynamics.statement import Statement, Variables
 from conmech.scenarios.problems import ContactLaw
 from conmech.scene.body_forces import BodyForces
 from conmech.solvers._solvers import SolversRegistry
@@ -14,7 +14,6 @@ from conmech.solvers.solver import Solver
 from conmech.solvers.solver_methods import make_equation
 
 
-@SolversRegistry.register("static", "direct")
 class Direct(Solver):
     def __init__(
         self,
@@ -57,13 +56,67 @@ class Direct(Solver):
                 self.equation,
                 initial_guess,
                 args=(
-                    self.body.mesh.nodes,
-                    self.body.mesh.contact_boundary,
-                    self.body.mesh.boundaries.contact_normals,
+                    self.body.mesh.boundaries.contact_geometry,
                     self.node_relations,
                     self.node_forces,
                 ),
             )
         else:
-            result = np.linalg.solve(self.node_relations, self.node_forces)
+            # constrained degrees of freedom are known, only free ones are solved for
+            free = self.statement.free_dofs
+            result = self.statement.expand(
+                self.linear_solver.solve(
+                    self.statement.reduced_left_hand_side,
+                    np.asarray(self.node_forces).ravel()[free],
+                    np.asarray(initial_guess).ravel()[free],
+                    version=self.statement.left_hand_side_version,
+                    dofs=~self.statement.dirichlet_partition[0],
+                )
+            )
         return np.asarray(result)
+
+
+@SolversRegistry.register("static", "direct")
+class StaticDirect(Direct):
+    pass
+
+
+@SolversRegistry.register("quasistatic", "direct")
+class QuasistaticDirect(Direct):
+    def iterate(self):
+        self.statement.update(
+            Variables(
+                displacement=self.u_vector,
+                electric_potential=self.p_vector,
+                time_step=self.time_step,
+                time=self.current_time,
+            )
+        )
+
+
+@SolversRegistry.register("quasistatic relaxation", "direct")
+class QuasistaticRelaxedDirect(Direct):
+    def iterate(self):
+        self.statement.update(
+            Variables(
+                absement=self.b_vector,
+                displacement=self.u_vector,
+                time_step=self.time_step,
+                time=self.current_time,
+            )
+        )
+
+
+@SolversRegistry.register("dynamic", "direct")
+class DynamicDirect(Direct):
+    def iterate(self):
+        self.statement.update(
+            Variables(
+                displacement=self.u_vector,
+                velocity=self.v_vector,
+                temperature=self.t_vector,
+                electric_potential=self.p_vector,
+                time_step=self.time_step,
+                time=self.current_time,
+            )
+        )
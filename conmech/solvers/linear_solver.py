@@ -0,0 +1,211 @@
+"""
+Created at 18.10.2026
+"""
+from typing import Callable, List, Optional
+
+import numpy as np
+import scipy.linalg
+from scipy import sparse
+from scipy.sparse import linalg
+
+from conmech.solvers.multigrid import MultigridPreconditioner
+
+
+def _is_same_matrix(first, second) -> bool:
+    if first.shape != second.shape or sparse.issparse(first) != sparse.issparse(second):
+        return False
+    if sparse.issparse(first):
+        return (first != second).nnz == 0
+    return np.array_equal(first, second)
+
+
+class LinearSolver:
+    """
+    Backend solving `matrix @ x = rhs` for step solvers.
+
+    Work depending only on the matrix (factorisation, preconditioner) is kept while solved
+    matrices do not change. Statistics of the last solve are exposed by `iterations`
+    and `residual` (relative residual norm).
+    """
+
+    def __init__(self):
+        self.iterations: int = 0
+        self.residual: float = 0.0
+        self._matrix = None
+        self._version: Optional[int] = None
+
+    def __str__(self) -> str:
+        raise NotImplementedError()
+
+    def solve(
+        self,
+        matrix,
+        rhs: np.ndarray,
+        initial_guess: Optional[np.ndarray] = None,
+        version: Optional[int] = None,
+        dofs: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        :param version: version of `matrix` (e.g. `Statement.left_hand_side_version`);
+            while it does not change, the matrix is not compared with the previous one
+        :param dofs: mask of DOFs of the whole system that `matrix` is restricted to
+            (e.g. of DOFs not constrained by Dirichlet conditions), None if it is not
+        """
+        if version is None or version != self._version:
+            if self._matrix is None or not _is_same_matrix(self._matrix, matrix):
+                self._prepare(matrix, dofs)
+                # a copy, as statements may modify their matrices in place
+                self._matrix = matrix.copy()
+        self._version = version
+        return self._solve_impl(matrix, np.asarray(rhs).ravel(), initial_guess)
+
+    def _prepare(self, matrix, dofs: Optional[np.ndarray]) -> None:
+        raise NotImplementedError()
+
+    def _solve_impl(
+        self, matrix, rhs: np.ndarray, initial_guess: Optional[np.ndarray]
+    ) -> np.ndarray:
+        raise NotImplementedError()
+
+
+class DirectLinearSolver(LinearSolver):
+    """
+    LU factorisation, computed once per matrix; repeated solves cost a back-substitution.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lhs_solver: Optional[Callable[[np.ndarray], np.ndarray]] = None
+
+    def __str__(self) -> str:
+        return "direct"
+
+    # pylint: disable=unused-argument # 'dofs'
+    def _prepare(self, matrix, dofs: Optional[np.ndarray]) -> None:
+        if sparse.issparse(matrix):
+            self._lhs_solver = linalg.factorized(matrix.tocsc())
+        else:
+            lu_and_piv = scipy.linalg.lu_factor(matrix)
+            self._lhs_solver = lambda rhs: scipy.linalg.lu_solve(lu_and_piv, rhs)
+
+    # pylint: disable=unused-argument # 'initial_guess'
+    def _solve_impl(
+        self, matrix, rhs: np.ndarray, initial_guess: Optional[np.ndarray]
+    ) -> np.ndarray:
+        self.iterations = 1
+        self.residual = 0.0
+        return self._lhs_solver(rhs)
+
+
+class KrylovLinearSolver(LinearSolver):
+    """
+    Preconditioned Krylov method keeping memory O(nnz) of the matrix.
+
+    :param method: 'cg' for symmetric positive definite matrices (elasticity, Poisson),
+        'minres' for symmetric indefinite and 'gmres' for nonsymmetric ones (coupled problems)
+    :param preconditioner: None, 'jacobi', 'ilu', 'block' - exact inverse of `blocks` diagonal
+        blocks of equal size, e.g. of displacement components of stacked vectors, or 'multigrid' -
+        V-cycle over mesh hierarchy given by node `prolongations` (see `get_prolongations`)
+    """
+
+    METHODS = {"cg": linalg.cg, "minres": linalg.minres, "gmres": linalg.gmres}
+    PRECONDITIONERS = (None, "jacobi", "ilu", "block", "multigrid")
+
+    def __init__(
+        self,
+        method: str = "cg",
+        preconditioner: Optional[str] = "jacobi",
+        tol: float = 1e-10,
+        maxiter: Optional[int] = None,
+        blocks: int = 1,
+        prolongations: Optional[List[sparse.csr_matrix]] = None,
+    ):
+        super().__init__()
+        if method.lower() not in self.METHODS:
+            raise ValueError(f"Unknown Krylov method: {method}")
+        if preconditioner not in self.PRECONDITIONERS:
+            raise ValueError(f"Unknown preconditioner: {preconditioner}")
+        if preconditioner == "multigrid" and not prolongations:
+            raise ValueError("Multigrid preconditioner requires prolongations")
+        self.method: str = method.lower()
+        self.preconditioner: Optional[str] = preconditioner
+        self.tol: float = tol
+        self.maxiter: Optional[int] = maxiter
+        self.blocks: int = blocks
+        self.prolongations: Optional[List[sparse.csr_matrix]] = prolongations
+        self._preconditioner: Optional[linalg.LinearOperator] = None
+
+    def __str__(self) -> str:
+        return self.method
+
+    def _prepare(self, matrix, dofs: Optional[np.ndarray]) -> None:
+        matrix = sparse.csc_matrix(matrix)
+        size = matrix.shape[0]
+        if self.preconditioner is None:
+            self._preconditioner = None
+        elif self.preconditioner == "jacobi":
+            diagonal = matrix.diagonal()
+            inverse_diagonal = np.divide(
+                1.0, diagonal, out=np.ones_like(diagonal), where=diagonal != 0
+            )
+            self._preconditioner = linalg.LinearOperator(
+                matrix.shape, matvec=lambda x: inverse_diagonal * x.ravel()
+            )
+        elif self.preconditioner == "multigrid":
+            self._preconditioner = MultigridPreconditioner(matrix, self.prolongations, dofs=dofs)
+        elif self.preconditioner == "ilu":
+            self._preconditioner = linalg.LinearOperator(
+                matrix.shape, matvec=linalg.spilu(matrix).solve
+            )
+        else:
+            bounds = np.linspace(0, size, self.blocks + 1).astype(int)
+            factorizations = [
+                linalg.splu(matrix[start:stop, start:stop].tocsc())
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+
+            def block_solve(x):
+                x = x.ravel()
+                return np.concatenate(
+                    [
+                        factorization.solve(x[start:stop])
+                        for factorization, start, stop in zip(
+                            factorizations, bounds[:-1], bounds[1:]
+                        )
+                    ]
+                )
+
+            self._preconditioner = linalg.LinearOperator(matrix.shape, matvec=block_solve)
+
+    def _solve_impl(
+        self, matrix, rhs: np.ndarray, initial_guess: Optional[np.ndarray]
+    ) -> np.ndarray:
+        rhs_norm = np.linalg.norm(rhs)
+        if rhs_norm == 0:
+            self.iterations = 0
+            self.residual = 0.0
+            return np.zeros_like(rhs)
+
+        iterations = [0]
+
+        def count(_):
+            iterations[0] += 1
+
+        x0 = None if initial_guess is None else np.asarray(initial_guess, dtype=float).ravel()
+        options = {"x0": x0, "maxiter": self.maxiter, "M": self._preconditioner, "callback": count}
+        if self.method != "minres":
+            # residual is measured relatively to `rhs` only
+            options["atol"] = 0.0
+        if self.method == "gmres":
+            options["callback_type"] = "pr_norm"
+        solution, _ = self.METHODS[self.method](matrix, rhs, tol=self.tol, **options)
+
+        self.iterations = iterations[0]
+        self.residual = np.linalg.norm(rhs - matrix @ solution) / rhs_norm
+        return solution
+
+
+def get_linear_solver(method: str = "direct", **options) -> LinearSolver:
+    if method.lower() == "direct":
+        return DirectLinearSolver(**options)
+    return KrylovLinearSolver(method, **options)
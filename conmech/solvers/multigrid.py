@@ -0,0 +1,144 @@
+"""
+Created at 18.10.2026
+"""
+import dataclasses
+from typing import List, Optional
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg
+
+from conmech.mesh import mesh_builders
+from conmech.mesh.spatial_index import SpatialIndex
+from conmech.properties.mesh_description import GeneratedMeshDescription
+
+
+def get_prolongation(
+    coarse_nodes: np.ndarray,
+    coarse_elements: np.ndarray,
+    fine_nodes: np.ndarray,
+    candidates_count: int = 8,
+) -> sparse.csr_matrix:
+    """
+    Linear interpolation of nodal values from a coarse mesh onto nodes of a fine one.
+
+    Meshes need not be nested: each fine node is interpolated within the coarse element, among
+    those with the closest centroids, that it lies the deepest inside. Nodes outside of the coarse
+    mesh (along curved or non-matching boundaries) are projected onto that element.
+    """
+    elements, weights = SpatialIndex(coarse_nodes, coarse_elements).locate(
+        fine_nodes, candidates_count=candidates_count
+    )
+    weights = np.maximum(weights, 0)
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    element_size = coarse_elements.shape[1]
+    return sparse.csr_matrix(
+        (
+            weights.ravel(),
+            (
+                np.repeat(np.arange(len(fine_nodes)), element_size),
+                coarse_elements[elements].ravel(),
+            ),
+        ),
+        shape=(len(fine_nodes), len(coarse_nodes)),
+    )
+
+
+def get_prolongations(
+    mesh_descr: GeneratedMeshDescription, fine_nodes: np.ndarray, levels: int = 3
+) -> List[sparse.csr_matrix]:
+    """
+    Prolongations of a hierarchy of meshes built from `mesh_descr` with `max_element_perimeter`
+    doubled on each coarser level, ordered from the finest one.
+    """
+    if not isinstance(mesh_descr, GeneratedMeshDescription):
+        raise ValueError(f"Cannot coarsen mesh of {mesh_descr.__class__.__name__}")
+    prolongations = []
+    nodes = fine_nodes
+    for level in range(1, levels):
+        coarse_descr = dataclasses.replace(
+            mesh_descr, max_element_perimeter=mesh_descr.max_element_perimeter * 2**level
+        )
+        coarse_nodes, coarse_elements = mesh_builders.build_mesh(mesh_descr=coarse_descr)
+        prolongation = get_prolongation(coarse_nodes, coarse_elements, nodes)
+        # drop coarse nodes not used in interpolation (e.g. unconnected ones)
+        used = np.flatnonzero(prolongation.getnnz(axis=0))
+        prolongations.append(prolongation[:, used].tocsr())
+        nodes = coarse_nodes[used]
+    return prolongations
+
+
+class MultigridPreconditioner(linalg.LinearOperator):
+    """
+    Geometric multigrid V-cycle approximating the inverse of `matrix`.
+
+    Coarse operators are Galerkin products `P^T A P` of node prolongations expanded to all
+    components of stacked vectors (x's, y's, ...), smoothing is done with damped Jacobi and the
+    coarsest system is factorised. Pre- and post-smoothing are the same, so the V-cycle is
+    symmetric and can precondition conjugate gradients.
+
+    :param dofs: mask of DOFs of stacked vectors that `matrix` is restricted to (e.g. of those
+        not constrained by Dirichlet conditions); rows of other DOFs are dropped from the finest
+        prolongation
+    """
+
+    def __init__(
+        self,
+        matrix,
+        prolongations: List[sparse.csr_matrix],
+        smoothing_steps: int = 2,
+        damping: float = 0.6,
+        dofs: Optional[np.ndarray] = None,
+    ):
+        super().__init__(dtype=float, shape=matrix.shape)
+        size = matrix.shape[0] if dofs is None else len(dofs)
+        nodes_count = prolongations[0].shape[0]
+        if size % nodes_count != 0:
+            raise ValueError(
+                f"Number of DOFs {size} is not a multiple of {nodes_count} nodes of prolongation"
+            )
+        components = size // nodes_count
+        if dofs is not None and np.count_nonzero(dofs) != matrix.shape[0]:
+            raise ValueError(
+                f"Matrix of size {matrix.shape[0]} does not match {np.count_nonzero(dofs)} DOFs"
+            )
+        self.smoothing_steps: int = smoothing_steps
+        self.damping: float = damping
+
+        self.matrices = [sparse.csr_matrix(matrix)]
+        self.prolongations = []
+        for prolongation in prolongations:
+            prolongation = sparse.block_diag([prolongation] * components, format="csr")
+            if dofs is not None and not self.prolongations:
+                prolongation = prolongation[dofs]
+            self.prolongations.append(prolongation)
+            self.matrices.append((prolongation.T @ self.matrices[-1] @ prolongation).tocsr())
+        self.inverse_diagonals = []
+        for level_matrix in self.matrices:
+            diagonal = level_matrix.diagonal()
+            self.inverse_diagonals.append(
+                np.divide(1.0, diagonal, out=np.zeros_like(diagonal), where=diagonal != 0)
+            )
+        self.coarse_factorized = linalg.splu(self.matrices[-1].tocsc())
+
+    def _matvec(self, x):
+        return self.v_cycle(0, np.asarray(x).ravel())
+
+    def v_cycle(self, level: int, rhs: np.ndarray) -> np.ndarray:
+        if level == len(self.prolongations):
+            return self.coarse_factorized.solve(rhs)
+
+        matrix = self.matrices[level]
+        smoother = self.damping * self.inverse_diagonals[level]
+        solution = smoother * rhs
+        for _ in range(self.smoothing_steps - 1):
+            solution += smoother * (rhs - matrix @ solution)
+
+        prolongation = self.prolongations[level]
+        coarse_residual = prolongation.T @ (rhs - matrix @ solution)
+        solution += prolongation @ self.v_cycle(level + 1, coarse_residual)
+
+        for _ in range(self.smoothing_steps):
+            solution += smoother * (rhs - matrix @ solution)
+        return solution
@@ -24,6 +24,20 @@ from conmech.solvers.solver_methods import (
     make_cost_functional_3d,
 )
 
+# scipy.optimize.minimize methods making use of the gradient and Hessian-vector product
+GRADIENT_METHODS = (
+    "cg",
+    "bfgs",
+    "newton-cg",
+    "l-bfgs-b",
+    "tnc",
+    "slsqp",
+    "trust-ncg",
+    "trust-krylov",
+    "trust-constr",
+)
+HESSP_METHODS = ("newton-cg", "trust-ncg", "trust-krylov", "trust-constr")
+
 
 class Optimization(Solver):
     def __init__(
@@ -42,12 +56,16 @@ class Optimization(Solver):
             friction_bound,
         )
         if statement.dimension == 2:  # TODO
+            has_jt = hasattr(contact_law, "potential_tangential_direction")
+            derivatives = getattr(contact_law, "subderivatives_of_potentials", False)
             self.loss = make_cost_functional(
                 jn=contact_law.potential_normal_direction,
-                jt=contact_law.potential_tangential_direction
-                if hasattr(contact_law, "potential_tangential_direction")
-                else None,
+                jt=contact_law.potential_tangential_direction if has_jt else None,
                 h_functional=friction_bound,
+                jn_derivative=contact_law.subderivative_normal_direction if derivatives else None,
+                jt_derivative=contact_law.regularized_subderivative_tangential_direction
+                if derivatives and has_jt
+                else None,
             )
         elif statement.dimension == 3:  # TODO
             self.loss = make_cost_functional_3d(
@@ -106,15 +124,15 @@ class Optimization(Solver):
         maxiter = kwargs.get("maxiter", int(len(initial_guess) * 1e9))
         tol = kwargs.get("tol", 1e-12)
         args = (
-            self.body.mesh.nodes,
-            self.body.mesh.contact_boundary,
-            self.body.mesh.boundaries.contact_normals,
+            self.body.mesh.boundaries.contact_geometry,
             self.lhs,
             self.rhs,
             displacement,
             self.time_step,
         )
 
+        # gradients of contact functionals without jitted kernels are left to scipy
+        kernels = self.loss.has_contact_kernels
         while norm >= fixed_point_abs_tol:
             if method.lower() in (  # TODO
                 "quasi secant method",
@@ -133,6 +151,8 @@ class Optimization(Solver):
                     solution,
                     args=args,
                     method=method,
+                    jac=self.loss.jac if method.lower() in GRADIENT_METHODS and kernels else None,
+                    hessp=self.loss.hessp if method.lower() in HESSP_METHODS and kernels else None,
                     options={"disp": disp, "maxiter": maxiter},
                     tol=tol,
                 )
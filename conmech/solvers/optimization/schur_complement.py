@@ -5,6 +5,8 @@ import math
 from typing import Tuple
 
 import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg
 
 from conmech.dynamics.statement import Variables
 from conmech.helpers import nph
@@ -36,8 +38,9 @@ class SchurComplementOptimization(Optimization):
             self._node_relations,
             self.free_x_contact,
             self.contact_x_free,
-            self.free_x_free_inverted,
+            self.free_x_free_factorized,
         ) = self.recalculate_displacement()
+        self._left_hand_side_version = self.statement.left_hand_side_version
 
         self.node_forces_, self.forces_free = self.recalculate_forces()
 
@@ -50,13 +53,22 @@ class SchurComplementOptimization(Optimization):
         )
 
     def recalculate_forces(self):
+        # complement matrices are rebuilt only when left hand side has changed since
+        if self._left_hand_side_version != self.statement.left_hand_side_version:
+            (
+                self._node_relations,
+                self.free_x_contact,
+                self.contact_x_free,
+                self.free_x_free_factorized,
+            ) = self.recalculate_displacement()
+            self._left_hand_side_version = self.statement.left_hand_side_version
         node_forces, forces_free = calculate_schur_complement_vector(
             vector=self.statement.right_hand_side,
             dimension=self.statement.dimension,
             contact_indices=self.contact_ids,
             free_indices=self.free_ids,
             contact_x_free=self.contact_x_free,
-            free_x_free_inverted=self.free_x_free_inverted,
+            free_x_free_factorized=self.free_x_free_factorized,
         )
         if self.statement.dimension == 2:
             return node_forces.T, forces_free
@@ -105,7 +117,7 @@ class SchurComplementOptimization(Optimization):
 
         _result = self.free_x_contact @ _result
         _result = self.forces_free - _result
-        result = self.free_x_free_inverted @ _result
+        result = self.free_x_free_factorized.solve(_result)
         return result
 
     def merge(self, solution_contact: np.ndarray, solution_free: np.ndarray) -> np.ndarray:
@@ -178,33 +190,39 @@ def calculate_schur_complement_vector(
     dimension: int,
     contact_indices: slice,
     free_indices: slice,
-    free_x_free_inverted: np.ndarray,
-    contact_x_free: np.ndarray,
+    free_x_free_factorized: linalg.SuperLU,
+    contact_x_free: sparse.csr_matrix,
 ) -> Tuple[np.ndarray, np.ndarray]:
     vector_split = nph.unstack(vector, dimension)
     vector_contact = nph.stack_column(vector_split[contact_indices, :])
     vector_free = nph.stack_column(vector_split[free_indices, :])
-    vector_boundary = vector_contact - (contact_x_free @ (free_x_free_inverted @ vector_free))
+    vector_boundary = vector_contact - contact_x_free @ free_x_free_factorized.solve(vector_free)
     return vector_boundary, vector_free
 
 
 def calculate_schur_complement_matrices(
-    matrix: np.ndarray, dimension: int, contact_indices: slice, free_indices: slice
+    matrix: sparse.spmatrix, dimension: int, contact_indices: slice, free_indices: slice
 ):
-    def get_sliced(matrix_split, indices_height, indices_width):
-        matrix = np.moveaxis(matrix_split[..., indices_height, indices_width], 1, 2)
-        dim, height, _, width = matrix.shape
-        return matrix.reshape(dim * height, dim * width)
-
-    matrix_split = np.array(
-        np.split(np.array(np.split(matrix, dimension, axis=-1)), dimension, axis=1)
+    matrix = sparse.csr_matrix(matrix)
+    nodes_count = matrix.shape[0] // dimension
+
+    def get_dofs(indices):
+        # degrees of freedom of the nodes, ordered as in stacked vectors: all x's, all y's, ...
+        nodes = np.arange(nodes_count)[indices]
+        return (np.arange(dimension)[:, np.newaxis] * nodes_count + nodes).ravel()
+
+    def get_sliced(indices_height, indices_width):
+        return matrix[get_dofs(indices_height)][:, get_dofs(indices_width)]
+
+    free_x_free = get_sliced(free_indices, free_indices)
+    free_x_contact = get_sliced(free_indices, contact_indices)
+    contact_x_free = get_sliced(contact_indices, free_indices)
+    contact_x_contact = get_sliced(contact_indices, contact_indices)
+
+    # factorised once; only the (few) contact columns are solved for, instead of inverting
+    free_x_free_factorized = linalg.splu(free_x_free.tocsc())
+    matrix_boundary = contact_x_contact.toarray() - contact_x_free @ free_x_free_factorized.solve(
+        free_x_contact.toarray()
     )
-    free_x_free = get_sliced(matrix_split, free_indices, free_indices)
-    free_x_contact = get_sliced(matrix_split, free_indices, contact_indices)
-    contact_x_free = get_sliced(matrix_split, contact_indices, free_indices)
-    contact_x_contact = get_sliced(matrix_split, contact_indices, contact_indices)
-
-    free_x_free_inverted = np.linalg.inv(free_x_free)
-    matrix_boundary = contact_x_contact - contact_x_free @ (free_x_free_inverted @ free_x_contact)
 
-    return matrix_boundary, free_x_contact, contact_x_free, free_x_free_inverted
+    return matrix_boundary, free_x_contact, contact_x_free, free_x_free_factorized
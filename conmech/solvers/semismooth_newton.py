@@ -0,0 +1,131 @@
+"""
+Created at 18.10.2026
+"""
+from typing import Callable, Optional
+
+import numpy as np
+from scipy import sparse
+
+from conmech.dynamics.statement import Statement, Variables
+from conmech.scenarios.problems import ContactLaw
+from conmech.scene.body_forces import BodyForces
+from conmech.solvers._solvers import SolversRegistry
+from conmech.solvers.direct import Direct
+from conmech.solvers.solver_methods import make_equation_jacobian
+
+
+class SemismoothNewton(Direct):
+    """
+    Semismooth Newton method for the contact equation solved by `Direct`.
+
+    Each iteration solves one sparse linear system with the generalised Jacobian of the equation,
+    in which only edges currently in contact contribute. For piecewise linear contact laws this is
+    the primal-dual active set method: iterations stop as soon as the active set settles.
+    Newton steps are damped by backtracking on the residual norm.
+    """
+
+    def __init__(
+        self,
+        statement: Statement,
+        body: BodyForces,
+        time_step: float,
+        contact_law: Optional[ContactLaw] = None,
+        friction_bound: Optional[Callable[[float], float]] = None,
+    ):
+        super().__init__(
+            statement,
+            body,
+            time_step,
+            contact_law,
+            friction_bound,
+        )
+        self.jacobian: Optional[Callable] = None
+        # statistics of the last solve
+        self.iterations: int = 0
+        self.residual: float = 0.0
+
+        if contact_law is not None:
+            self.jacobian = make_equation_jacobian(
+                jn=contact_law.subderivative_normal_direction,
+                jt=contact_law.regularized_subderivative_tangential_direction,
+                h_functional=friction_bound,
+            )
+
+    def __str__(self) -> str:
+        return "semismooth newton"
+
+    def _solve_impl(
+        self,
+        initial_guess: np.ndarray,
+        *,
+        tol: float = 1e-10,
+        maxiter: int = 50,
+        **kwargs,
+    ) -> np.ndarray:
+        if self.equation is None:
+            self.iterations = 1
+            self.residual = 0.0
+            return super()._solve_impl(initial_guess, **kwargs)
+
+        contact_geometry = self.body.mesh.boundaries.contact_geometry
+        lhs = self.node_relations
+        rhs = np.asarray(self.node_forces).ravel()
+        args = (contact_geometry, lhs, rhs)
+
+        solution = np.array(initial_guess, dtype=float).ravel()
+        residual = self.equation(solution, *args)
+        residual_norm = np.linalg.norm(residual)
+        threshold = tol * max(1.0, np.linalg.norm(rhs))
+
+        self.iterations = 0
+        while residual_norm > threshold and self.iterations < maxiter:
+            self.iterations += 1
+            jacobian = sparse.csc_matrix(lhs) + self.jacobian(solution, contact_geometry)
+            step = self.linear_solver.solve(jacobian, -residual)
+
+            # backtracking (Armijo on the residual norm) guards against kinks of the contact law
+            damping = 1.0
+            while True:
+                candidate = solution + damping * step
+                candidate_residual = self.equation(candidate, *args)
+                candidate_norm = np.linalg.norm(candidate_residual)
+                if candidate_norm <= (1 - 1e-4 * damping) * residual_norm or damping < 1e-4:
+                    break
+                damping /= 2
+            solution, residual, residual_norm = candidate, candidate_residual, candidate_norm
+
+        self.residual = residual_norm
+        return solution
+
+
+@SolversRegistry.register("static", "semismooth newton", "ssn")
+class StaticSemismoothNewton(SemismoothNewton):
+    pass
+
+
+@SolversRegistry.register("quasistatic", "semismooth newton", "ssn")
+class QuasistaticSemismoothNewton(SemismoothNewton):
+    def iterate(self):
+        self.statement.update(
+            Variables(
+                displacement=self.u_vector,
+                electric_potential=self.p_vector,
+                time_step=self.time_step,
+                time=self.current_time,
+            )
+        )
+
+
+@SolversRegistry.register("dynamic", "semismooth newton", "ssn")
+class DynamicSemismoothNewton(SemismoothNewton):
+    def iterate(self):
+        self.statement.update(
+            Variables(
+                displacement=self.u_vector,
+                velocity=self.v_vector,
+                temperature=self.t_vector,
+                electric_potential=self.p_vector,
+                time_step=self.time_step,
+                time=self.current_time,
+            )
+        )
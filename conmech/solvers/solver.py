@@ -7,6 +7,7 @@ import numpy as np
 
 from conmech.dynamics.statement import Statement, Variables
 from conmech.scenarios.problems import ContactLaw
+from conmech.solvers.linear_solver import LinearSolver, DirectLinearSolver
 
 
 class Solver:
@@ -33,6 +34,8 @@ class Solver:
         self.p_vector: np.ndarray = np.zeros(self.body.mesh.nodes_count)  # TODO #23
 
         self.elasticity: np.ndarray = body.dynamics.elasticity
+        # backend of linear systems solved in steps, see `ProblemSolver.set_linear_solver`
+        self.linear_solver: LinearSolver = DirectLinearSolver()
 
         self.statement.update(
             Variables(
@@ -62,12 +65,7 @@ class Solver:
             initial_guess, velocity=self.v_vector, displacement=self.u_vector, **kwargs
         )
 
-        for dirichlet_cond in self.statement.find_dirichlet_conditions():
-            c = self.body.mesh.boundaries.boundaries[dirichlet_cond].node_condition
-            node_count = self.body.mesh.nodes_count
-            for i, j in self.body.mesh.boundaries.get_all_boundary_indices(
-                dirichlet_cond, node_count, self.statement.dimension
-            ):
-                solution[i] = c[j]
+        constrained, lifting = self.statement.dirichlet_partition
+        solution[constrained] = lifting[constrained]
 
         return solution
@@ -5,8 +5,9 @@ from typing import Callable, Optional, Any
 
 import numba
 import numpy as np
+from scipy import sparse
 
-from conmech.helpers import nph
+from conmech.mesh.boundaries import ContactGeometry
 
 DIMENSION = 2
 
@@ -51,62 +52,62 @@ def interpolate_node_between_2023(node_id_0, _node_id_1, vector, dimension=DIMEN
     return result
 
 
+def make_edge_contact_force(jn: Callable, jt: Callable, h_functional: Callable) -> Callable:
+    """
+    Returns jitted contact force `(j_x, j_y)` of an edge, added to both of its nodes.
+    """
+
+    @numba.njit(inline="always")
+    def edge_contact_force(um, edge_len, normal_vector, v_tau_0, v_tau_1):
+        um_normal = (um * normal_vector).sum()
+        um_tangential = um - um_normal * normal_vector
+
+        j_x = edge_len * 0.5 * (jn(um_normal, normal_vector[0])) + h_functional(um_normal) * jt(
+            um_tangential, v_tau_0
+        )
+        j_y = edge_len * 0.5 * (jn(um_normal, normal_vector[1])) + h_functional(um_normal) * jt(
+            um_tangential, v_tau_1
+        )
+        return j_x, j_y
+
+    return edge_contact_force
+
+
 def make_equation(
     jn: Optional[callable], jt: Optional[callable], h_functional: Optional[callable]
 ) -> callable:
     # TODO Make it prettier
     if jn is None:
-
-        @numba.njit
-        def equation(u_vector: np.ndarray, _, __, lhs: np.ndarray, rhs: np.ndarray) -> np.ndarray:
-            result = np.dot(lhs, u_vector) - rhs
+        # not jitted, `lhs` may be a sparse matrix
+        def equation(u_vector: np.ndarray, _, lhs: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+            result = lhs @ u_vector - rhs
             return result
 
     else:
-        jn = numba.njit(jn)
-        jt = numba.njit(jt)
-        h_functional = numba.njit(h_functional)
+        edge_contact_force = make_edge_contact_force(
+            numba.njit(jn), numba.njit(jt), numba.njit(h_functional)
+        )
 
         @numba.njit()
-        def contact_part(u_vector, nodes, contact_boundary, contact_normals):
+        def contact_part(u_vector, surfaces, measures, normals, tangential_projections):
             contact_vector = np.zeros_like(u_vector)
             offset = len(u_vector) // DIMENSION
 
-            for ei, edge in enumerate(contact_boundary):
+            for ei, edge in enumerate(surfaces):
                 n_id_0 = edge[0]
                 n_id_1 = edge[1]
-                n_0 = nodes[n_id_0]
-                n_1 = nodes[n_id_1]
 
                 # ASSUMING `u_vector` and `nodes` have the same order!
                 um = interpolate_node_between(n_id_0, n_id_1, u_vector)
 
-                normal_vector = contact_normals[ei]
-
-                um_normal = (um * normal_vector).sum()
-                um_tangential = um - um_normal * normal_vector
-
-                v_tau_0 = np.asarray(
-                    [
-                        1 - normal_vector[0] * normal_vector[0],
-                        0 - normal_vector[0] * normal_vector[1],
-                    ]
-                )
-                v_tau_1 = np.asarray(
-                    [
-                        0 - normal_vector[0] * normal_vector[1],
-                        1 - normal_vector[1] * normal_vector[1],
-                    ]
+                j_x, j_y = edge_contact_force(
+                    um,
+                    measures[ei],
+                    normals[ei],
+                    tangential_projections[ei, 0],
+                    tangential_projections[ei, 1],
                 )
 
-                edge_len = nph.length(n_0, n_1)
-                j_x = edge_len * 0.5 * (jn(um_normal, normal_vector[0])) + h_functional(
-                    um_normal
-                ) * jt(um_tangential, v_tau_0)
-                j_y = edge_len * 0.5 * (jn(um_normal, normal_vector[1])) + h_functional(
-                    um_normal
-                ) * jt(um_tangential, v_tau_1)
-
                 if n_id_0 < offset:
                     contact_vector[n_id_0] += j_x
                     contact_vector[n_id_0 + offset] += j_y
@@ -117,22 +118,115 @@ def make_equation(
 
             return contact_vector
 
-        @numba.njit
         def equation(
             u_vector: np.ndarray,
-            vertices: np.ndarray,
-            contact_boundary: np.ndarray,
-            contact_normals: np.ndarray,
+            contact_geometry: ContactGeometry,
             lhs: np.ndarray,
             rhs: np.ndarray,
         ) -> np.ndarray:
-            c_part = contact_part(u_vector, vertices, contact_boundary, contact_normals)
-            result = np.dot(lhs, u_vector) + c_part - rhs
+            c_part = contact_part(
+                u_vector,
+                contact_geometry.surfaces,
+                contact_geometry.measures,
+                contact_geometry.normals,
+                contact_geometry.tangential_projections,
+            )
+            result = lhs @ u_vector + c_part - rhs
             return result
 
     return equation
 
 
+def make_equation_jacobian(
+    jn: Optional[callable], jt: Optional[callable], h_functional: Optional[callable]
+) -> callable:
+    """
+    Returns function computing a generalised Jacobian of the contact part of `make_equation`.
+
+    Contact laws are only piecewise smooth and provide no second derivatives, so the 2x2 derivative
+    of each edge force with respect to the edge mean displacement is computed by central
+    differences. For piecewise linear laws it is exact off the kinks, which makes Newton iterations
+    terminate as soon as the set of active (penetrating) edges stops changing.
+    """
+    if jn is None:
+
+        def jacobian(u_vector: np.ndarray, _) -> sparse.csr_matrix:
+            return sparse.csr_matrix((len(u_vector), len(u_vector)))
+
+    else:
+        edge_contact_force = make_edge_contact_force(
+            numba.njit(jn), numba.njit(jt), numba.njit(h_functional)
+        )
+
+        @numba.njit()
+        def local_jacobian(um, edge_len, normal_vector, v_tau_0, v_tau_1, step):
+            result = np.empty((DIMENSION, DIMENSION))
+            for k in range(DIMENSION):
+                um_shifted = um.copy()
+                um_shifted[k] += step
+                forward = edge_contact_force(um_shifted, edge_len, normal_vector, v_tau_0, v_tau_1)
+                um_shifted[k] -= 2 * step
+                backward = edge_contact_force(um_shifted, edge_len, normal_vector, v_tau_0, v_tau_1)
+                for i in range(DIMENSION):
+                    result[i, k] = (forward[i] - backward[i]) / (2 * step)
+            return result
+
+        @numba.njit()
+        def contact_jacobian_triplets(
+            u_vector, surfaces, measures, normals, tangential_projections, step
+        ):
+            offset = len(u_vector) // DIMENSION
+            # each edge couples all (node, direction) pairs of its both nodes
+            edge_dofs_count = 2 * DIMENSION
+            entries_count = len(surfaces) * edge_dofs_count**2
+            rows = np.zeros(entries_count, dtype=np.int64)
+            columns = np.zeros(entries_count, dtype=np.int64)
+            values = np.zeros(entries_count)
+            edge_dofs = np.empty(edge_dofs_count, dtype=np.int64)
+
+            for ei, edge in enumerate(surfaces):
+                um = interpolate_node_between(edge[0], edge[1], u_vector)
+                jacobian = local_jacobian(
+                    um,
+                    measures[ei],
+                    normals[ei],
+                    tangential_projections[ei, 0],
+                    tangential_projections[ei, 1],
+                    step,
+                )
+                for d in range(edge_dofs_count):
+                    n_id = edge[d // DIMENSION]
+                    # exclude dirichlet nodes (and inner nodes in schur)
+                    edge_dofs[d] = n_id + (d % DIMENSION) * offset if n_id < offset else -1
+
+                index = ei * edge_dofs_count**2
+                for row in range(edge_dofs_count):
+                    for column in range(edge_dofs_count):
+                        if edge_dofs[row] >= 0 and edge_dofs[column] >= 0:
+                            rows[index] = edge_dofs[row]
+                            columns[index] = edge_dofs[column]
+                            # mean displacement depends on each edge node with weight 0.5
+                            values[index] = 0.5 * jacobian[row % DIMENSION, column % DIMENSION]
+                        index += 1
+
+            return rows, columns, values
+
+        def jacobian(u_vector: np.ndarray, contact_geometry: ContactGeometry) -> sparse.csr_matrix:
+            step = CostFunctional.FD_STEP * max(1.0, np.abs(u_vector).max(initial=0))
+            rows, columns, values = contact_jacobian_triplets(
+                u_vector,
+                contact_geometry.surfaces,
+                contact_geometry.measures,
+                contact_geometry.normals,
+                contact_geometry.tangential_projections,
+                step,
+            )
+            shape = (len(u_vector), len(u_vector))
+            return sparse.csr_matrix((values, (rows, columns)), shape=shape)
+
+    return jacobian
+
+
 def njit(func: Optional[Callable], value: Optional[Any] = 0) -> Callable:
     if func is None:
 
@@ -144,53 +238,261 @@ def njit(func: Optional[Callable], value: Optional[Any] = 0) -> Callable:
     return numba.njit(func)
 
 
+class CostFunctional:
+    """
+    Functional `0.5 * x^T lhs x - rhs^T x + contact_functional(x)`, minimised by optimization
+    solvers, together with its gradient and Hessian-vector product.
+
+    The quadratic part is differentiated exactly. The contact part is differentiated by
+    `contact_gradient_kernel` and `contact_hessp_kernel` (with arguments as `contact_functional`
+    and the direction after `x` for the latter) if given, and otherwise by central differences,
+    only along entries of `x` of contact nodes. The latter calls `contact_functional` twice per
+    entry, so solvers should use `jac` and `hessp` only if `has_contact_kernels`.
+    """
+
+    # optimal step of central differences is proportional to cube root of machine precision
+    FD_STEP = np.finfo(float).eps ** (1 / 3)
+
+    def __init__(
+        self,
+        contact_functional: Callable,
+        dimension: int,
+        contact_gradient_kernel: Optional[Callable] = None,
+        contact_hessp_kernel: Optional[Callable] = None,
+    ):
+        self.contact_functional = contact_functional
+        self.dimension = dimension
+        self.contact_gradient_kernel = contact_gradient_kernel
+        self.contact_hessp_kernel = contact_hessp_kernel
+
+    @property
+    def has_contact_kernels(self) -> bool:
+        return self.contact_gradient_kernel is not None and self.contact_hessp_kernel is not None
+
+    def __call__(self, x, contact_geometry, lhs, rhs, u_vector_old, dt):
+        result = (
+            0.5 * np.dot(lhs @ x, x)
+            - np.dot(rhs, x)
+            + self.contact_functional(x, contact_geometry, u_vector_old, dt)
+        )
+        result = np.asarray(result).ravel()
+        return result
+
+    def jac(self, x, contact_geometry, lhs, rhs, u_vector_old, dt):
+        result = 0.5 * (lhs @ x + lhs.T @ x) - np.asarray(rhs).ravel()
+        return result + self.contact_gradient(x, contact_geometry, u_vector_old, dt)
+
+    # pylint: disable=unused-argument # 'rhs'
+    def hessp(self, x, direction, contact_geometry, lhs, rhs, u_vector_old, dt):
+        result = 0.5 * (lhs @ direction + lhs.T @ direction)
+        if self.contact_hessp_kernel is not None:
+            return result + self.contact_hessp_kernel(
+                x, direction, contact_geometry, u_vector_old, dt
+            )
+        direction_norm = np.linalg.norm(direction)
+        if direction_norm == 0:
+            return result
+        step = self.FD_STEP * max(1.0, np.linalg.norm(x)) / direction_norm
+        args = (contact_geometry, u_vector_old, dt)
+        return result + (
+            self.contact_gradient(x + step * direction, *args)
+            - self.contact_gradient(x - step * direction, *args)
+        ) / (2 * step)
+
+    def contact_gradient(self, x, contact_geometry, u_vector_old, dt):
+        if self.contact_gradient_kernel is not None:
+            return self.contact_gradient_kernel(x, contact_geometry, u_vector_old, dt)
+        result = np.zeros_like(x, dtype=float)
+        args = (contact_geometry, u_vector_old, dt)
+        x_shifted = np.array(x, dtype=float)
+        for i in self.contact_dofs(len(x), contact_geometry.surfaces):
+            step = self.FD_STEP * max(1.0, abs(x[i]))
+            x_shifted[i] = x[i] + step
+            cost_forward = self.contact_functional(x_shifted, *args)
+            x_shifted[i] = x[i] - step
+            cost_backward = self.contact_functional(x_shifted, *args)
+            x_shifted[i] = x[i]
+            result[i] = (cost_forward - cost_backward) / (2 * step)
+        return result
+
+    def contact_dofs(self, variables_count: int, surfaces: np.ndarray) -> np.ndarray:
+        # entries of `x` are ordered as in stacked vectors: all x's, all y's, ...
+        offset = variables_count // self.dimension
+        contact_nodes = np.unique(surfaces)
+        contact_nodes = contact_nodes[contact_nodes < offset]
+        return (np.arange(self.dimension)[:, np.newaxis] * offset + contact_nodes).ravel()
+
+
+def make_potential_derivative(potential: Callable) -> Callable:
+    """
+    Returns jitted directional derivative `(u, v)` of jitted `potential`, with the signature of
+    subderivatives of contact laws, computed by central differences.
+    """
+    step = CostFunctional.FD_STEP
+
+    @numba.njit(inline="always")
+    def derivative(u_value, v_value):
+        return (potential(u_value + step * v_value) - potential(u_value - step * v_value)) / (
+            2 * step
+        )
+
+    return derivative
+
+
 def make_cost_functional(
-    jn: Callable, jt: Optional[Callable] = None, h_functional: Optional[Callable] = None
+    jn: Callable,
+    jt: Optional[Callable] = None,
+    h_functional: Optional[Callable] = None,
+    jn_derivative: Optional[Callable] = None,
+    jt_derivative: Optional[Callable] = None,
 ):
+    """
+    `jn_derivative` and `jt_derivative` are directional derivatives `(u, v)` of potentials `jn`
+    and `jt`, e.g. subderivatives of the contact law if `subderivatives_of_potentials`.
+    By default they are not analytic: potentials are differentiated by central differences
+    (see `make_potential_derivative`), evaluated per contact edge in the jitted kernels, so
+    gradients are accurate to O(`CostFunctional.FD_STEP`^2) and smooth potentials are assumed.
+    """
     jn = njit(jn)
     jt = njit(jt)
     h_functional = njit(h_functional)
+    jn_derivative = (
+        make_potential_derivative(jn) if jn_derivative is None else numba.njit(jn_derivative)
+    )
+    jt_derivative = (
+        make_potential_derivative(jt) if jt_derivative is None else numba.njit(jt_derivative)
+    )
+    fd_step = CostFunctional.FD_STEP
 
     @numba.njit()
-    def contact_cost_functional(u_vector, u_vector_old, nodes, contact_boundary, contact_normals):
+    def contact_cost_functional(u_vector, u_vector_old, surfaces, measures, normals, max_node_ids):
         cost = 0
         offset = len(u_vector) // DIMENSION
 
-        for ei, edge in enumerate(contact_boundary):
+        for ei, edge in enumerate(surfaces):
             n_id_0 = edge[0]
             n_id_1 = edge[1]
-            n_0 = nodes[n_id_0]
-            n_1 = nodes[n_id_1]
 
             # ASSUMING `u_vector` and `nodes` have the same order!
             um = interpolate_node_between(n_id_0, n_id_1, u_vector)
             um_old = interpolate_node_between(n_id_0, n_id_1, u_vector_old)
 
-            normal_vector = contact_normals[ei]
+            normal_vector = normals[ei]
 
             um_normal = (um * normal_vector).sum()
             um_old_normal = (um_old * normal_vector).sum()
             um_tangential = um - um_normal * normal_vector
 
-            if n_id_0 < offset and n_id_1 < offset:
-                cost += nph.length(n_0, n_1) * (
+            if max_node_ids[ei] < offset:
+                cost += measures[ei] * (
                     jn(um_normal) + h_functional(um_old_normal) * jt(um_tangential)
                 )
         return cost
 
-    # pylint: disable=unused-argument # 'dt'
+    @numba.njit(inline="always")
+    def edge_cost_gradient(um, um_old, edge_len, normal_vector):
+        """Gradient of the cost of an edge with respect to its mean displacement `um`."""
+        um_normal = (um * normal_vector).sum()
+        um_old_normal = (um_old * normal_vector).sum()
+        um_tangential = um - um_normal * normal_vector
+
+        result = np.empty(DIMENSION)
+        for k in range(DIMENSION):
+            # tangential part of k-th unit vector
+            v_tangential = -normal_vector[k] * normal_vector
+            v_tangential[k] += 1
+            result[k] = edge_len * (
+                jn_derivative(um_normal, normal_vector[k])
+                + h_functional(um_old_normal) * jt_derivative(um_tangential, v_tangential)
+            )
+        return result
+
     @numba.njit()
-    def cost_functional(
-        u_vector, nodes, contact_boundary, contact_normals, lhs, rhs, u_vector_old, dt
+    def contact_cost_gradient(u_vector, u_vector_old, surfaces, measures, normals, max_node_ids):
+        result = np.zeros(len(u_vector))
+        offset = len(u_vector) // DIMENSION
+
+        for ei, edge in enumerate(surfaces):
+            if max_node_ids[ei] >= offset:
+                continue
+            um = interpolate_node_between(edge[0], edge[1], u_vector)
+            um_old = interpolate_node_between(edge[0], edge[1], u_vector_old)
+            gradient = edge_cost_gradient(um, um_old, measures[ei], normals[ei])
+
+            # mean displacement depends on each edge node with weight 0.5
+            for n_id in edge[:2]:
+                for k in range(DIMENSION):
+                    result[n_id + k * offset] += 0.5 * gradient[k]
+        return result
+
+    @numba.njit()
+    def contact_cost_hessp(
+        u_vector, direction, u_vector_old, surfaces, measures, normals, max_node_ids
     ):
-        ju = contact_cost_functional(
-            u_vector, u_vector_old, nodes, contact_boundary, contact_normals
-        )
-        result = 0.5 * np.dot(np.dot(lhs, u_vector), u_vector) - np.dot(rhs, u_vector) + ju
-        result = np.asarray(result).ravel()
+        result = np.zeros(len(u_vector))
+        offset = len(u_vector) // DIMENSION
+
+        for ei, edge in enumerate(surfaces):
+            if max_node_ids[ei] >= offset:
+                continue
+            dm = interpolate_node_between(edge[0], edge[1], direction)
+            dm_norm = np.sqrt((dm * dm).sum())
+            if dm_norm == 0:
+                continue
+            um = interpolate_node_between(edge[0], edge[1], u_vector)
+            um_old = interpolate_node_between(edge[0], edge[1], u_vector_old)
+
+            # product of the local Hessian (contact laws provide no second derivatives, so it is
+            # a central difference of the edge gradient) with `dm`
+            step = fd_step * max(1.0, np.abs(um).max()) / dm_norm
+            forward = edge_cost_gradient(um + step * dm, um_old, measures[ei], normals[ei])
+            backward = edge_cost_gradient(um - step * dm, um_old, measures[ei], normals[ei])
+
+            for n_id in edge[:2]:
+                for k in range(DIMENSION):
+                    result[n_id + k * offset] += 0.5 * (forward[k] - backward[k]) / (2 * step)
         return result
 
-    return cost_functional
+    # pylint: disable=unused-argument # 'dt'
+    def contact_functional(u_vector, contact_geometry, u_vector_old, dt):
+        return contact_cost_functional(
+            u_vector,
+            u_vector_old,
+            contact_geometry.surfaces,
+            contact_geometry.measures,
+            contact_geometry.normals,
+            contact_geometry.max_node_ids,
+        )
+
+    # pylint: disable=unused-argument # 'dt'
+    def contact_gradient(u_vector, contact_geometry, u_vector_old, dt):
+        return contact_cost_gradient(
+            u_vector,
+            u_vector_old,
+            contact_geometry.surfaces,
+            contact_geometry.measures,
+            contact_geometry.normals,
+            contact_geometry.max_node_ids,
+        )
+
+    # pylint: disable=unused-argument # 'dt'
+    def contact_hessp(u_vector, direction, contact_geometry, u_vector_old, dt):
+        return contact_cost_hessp(
+            u_vector,
+            direction,
+            u_vector_old,
+            contact_geometry.surfaces,
+            contact_geometry.measures,
+            contact_geometry.normals,
+            contact_geometry.max_node_ids,
+        )
+
+    return CostFunctional(
+        contact_functional,
+        dimension=DIMENSION,
+        contact_gradient_kernel=contact_gradient,
+        contact_hessp_kernel=contact_hessp,
+    )
 
 
 def make_cost_functional_3d(
@@ -200,13 +502,13 @@ def make_cost_functional_3d(
     jt = njit(jt)
     h_functional = njit(h_functional)
 
-    # pylint: disable=unused-argument # 'nodes'
+    # pylint: disable=unused-argument # 'measures'
     @numba.njit()
-    def contact_cost_functional(u_vector, u_vector_old, nodes, contact_boundary, contact_normals):
+    def contact_cost_functional(u_vector, u_vector_old, surfaces, measures, normals, max_node_ids):
         cost = 0
         offset = len(u_vector) // 3
 
-        for ei, edge in enumerate(contact_boundary):
+        for ei, edge in enumerate(surfaces):
             n_id_0 = edge[0]
             n_id_1 = edge[1]
             n_id_2 = edge[2]
@@ -215,67 +517,64 @@ def make_cost_functional_3d(
             um = interpolate_node_between_3d(n_id_0, n_id_1, n_id_2, u_vector)
             um_old = interpolate_node_between_3d(n_id_0, n_id_1, n_id_2, u_vector_old)
 
-            normal_vector = contact_normals[ei]
+            normal_vector = normals[ei]
 
             um_normal = (um * normal_vector).sum()
             um_old_normal = (um_old * normal_vector).sum()
             um_tangential = um - um_normal * normal_vector
 
-            if n_id_0 < offset and n_id_1 < offset and n_id_2 < offset:
+            if max_node_ids[ei] < offset:
                 cost += 1 * (jn(um_normal) + h_functional(um_old_normal) * jt(um_tangential))
         return cost
 
     # pylint: disable=unused-argument # 'dt'
-    @numba.njit()
-    def cost_functional(
-        u_vector, nodes, contact_boundary, contact_normals, lhs, rhs, u_vector_old, dt
-    ):
-        ju = contact_cost_functional(
-            u_vector, u_vector_old, nodes, contact_boundary, contact_normals
+    def contact_functional(u_vector, contact_geometry, u_vector_old, dt):
+        return contact_cost_functional(
+            u_vector,
+            u_vector_old,
+            contact_geometry.surfaces,
+            contact_geometry.measures,
+            contact_geometry.normals,
+            contact_geometry.max_node_ids,
         )
-        result = 0.5 * np.dot(np.dot(lhs, u_vector), u_vector) - np.dot(rhs, u_vector) + ju
-        result = np.asarray(result).ravel()
-        return result
 
-    return cost_functional
+    return CostFunctional(contact_functional, dimension=3)
 
 
 def make_cost_functional_poisson(jn: Callable):
     jn = njit(jn)
 
     @numba.njit()
-    def contact_cost_functional(u_vector, nodes, contact_boundary, contact_normals):
+    def contact_cost_functional(u_vector, surfaces, measures, normals, max_node_ids):
         cost = 0
         offset = len(u_vector) // DIMENSION
 
-        for ei, edge in enumerate(contact_boundary):
+        for ei, edge in enumerate(surfaces):
             n_id_0 = edge[0]
             n_id_1 = edge[1]
-            n_0 = nodes[n_id_0]
-            n_1 = nodes[n_id_1]
 
             # ASSUMING `u_vector` and `nodes` have the same order!
             um = interpolate_node_between(n_id_0, n_id_1, u_vector)
 
-            normal_vector = contact_normals[ei]
+            normal_vector = normals[ei]
 
             um_normal = (um * normal_vector).sum()
 
-            if n_id_0 < offset and n_id_1 < offset:
-                cost += nph.length(n_0, n_1) * (jn(um_normal))
+            if max_node_ids[ei] < offset:
+                cost += measures[ei] * (jn(um_normal))
         return cost
 
     # pylint: disable=unused-argument # u_vector_old, dt
-    # @numba.njit()
-    def cost_functional(
-        u_vector, nodes, contact_boundary, contact_normals, lhs, rhs, u_vector_old, dt
-    ):
-        ju = contact_cost_functional(u_vector, nodes, contact_boundary, contact_normals)
-        result = 0.5 * np.dot(np.dot(lhs, u_vector), u_vector) - np.dot(rhs, u_vector) + ju
-        result = np.asarray(result).ravel()
-        return result
+    def contact_functional(u_vector, contact_geometry, u_vector_old, dt):
+        return contact_cost_functional(
+            u_vector,
+            contact_geometry.surfaces,
+            contact_geometry.measures,
+            contact_geometry.normals,
+            contact_geometry.max_node_ids,
+        )
 
-    return cost_functional
+    return CostFunctional(contact_functional, dimension=DIMENSION)
 
 
 def make_cost_functional_2023(  # TODO #97
@@ -286,15 +585,13 @@ def make_cost_functional_2023(  # TODO #97
     h_functional = njit(h_functional)
 
     @numba.njit()
-    def contact_cost_functional(v_vector, u_vector_old, nodes, contact_boundary, contact_normals):
+    def contact_cost_functional(v_vector, u_vector_old, surfaces, measures, normals, max_node_ids):
         cost = 0
         offset = len(v_vector) // DIMENSION
 
-        for ei, edge in enumerate(contact_boundary):
+        for ei, edge in enumerate(surfaces):
             n_id_0 = edge[0]
             n_id_1 = edge[1]
-            n_0 = nodes[n_id_0]
-            n_1 = nodes[n_id_1]
 
             # ASSUMING `u_vector` and `nodes` have the same order!
             vm = interpolate_node_between_2023(n_id_0, n_id_1, v_vector)
@@ -302,7 +599,7 @@ def make_cost_functional_2023(  # TODO #97
             um_old = interpolate_node_between_2023(n_id_0, n_id_1, u_vector_old)
             um_old_2 = interpolate_node_between_2023(n_id_1, n_id_0, u_vector_old)
 
-            normal_vector = contact_normals[ei]
+            normal_vector = normals[ei]
 
             vm_normal = (vm * normal_vector).sum()
             um_old_normal = (um_old * normal_vector).sum()
@@ -311,10 +608,10 @@ def make_cost_functional_2023(  # TODO #97
             um_old_normal_2 = (um_old_2 * normal_vector).sum()
             vm_tangential_2 = vm_2 - vm_normal * normal_vector
 
-            if n_id_0 < offset and n_id_1 < offset:
+            if max_node_ids[ei] < offset:
                 cost += (
                     0.5
-                    * nph.length(n_0, n_1)
+                    * measures[ei]
                     * (
                         jn(um_old_normal) * vm_normal
                         + h_functional(um_old_normal) * jt(vm_tangential)
@@ -324,17 +621,18 @@ def make_cost_functional_2023(  # TODO #97
                 )
         return cost
 
-    @numba.njit()
-    def cost_functional(
-        v_vector, nodes, contact_boundary, contact_normals, lhs, rhs, u_vector_old, dt
-    ):
+    def contact_functional(v_vector, contact_geometry, u_vector_old, dt):
         u_vector = u_vector_old + dt * v_vector
-        ju = contact_cost_functional(v_vector, u_vector, nodes, contact_boundary, contact_normals)
-        result = 0.5 * np.dot(np.dot(lhs, v_vector), v_vector) - np.dot(rhs, v_vector) + ju
-        result = np.asarray(result).ravel()
-        return result
+        return contact_cost_functional(
+            v_vector,
+            u_vector,
+            contact_geometry.surfaces,
+            contact_geometry.measures,
+            contact_geometry.normals,
+            contact_geometry.max_node_ids,
+        )
 
-    return cost_functional
+    return CostFunctional(contact_functional, dimension=DIMENSION)
 
 
 def make_cost_functional_temperature(
@@ -349,49 +647,43 @@ def make_cost_functional_temperature(
     heat_exchange = njit(heat_exchange)
 
     @numba.njit()
-    def contact_cost_functional(u_vector, nodes, contact_boundary, contact_normals, temp_vector):
+    def contact_cost_functional(u_vector, surfaces, measures, normals, max_node_ids, temp_vector):
         cost = 0
         offset = len(u_vector) // DIMENSION
 
-        for ei, edge in enumerate(contact_boundary):
+        for ei, edge in enumerate(surfaces):
             n_id_0 = edge[0]
             n_id_1 = edge[1]
-            n_0 = nodes[n_id_0]
-            n_1 = nodes[n_id_1]
 
             # ASSUMING `u_vector` and `nodes` have the same order!
             um = interpolate_node_between(n_id_0, n_id_1, u_vector)
             temp_m = interpolate_node_between(n_id_0, n_id_1, temp_vector, dimension=1)
 
-            normal_vector = contact_normals[ei]
+            normal_vector = normals[ei]
 
             um_normal = (um * normal_vector).sum()
             um_tangential = um - um_normal * normal_vector
 
-            if n_id_0 < offset and n_id_1 < offset:
+            if max_node_ids[ei] < offset:
                 # cost += edgeLength * (hn(uNmL, tmL)
                 #      + h(np.linalg.norm(np.asarray((uTmLx, uTmLy)))) * ht(uNmL, tmL))
-                cost += nph.length(n_0, n_1) * (
+                cost += measures[ei] * (
                     h_functional(np.linalg.norm(um_tangential)) - heat_exchange(temp_m[0])
                 )
         return cost
 
     # pylint: disable=unused-argument # 'dt'
-    @numba.njit()
-    def cost_functional(
-        temp_vector, nodes, contact_boundary, contact_normals, lhs, rhs, u_vector, dt
-    ):
-        result = (
-            0.5 * np.dot(np.dot(lhs, temp_vector), temp_vector)
-            - np.dot(rhs, temp_vector)
-            - contact_cost_functional(
-                u_vector, nodes, contact_boundary, contact_normals, temp_vector
-            )
+    def contact_functional(temp_vector, contact_geometry, u_vector, dt):
+        return -contact_cost_functional(
+            u_vector,
+            contact_geometry.surfaces,
+            contact_geometry.measures,
+            contact_geometry.normals,
+            contact_geometry.max_node_ids,
+            temp_vector,
         )
-        result = np.asarray(result).ravel()
-        return result
 
-    return cost_functional
+    return CostFunctional(contact_functional, dimension=1)
 
 
 def make_cost_functional_piezoelectricity(
@@ -406,47 +698,41 @@ def make_cost_functional_piezoelectricity(
     electric_charge_exchange = njit(electric_charge_exchange)
 
     @numba.njit()
-    def contact_cost_functional(u_vector, nodes, contact_boundary, contact_normals, temp_vector):
+    def contact_cost_functional(u_vector, surfaces, measures, normals, max_node_ids, temp_vector):
         cost = 0
         offset = len(u_vector) // DIMENSION
 
-        for ei, edge in enumerate(contact_boundary):
+        for ei, edge in enumerate(surfaces):
             n_id_0 = edge[0]
             n_id_1 = edge[1]
-            n_0 = nodes[n_id_0]
-            n_1 = nodes[n_id_1]
 
             # ASSUMING `u_vector` and `nodes` have the same order!
             um = interpolate_node_between(n_id_0, n_id_1, u_vector)
             temp_m = interpolate_node_between(n_id_0, n_id_1, temp_vector, dimension=1)
 
-            normal_vector = contact_normals[ei]
+            normal_vector = normals[ei]
 
             um_normal = (um * normal_vector).sum()
             um_tangential = um - um_normal * normal_vector
 
-            if n_id_0 < offset and n_id_1 < offset:
+            if max_node_ids[ei] < offset:
                 # cost += edgeLength * (hn(uNmL, tmL)
                 #      + h(np.linalg.norm(np.asarray((uTmLx, uTmLy)))) * ht(uNmL, tmL))
-                cost += nph.length(n_0, n_1) * (
+                cost += measures[ei] * (
                     h_functional(np.linalg.norm(um_tangential))
                     - electric_charge_exchange(temp_m[0])
                 )
         return cost
 
     # pylint: disable=unused-argument # 'dt'
-    @numba.njit()
-    def cost_functional(
-        temp_vector, nodes, contact_boundary, contact_normals, lhs, rhs, u_vector, dt
-    ):
-        result = (
-            0.5 * np.dot(np.dot(lhs, temp_vector), temp_vector)
-            - np.dot(rhs, temp_vector)
-            - contact_cost_functional(
-                u_vector, nodes, contact_boundary, contact_normals, temp_vector
-            )
+    def contact_functional(temp_vector, contact_geometry, u_vector, dt):
+        return -contact_cost_functional(
+            u_vector,
+            contact_geometry.surfaces,
+            contact_geometry.measures,
+            contact_geometry.normals,
+            contact_geometry.max_node_ids,
+            temp_vector,
         )
-        result = np.asarray(result).ravel()
-        return result
 
-    return cost_functional
+    return CostFunctional(contact_functional, dimension=1)
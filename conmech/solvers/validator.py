@@ -27,9 +27,7 @@ class Validator:
         quality_inv = np.linalg.norm(
             self.rhs(
                 solution,
-                state.body.mesh.nodes,
-                state.body.mesh.contact_boundary,
-                state.body.mesh.boundaries.contact_normals,
+                state.body.mesh.boundaries.contact_geometry,
                 self.elasticity,
                 state.body.dynamics.force.integrate(time=state.time),
             )
@@ -0,0 +1,127 @@
+"""
+Created at 18.10.2026
+"""
+import json
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from conmech.state import state as state_module
+from conmech.state.state import State
+from conmech.state.trajectory import Trajectory
+
+INDEX_FILE = "index.json"
+MESH_FILE = "mesh.npz"
+
+
+class ResultsWriter:
+    """
+    Writes results of a simulation into directory `path`:
+    mesh topology once (`mesh.npz`), each field as a binary file of consecutive time slices,
+    appended in chunks of `chunk_size` steps, and `index.json` describing their layout.
+
+    Unlike pickled states, files do not hold body, mesh and dynamics objects,
+    so that they can be read partially by `ResultsReader`.
+    """
+
+    def __init__(self, path: str, body, chunk_size: int = 16):
+        self.path: str = path
+        self.chunk_size: int = chunk_size
+        self.index: Dict = {"count": 0, "time": [], "penetration": [], "fields": {}}
+        self._chunk: Dict[str, List[np.ndarray]] = {}
+        os.makedirs(path, exist_ok=True)
+        np.savez(
+            os.path.join(path, MESH_FILE),
+            nodes=body.mesh.nodes,
+            elements=body.mesh.elements,
+            nodes_count=body.mesh.nodes_count,
+        )
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, state: State) -> None:
+        if not self.index["fields"]:
+            self.index["state_class"] = type(state).__name__
+            self.index["fields"] = {
+                name: list(np.shape(getattr(state, name)))
+                for name in Trajectory.FIELDS
+                if hasattr(state, name)
+            }
+            self._chunk = {name: [] for name in self.index["fields"]}
+        for name, chunk in self._chunk.items():
+            chunk.append(np.asarray(getattr(state, name), dtype=np.float64))
+        self.index["time"].append(float(state.time))
+        self.index["penetration"].append(float(state.penetration))
+        if len(self.index["time"]) - self.index["count"] >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        for name, chunk in self._chunk.items():
+            if chunk:
+                with open(os.path.join(self.path, f"{name}.bin"), "ab") as file:
+                    file.write(np.stack(chunk).tobytes())
+                chunk.clear()
+        self.index["count"] = len(self.index["time"])
+        # index is replaced at once, so that it never describes partially written data
+        index_path = os.path.join(self.path, INDEX_FILE)
+        with open(index_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(self.index, file)
+        os.replace(index_path + ".tmp", index_path)
+
+    def close(self) -> None:
+        self.flush()
+
+
+class ResultsReader:
+    """
+    Lazy reader of results written by `ResultsWriter`. Fields are memory-mapped,
+    so only the time slices which are used are loaded.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        with open(os.path.join(path, INDEX_FILE), encoding="utf-8") as file:
+            index = json.load(file)
+        self.count: int = index["count"]
+        self.time: np.ndarray = np.asarray(index["time"][: self.count])
+        self.penetration: np.ndarray = np.asarray(index["penetration"][: self.count])
+        self.field_shapes: Dict[str, tuple] = {
+            name: tuple(shape) for name, shape in index["fields"].items()
+        }
+        self.state_class = getattr(state_module, index.get("state_class", "State"))
+        self._mesh: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mesh(self) -> Dict[str, np.ndarray]:
+        """Nodes and elements of the mesh the results are computed on."""
+        if self._mesh is None:
+            with np.load(os.path.join(self.path, MESH_FILE)) as mesh:
+                self._mesh = dict(mesh)
+        return self._mesh
+
+    def field(self, name: str) -> np.ndarray:
+        """All time slices of field `name` (steps x nodes x ...), memory-mapped."""
+        if name not in self.field_shapes:
+            raise KeyError(f"No field {name} in results")
+        return np.memmap(
+            os.path.join(self.path, f"{name}.bin"),
+            dtype=np.float64,
+            mode="r",
+            shape=(self.count, *self.field_shapes[name]),
+        )
+
+    def state(self, step: int, body) -> State:
+        """State at given step, as a view of memory-mapped fields, for a body on the same mesh."""
+        return self.state_class.view(
+            body,
+            time=float(self.time[step]),
+            **{name: self.field(name)[step] for name in self.field_shapes},
+        )
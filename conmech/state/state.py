@@ -21,6 +21,24 @@ class State:
         self.constitutive_law = None
         self.time: float = 0
 
+    @classmethod
+    def view(cls, body, time: float, **fields: np.ndarray) -> "State":
+        """
+        State using given arrays (e.g. stored by `Trajectory`) as its fields, without
+        allocating its own ones.
+        """
+        state = cls.__new__(cls)
+        state.body = body
+        state.setup = None
+        state.__stress = None  # pylint: disable=unused-private-member
+        state.constitutive_law = None
+        state.time = time
+        for name, values in fields.items():
+            setattr(state, name, values)
+        state.displaced_nodes = np.copy(body.mesh.nodes)
+        state.displaced_nodes[: body.mesh.nodes_count, :] += state.displacement
+        return state
+
     def set_displacement(
         self, displacement_vector: np.ndarray, time: float, *, update_absement: bool = False
     ):
@@ -0,0 +1,72 @@
+"""
+Created at 18.10.2026
+"""
+import os
+from typing import Dict, Iterator, List, Optional, Type, Union
+
+import numpy as np
+
+from conmech.state.state import State
+
+
+class Trajectory:
+    """
+    States at consecutive output steps of a simulation, stored in contiguous preallocated arrays
+    (outputs x nodes x dim for vector fields) instead of a list of copied states.
+
+    Solvers `append` their state in place and states are exposed on demand as lightweight views
+    of stored arrays. With `path` given, arrays are memory-mapped `.npy` files in that directory,
+    one per field, so long simulations do not have to fit in memory.
+    """
+
+    FIELDS = ("displacement", "velocity", "absement", "temperature", "electric_potential")
+
+    def __init__(self, state: State, outputs_count: int, path: Optional[str] = None):
+        self.body = state.body
+        self.state_class: Type[State] = type(state)
+        self.path: Optional[str] = path
+        self.count: int = 0
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+        self.time: np.ndarray = self._allocate("time", (outputs_count,))
+        self.penetration: np.ndarray = self._allocate("penetration", (outputs_count,))
+        self.fields: Dict[str, np.ndarray] = {
+            name: self._allocate(name, (outputs_count, *np.shape(getattr(state, name))))
+            for name in self.FIELDS
+            if hasattr(state, name)
+        }
+
+    def _allocate(self, name: str, shape: tuple) -> np.ndarray:
+        if self.path is None:
+            return np.zeros(shape)
+        return np.lib.format.open_memmap(
+            os.path.join(self.path, f"{name}.npy"), mode="w+", dtype=np.float64, shape=shape
+        )
+
+    def append(self, state: State) -> None:
+        if self.count == len(self.time):
+            raise IndexError("Trajectory is full")
+        for name, values in self.fields.items():
+            values[self.count] = getattr(state, name)
+        self.time[self.count] = state.time
+        self.penetration[self.count] = state.penetration
+        self.count += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[State, List[State]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if not -self.count <= index < self.count:
+            raise IndexError(f"Trajectory index out of range: {index}")
+        index %= self.count
+        return self.state_class.view(
+            self.body,
+            time=float(self.time[index]),
+            **{name: values[index] for name, values in self.fields.items()},
+        )
+
+    def __iter__(self) -> Iterator[State]:
+        return (self[index] for index in range(self.count))
@@ -1,8 +1,6 @@
 """
 Created at 21.10.2022
 """
-import _pickle
-import pickle
 from dataclasses import dataclass
 
 import numpy as np
@@ -14,6 +12,7 @@ from conmech.plotting.drawer import Drawer
 from conmech.scenarios.problems import ContactLaw, QuasistaticDisplacementProblem
 from conmech.simulations.problem_solver import TimeDependentSolver as QuasistaticProblemSolver
 from conmech.properties.mesh_description import JOB2023MeshDescription
+from conmech.state.results import ResultsReader, ResultsWriter
 from examples.utils import viscoelastic_constitutive_law
 
 
@@ -124,13 +123,8 @@ def main(config: Config):
     if not config.test:
         try:
             for name in names:
-                if name == names[0]:
-                    steps = (0, *output_steps[1:])
-                else:
-                    steps = output_steps[1:]
-                for time_step in steps:
-                    with open(f"{path}/{name}_t_{time_step}_h_{h}", "rb") as output:
-                        _ = pickle.load(output)
+                if len(ResultsReader(f"{path}/{name}_h_{h}")) != len(output_steps):
+                    simulate = True
         except Exception:
             simulate = True
     else:
@@ -163,17 +157,13 @@ def main(config: Config):
                 initial_displacement=setup.initial_displacement,
                 initial_velocity=setup.initial_velocity,
             )
-            for state in states:
-                with open(
-                    f"{path}/{name}_t_{int(state.time//setup.time_step)}_h_{h}", "wb+"
-                ) as output:
-                    # Workaround
-                    state.body.dynamics.force.outer.source = None
-                    state.body.dynamics.force.inner.source = None
-                    pickle.dump(state, output)
+            with ResultsWriter(f"{path}/{name}_h_{h}", runner.body) as results:
+                for state in states:
+                    results.append(state)
 
     for name in names:
-        boundaries = four_screws
+        # boundaries determine order of mesh nodes, so they are the ones results are computed with
+        boundaries = four_screws if name == "four_screws" else one_screw
         contact_law = soft_foundation()
         setup = make_setup(
             mesh_descr_=mesh_descr,
@@ -181,16 +171,13 @@ def main(config: Config):
             contact_law_=contact_law,
             friction_bound_=friction_bound,
         )
-        if name == names[0]:
-            steps = (0, *output_steps[1:])
-        else:
-            steps = output_steps[1:]
-        for time_step in steps:
-            with open(f"{path}/{name}_t_{time_step}_h_{h}", "rb") as output:
-                state = pickle.load(output)
-                # Workaround
-                state.body.dynamics.force.outer.source = setup.outer_forces
-                state.body.dynamics.force.inner.source = setup.inner_forces
+        # states are read for a body on the same mesh
+        body = QuasistaticProblemSolver(setup, "schur").body
+        results = ResultsReader(f"{path}/{name}_h_{h}")
+        for step, time_step in enumerate(output_steps):
+            if time_step == 0 and name != names[0]:
+                continue
+            state = results.state(step, body)
             if time_step == 0:
                 drawer = Drawer(state=state, config=config)
                 drawer.node_size = 1
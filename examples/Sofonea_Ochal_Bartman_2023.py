@@ -16,7 +16,6 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301,
 # USA.
-import pickle
 from dataclasses import dataclass
 
 import numpy as np
@@ -30,6 +29,7 @@ from conmech.plotting.drawer import Drawer
 from conmech.scenarios.problems import RelaxationQuasistaticProblem
 from conmech.simulations.problem_solver import QuasistaticRelaxation
 from conmech.properties.mesh_description import SOB2023MeshDescription
+from conmech.state.results import ResultsReader, ResultsWriter
 
 from examples.p_slope_contact_law import make_const_contact_law
 from examples.utils import elastic_relaxation_constitutive_law
@@ -148,20 +148,13 @@ def main(config: Config):
     simulate = config.force
     try:
         for name in examples.keys():
-            steps = examples[name]["output_steps"]
-            with open(f"{config.outputs_path}/{name}_h_{h}_global", "rb") as output:
-                _ = pickle.load(output)
-
-            with open(f"{config.outputs_path}/{name}_h_{h}_penetration", "rb") as output:
-                _ = pickle.load(output)
-
-            for time_step in steps:
-                with open(f"{config.outputs_path}/{name}_t_{time_step}_h_{h}", "rb") as output:
-                    _ = pickle.load(output)
+            np.load(f"{config.outputs_path}/{name}_h_{h}_global.npy")
+            np.load(f"{config.outputs_path}/{name}_h_{h}_penetration.npy")
+            results = ResultsReader(f"{config.outputs_path}/{name}_h_{h}")
+            if len(results) != len(examples[name]["output_steps"]):
+                simulate = True
     except IOError:
         simulate = True
-    except EOFError:
-        simulate = True
 
     if simulate:
         for name in examples.keys():
@@ -182,118 +175,98 @@ def main(config: Config):
             )
             f_max = -np.inf
             f_min = np.inf
-            for state in states:
-                state.setup = setup
-                state.constitutive_law = elastic_relaxation_constitutive_law
-                f_max = max(f_max, np.max(state.stress_x))
-                f_min = min(f_min, np.min(state.stress_x))
-                with open(
-                    f"{config.outputs_path}/{name}_t_{int(state.time // setup.time_step)}_h_{h}",
-                    "wb+",
-                ) as output:
-                    # Workaround
-                    relaxation = state.body.dynamics.relaxation
-                    state.body.dynamics.force.outer.source = None
-                    state.body.dynamics.force.inner.source = None
-                    state.body.properties.relaxation = None
-                    state.setup = None
-                    state.constitutive_law = None
-                    pickle.dump(state, output)
-                    state.body.dynamics.relaxation = relaxation
-            with open(
-                f"{config.outputs_path}/{name}_h_{h}_penetration",
-                "wb+",
-            ) as output:
-                pickle.dump(runner.penetration, output)
-            with open(
-                f"{config.outputs_path}/{name}_h_{h}_global",
-                "wb+",
-            ) as output:
-                pickle.dump([f_min, f_max], output)
+            with ResultsWriter(f"{config.outputs_path}/{name}_h_{h}", runner.body) as results:
+                for state in states:
+                    state.setup = setup
+                    state.constitutive_law = elastic_relaxation_constitutive_law
+                    f_max = max(f_max, np.max(state.stress_x))
+                    f_min = min(f_min, np.min(state.stress_x))
+                    results.append(state)
+            np.save(f"{config.outputs_path}/{name}_h_{h}_penetration.npy", runner.penetration)
+            np.save(f"{config.outputs_path}/{name}_h_{h}_global.npy", [f_min, f_max])
 
     plots(setup, h, examples, config)
 
     for name in examples.keys():
-        steps = examples[name]["output_steps"]
-        with open(f"{config.outputs_path}/{name}_h_{h}_global", "rb") as output:
-            f_limits = pickle.load(output)
-
-        for time_step in steps:
-            with open(f"{config.outputs_path}/{name}_t_{time_step}_h_{h}", "rb") as output:
-                state = pickle.load(output)
-                # Workaround
-                state.body.dynamics.force.outer.source = examples[name]["outer_forces"]
-                state.body.dynamics.relaxation = examples[name]["relaxation"]
-                state.setup = setup
-                state.constitutive_law = elastic_relaxation_constitutive_law
-
-                drawer = Drawer(state=state, config=config)
-                drawer.node_size = 0
-                drawer.original_mesh_color = None
-                drawer.deformed_mesh_color = "black"
-                drawer.normal_stress_scale = 10
-                drawer.field_name = None
-                drawer.xlabel = "x"
-                drawer.ylabel = "y"
-
-                if time_step == 0:
-                    fig, axes = plt.subplots(1, 1)
-                    axes = (axes,)
-                    drawer.outer_forces_scale = -1
-                    plt.title("Reference configuration")
-                    # to have nonzero force interface on Neumann boundary.
-                    state.time = 4
-                else:
-                    drawer.outer_forces_scale = fv
-                    fig, axes = plt.subplots(1, 2)
-                    drawer.x_min = 3.4
-                    drawer.x_max = 5.6
-                    drawer.y_min = -1
-                    drawer.y_max = 1.5
-                    drawer.ylabel = None
-                    drawer.draw(
-                        fig_axes=(fig, axes[1]),
-                        show=False,
-                        field_min=f_limits[0],
-                        field_max=f_limits[1],
-                        save=False,
-                    )
-                    drawer.ylabel = "y"
-                    axes[1].axis("on")
-                    axes[1].tick_params(left=True, bottom=True, labelleft=True, labelbottom=True)
-                    axes[1].set_aspect("equal", adjustable="box")
-                    zoom_outside(axes[0], [3, -1.5, 6, 2], axes[1], color="gray")
-
-                    fig.suptitle(f"time: {state.time:.2f}")
-                drawer.x_min = 0
-                drawer.x_max = 5.0
-                drawer.y_min = -0.9
-                drawer.y_max = 4.9
+        f_limits = np.load(f"{config.outputs_path}/{name}_h_{h}_global.npy")
+        setup.outer_forces = examples[name]["outer_forces"]
+        setup.relaxation = examples[name]["relaxation"]
+        # states are read for a body on the same mesh
+        body = QuasistaticRelaxation(setup, solving_method="schur").body
+        results = ResultsReader(f"{config.outputs_path}/{name}_h_{h}")
+
+        for step, time_step in enumerate(examples[name]["output_steps"]):
+            state = results.state(step, body)
+            state.setup = setup
+            state.constitutive_law = elastic_relaxation_constitutive_law
+
+            drawer = Drawer(state=state, config=config)
+            drawer.node_size = 0
+            drawer.original_mesh_color = None
+            drawer.deformed_mesh_color = "black"
+            drawer.normal_stress_scale = 10
+            drawer.field_name = None
+            drawer.xlabel = "x"
+            drawer.ylabel = "y"
+
+            if time_step == 0:
+                fig, axes = plt.subplots(1, 1)
+                axes = (axes,)
+                drawer.outer_forces_scale = -1
+                plt.title("Reference configuration")
+                # to have nonzero force interface on Neumann boundary.
+                state.time = 4
+            else:
+                drawer.outer_forces_scale = fv
+                fig, axes = plt.subplots(1, 2)
+                drawer.x_min = 3.4
+                drawer.x_max = 5.6
+                drawer.y_min = -1
+                drawer.y_max = 1.5
+                drawer.ylabel = None
                 drawer.draw(
-                    fig_axes=(fig, axes[0]),
+                    fig_axes=(fig, axes[1]),
                     show=False,
                     field_min=f_limits[0],
                     field_max=f_limits[1],
                     save=False,
                 )
-                if time_step == 0:
-                    axes[0].annotate("$\Gamma_1$", xy=(0, 0), xytext=(0.33, -0.50), fontsize=18)
-                    position = (3.66, 4.5)
-                    axes[0].annotate("$\Gamma_2$", xy=(0, 0), xytext=position, fontsize=18)
-                    axes[0].add_patch(Rectangle(position, 0.3, 0.3, color="white"))
-                    axes[0].annotate("$\Gamma_2$", xy=(0, 0), xytext=(2.33, 3.0), fontsize=18)
-                    axes[0].annotate("$\mathbf{f}_2$", xy=(0, 0), xytext=(2.5, 5.00), fontsize=15)
-                    axes[0].annotate("$\Gamma_3$", xy=(0, 0), xytext=(4.33, -0.50), fontsize=18)
-                axes[0].axis("on")
-                axes[0].tick_params(left=True, bottom=True, labelleft=True, labelbottom=True)
-                axes[0].set_aspect("equal", adjustable="box")
-
-                fig.tight_layout(rect=[0, 0, 1, 1.2])
-                plt.subplots_adjust(wspace=0.4, top=1.25)
-                if config.show:
-                    plt.show()
-                if config.save:
-                    drawer.save_plot("pdf", name=f"{name}_{time_step}")
+                drawer.ylabel = "y"
+                axes[1].axis("on")
+                axes[1].tick_params(left=True, bottom=True, labelleft=True, labelbottom=True)
+                axes[1].set_aspect("equal", adjustable="box")
+                zoom_outside(axes[0], [3, -1.5, 6, 2], axes[1], color="gray")
+
+                fig.suptitle(f"time: {state.time:.2f}")
+            drawer.x_min = 0
+            drawer.x_max = 5.0
+            drawer.y_min = -0.9
+            drawer.y_max = 4.9
+            drawer.draw(
+                fig_axes=(fig, axes[0]),
+                show=False,
+                field_min=f_limits[0],
+                field_max=f_limits[1],
+                save=False,
+            )
+            if time_step == 0:
+                axes[0].annotate("$\Gamma_1$", xy=(0, 0), xytext=(0.33, -0.50), fontsize=18)
+                position = (3.66, 4.5)
+                axes[0].annotate("$\Gamma_2$", xy=(0, 0), xytext=position, fontsize=18)
+                axes[0].add_patch(Rectangle(position, 0.3, 0.3, color="white"))
+                axes[0].annotate("$\Gamma_2$", xy=(0, 0), xytext=(2.33, 3.0), fontsize=18)
+                axes[0].annotate("$\mathbf{f}_2$", xy=(0, 0), xytext=(2.5, 5.00), fontsize=15)
+                axes[0].annotate("$\Gamma_3$", xy=(0, 0), xytext=(4.33, -0.50), fontsize=18)
+            axes[0].axis("on")
+            axes[0].tick_params(left=True, bottom=True, labelleft=True, labelbottom=True)
+            axes[0].set_aspect("equal", adjustable="box")
+
+            fig.tight_layout(rect=[0, 0, 1, 1.2])
+            plt.subplots_adjust(wspace=0.4, top=1.25)
+            if config.show:
+                plt.show()
+            if config.save:
+                drawer.save_plot("pdf", name=f"{name}_{time_step}")
 
 
 def plots(setup, h, examples, config):
@@ -313,8 +286,7 @@ def plots(setup, h, examples, config):
 
     for col, name in enumerate(examples.keys()):
         col = 1 - col
-        with open(f"{config.outputs_path}/{name}_h_{h}_penetration", "rb") as output:
-            pnt = np.asarray(pickle.load(output))
+        pnt = np.load(f"{config.outputs_path}/{name}_h_{h}_penetration.npy")
         t = np.asarray(range(0, examples[name]["n_steps"] + 1)) * setup.time_step
         frc = np.empty((examples[name]["n_steps"] + 1, 1))
         for i, _t in enumerate(t):
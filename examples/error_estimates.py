@@ -1,43 +1,46 @@
 import numba
 import numpy as np
 from scipy import interpolate
-import pickle
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 import seaborn as sns
 import matplotlib.tri as tri
 import matplotlib.pylab as pl
-from conmech.state.state import TemperatureState
+from conmech.state.results import ResultsReader
 
 # TODO #99
 
 
-def compare(ref: TemperatureState, sol: TemperatureState):
+def compare(ref: ResultsReader, sol: ResultsReader):
+    """Errors of the last states of results `sol` with respect to the last ones of `ref`."""
     ut = 0
     tt = 0
-    x = sol.body.mesh.nodes[:, 0]
-    y = sol.body.mesh.nodes[:, 1]
+    x = sol.mesh["nodes"][:, 0]
+    y = sol.mesh["nodes"][:, 1]
+    sol_displacement = sol.field("displacement")[-1]
+    ref_displacement = ref.field("displacement")[-1]
+    ref_temperature = ref.field("temperature")[-1]
 
-    soltri = tri.Triangulation(x, y, triangles=sol.body.mesh.elements)
-    u1hi = tri.LinearTriInterpolator(soltri, sol.displacement[:, 0])
-    u2hi = tri.LinearTriInterpolator(soltri, sol.displacement[:, 1])
-    thi = tri.LinearTriInterpolator(soltri, sol.temperature)
+    soltri = tri.Triangulation(x, y, triangles=sol.mesh["elements"])
+    u1hi = tri.LinearTriInterpolator(soltri, sol_displacement[:, 0])
+    u2hi = tri.LinearTriInterpolator(soltri, sol_displacement[:, 1])
+    thi = tri.LinearTriInterpolator(soltri, sol.field("temperature")[-1])
 
-    for element in ref.body.mesh.elements:
-        x0 = ref.body.mesh.nodes[element[0]]
-        x1 = ref.body.mesh.nodes[element[1]]
-        x2 = ref.body.mesh.nodes[element[2]]
-        u1_0 = ref.displacement[element[0], 0]
-        u1_1 = ref.displacement[element[1], 0]
-        u1_2 = ref.displacement[element[2], 0]
+    for element in ref.mesh["elements"]:
+        x0 = ref.mesh["nodes"][element[0]]
+        x1 = ref.mesh["nodes"][element[1]]
+        x2 = ref.mesh["nodes"][element[2]]
+        u1_0 = ref_displacement[element[0], 0]
+        u1_1 = ref_displacement[element[1], 0]
+        u1_2 = ref_displacement[element[2], 0]
         u1 = u1_0 + u1_1 + u1_2
-        u2_0 = ref.displacement[element[0], 1]
-        u2_1 = ref.displacement[element[1], 1]
-        u2_2 = ref.displacement[element[2], 1]
+        u2_0 = ref_displacement[element[0], 1]
+        u2_1 = ref_displacement[element[1], 1]
+        u2_2 = ref_displacement[element[2], 1]
         u2 = u2_0 + u2_1 + u2_2
-        t0 = ref.temperature[element[0]]
-        t1 = ref.temperature[element[1]]
-        t2 = ref.temperature[element[2]]
+        t0 = ref_temperature[element[0]]
+        t1 = ref_temperature[element[1]]
+        t2 = ref_temperature[element[2]]
         t = t0 + t1 + t2
 
         u1dx, u1dy = calculate_dx_dy(x0, u1_0, x1, u1_1, x2, u1_2)
@@ -88,19 +91,17 @@ if __name__ == "__main__":
     ks = range(kn)
     hs = range(hn)
 
-    # with open(f'output/temp/k_{reference_k_h[0]}_h_{reference_k_h[1]}', 'rb') as output:
-    #     reference = pickle.load(output)
+    # reference = ResultsReader(f'output/temp/k_{reference_k_h[0]}_h_{reference_k_h[1]}')
     #
     # ue = np.empty((kn, hn))
     # te = np.empty((kn, hn))
     # for h in hs:
     #     for k in ks:
-    #         with open(f'output/temp/k_{k}_h_{h}', 'rb') as output:
-    #             solution = pickle.load(output)
-    #             u, t = compare(reference, solution)
-    #             ue[k, h] = u / denominator
-    #             te[k, h] = t / denominator
-    #             print(k, h, u, t)
+    #         solution = ResultsReader(f'output/temp/k_{k}_h_{h}')
+    #         u, t = compare(reference, solution)
+    #         ue[k, h] = u / denominator
+    #         te[k, h] = t / denominator
+    #         print(k, h, u, t)
     # print(repr(ue))
     # print(repr(te))
 
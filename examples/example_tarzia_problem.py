@@ -1,4 +1,3 @@
-import pickle
 from dataclasses import dataclass
 from typing import Optional, Type
 
@@ -9,6 +8,7 @@ from conmech.plotting.drawer import Drawer
 from conmech.scenarios.problems import PoissonProblem, ContactLaw
 from conmech.simulations.problem_solver import PoissonSolver
 from conmech.properties.mesh_description import CrossMeshDescription
+from conmech.state.results import ResultsReader, ResultsWriter
 
 
 def make_slope_contact_law(slope: float) -> Type[ContactLaw]:
@@ -90,35 +90,30 @@ def main(config: Config):
                 draw(config, alpha, ih)
 
 
-def simulate(config, alpha, ih):
-    print(f"Simulate {alpha=}, {ih=}")
+def make_setup(alpha, ih):
     mesh_descr = CrossMeshDescription(
         initial_position=None, max_element_perimeter=1 / ih, scale=[2, 1]
     )
     setup = StaticPoissonSetup(mesh_descr)
     setup.contact_law = make_slope_contact_law(slope=alpha)
+    return setup
+
 
-    runner = PoissonSolver(setup, "global")
+def simulate(config, alpha, ih):
+    print(f"Simulate {alpha=}, {ih=}")
+    runner = PoissonSolver(make_setup(alpha, ih), "global")
 
     state = runner.solve(verbose=True)
 
     if config.outputs_path:
-        with open(
-            f"{config.outputs_path}/alpha_{alpha}_ih_{ih}",
-            "wb+",
-        ) as output:
-            # Workaround
-            state.body.dynamics.force.outer.source = None
-            state.body.dynamics.force.inner.source = None
-            state.body.properties.relaxation = None
-            state.setup = None
-            state.constitutive_law = None
-            pickle.dump(state, output)
+        with ResultsWriter(f"{config.outputs_path}/alpha_{alpha}_ih_{ih}", runner.body) as results:
+            results.append(state)
 
 
 def draw(config, alpha, ih):
-    with open(f"{config.outputs_path}/alpha_{alpha}_ih_{ih}", "rb") as output:
-        state = pickle.load(output)
+    results = ResultsReader(f"{config.outputs_path}/alpha_{alpha}_ih_{ih}")
+    # state is read for a body on the same mesh
+    state = results.state(0, PoissonSolver(make_setup(alpha, ih), "global").body)
     max_ = max(max(state.temperature), 1)
     min_ = min(min(state.temperature), 0)
     drawer = Drawer(state=state, config=config)
@@ -61,6 +61,9 @@ def compute_error(ref: TemperatureState, sol: TemperatureState):
 
 
 class TPSlopeContactLaw(make_slope_contact_law(slope=1e1)):
+    # tangential potential is not the one of the regularised Coulomb subderivative
+    subderivatives_of_potentials = False
+
     @staticmethod
     def potential_normal_direction(u_nu: float) -> float:
         if u_nu <= 0:
@@ -9,6 +9,8 @@ from conmech.scenarios.problems import ContactLaw
 
 def make_slope_contact_law(slope: float) -> Type[ContactLaw]:
     class PSlopeContactLaw(ContactLaw):
+        subderivatives_of_potentials = True
+
         @staticmethod
         def potential_normal_direction(u_nu: float) -> float:
             if u_nu <= 0:
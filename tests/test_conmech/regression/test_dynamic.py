@@ -15,7 +15,7 @@ from examples.p_slope_contact_law import make_slope_contact_law
 from tests.test_conmech.regression.std_boundary import standard_boundary_nodes
 
 
-@pytest.fixture(params=["global optimization", "schur"])  # TODO #28
+@pytest.fixture(params=["global optimization", "schur", "semismooth newton"])  # TODO #28
 def solving_method(request):
     return request.param
 
@@ -14,7 +14,7 @@ from examples.p_slope_contact_law import make_slope_contact_law
 from tests.test_conmech.regression.std_boundary import standard_boundary_nodes
 
 
-@pytest.fixture(params=["direct", "global optimization", "schur"])
+@pytest.fixture(params=["direct", "global optimization", "schur", "semismooth newton"])
 def solving_method(request):
     return request.param
 
@@ -0,0 +1,143 @@
+"""
+Problem setups shared by unit tests: linear elastic rectangle [0, 2] x [0, 1],
+in contact at the bottom and clamped on the left side.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from conmech.mesh.boundaries_description import BoundariesDescription
+from conmech.properties.mesh_description import RectangleMeshDescription
+from conmech.scenarios.problems import (
+    DynamicDisplacementProblem,
+    QuasistaticDisplacementProblem,
+    RelaxationQuasistaticProblem,
+    StaticDisplacementProblem,
+)
+from conmech.simulations.problem_solver import TimeDependentSolver
+from conmech.state.trajectory import Trajectory
+from examples.p_slope_contact_law import make_slope_contact_law
+
+
+def rectangle(max_element_perimeter: float = 0.5) -> RectangleMeshDescription:
+    return RectangleMeshDescription(
+        initial_position=None, max_element_perimeter=max_element_perimeter, scale=[2, 1]
+    )
+
+
+@dataclass()
+class StaticSetup(StaticDisplacementProblem):
+    mu_coef: ... = 4
+    la_coef: ... = 4
+    contact_law: ... = make_slope_contact_law(slope=1)
+
+    @staticmethod
+    def inner_forces(x, t=None):
+        return np.array([-0.2, -0.8])
+
+    @staticmethod
+    def outer_forces(x, t=None):
+        return 0 * x
+
+    @staticmethod
+    def friction_bound(u_nu):
+        return 0
+
+    boundaries: ... = BoundariesDescription(
+        contact=lambda x: x[1] == 0, dirichlet=lambda x: x[0] == 0
+    )
+
+
+@dataclass()
+class QuasistaticSetup(QuasistaticDisplacementProblem):
+    mu_coef: ... = 4
+    la_coef: ... = 4
+    th_coef: ... = 4
+    ze_coef: ... = 4
+    time_step: ... = 0.1
+    contact_law: ... = make_slope_contact_law(slope=1)
+
+    @staticmethod
+    def inner_forces(x, t=None):
+        return np.array([-0.2, -0.8])
+
+    @staticmethod
+    def outer_forces(x, t=None):
+        return 0 * x
+
+    @staticmethod
+    def friction_bound(u_nu):
+        return 0
+
+    boundaries: ... = StaticSetup.boundaries
+
+
+@dataclass()
+class DynamicSetup(DynamicDisplacementProblem):
+    mu_coef: ... = 4
+    la_coef: ... = 4
+    th_coef: ... = 4
+    ze_coef: ... = 4
+    time_step: ... = 0.1
+    contact_law: ... = make_slope_contact_law(slope=1)
+
+    @staticmethod
+    def inner_forces(x, t=None):
+        return np.array([-0.2, -0.8])
+
+    @staticmethod
+    def outer_forces(x, t=None):
+        return 0 * x
+
+    @staticmethod
+    def friction_bound(u_nu):
+        return 0
+
+    boundaries: ... = StaticSetup.boundaries
+
+
+def solve_quasistatic(**kwargs) -> Trajectory:
+    """Four steps of `QuasistaticSetup`, with states of the second and the last one output."""
+    setup = QuasistaticSetup(mesh_descr=rectangle())
+    runner = TimeDependentSolver(setup, solving_method="schur")
+    return runner.solve(
+        n_steps=4,
+        output_step=(2, 4),
+        initial_displacement=setup.initial_displacement,
+        initial_velocity=setup.initial_velocity,
+        **kwargs,
+    )
+
+
+RELAXATION = np.array(
+    [
+        [[2.0, 0.0], [1.0, 1.0]],
+        [[1.0, 1.0], [0.0, 2.0]],
+    ]
+)
+
+
+@dataclass()
+class RelaxationSetup(RelaxationQuasistaticProblem):
+    mu_coef: ... = 4
+    la_coef: ... = 4
+    time_step: ... = 0.1
+    contact_law: ... = make_slope_contact_law(slope=1)
+
+    @staticmethod
+    def relaxation(t: float) -> np.ndarray:
+        return RELAXATION
+
+    @staticmethod
+    def inner_forces(x, t=None):
+        return np.array([-0.2, -0.8])
+
+    @staticmethod
+    def outer_forces(x, t=None):
+        return 0 * x
+
+    @staticmethod
+    def friction_bound(u_nu):
+        return 0
+
+    boundaries: ... = StaticSetup.boundaries
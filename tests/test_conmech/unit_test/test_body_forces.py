@@ -0,0 +1,55 @@
+import numba
+import numpy as np
+import pytest
+
+from conmech.helpers.pointwise import vectorized
+from conmech.scene.body_forces import FieldSource, separable
+from conmech.simulations.problem_solver import StaticSolver
+from tests.test_conmech.unit_test.setups import StaticSetup, rectangle
+
+
+def per_node_source(x, t=None):
+    return np.array([x[0] * t, -x[1]])
+
+
+@vectorized
+def vectorized_source(x, t=None):
+    return np.stack((x[:, 0] * t, -x[:, 1]), axis=1)
+
+
+@pytest.mark.parametrize("source", (vectorized_source, numba.njit(per_node_source)))
+def test_node_source(source):
+    # Arrange
+    nodes = np.random.default_rng(0).random((20, 2))
+    expected = FieldSource(per_node_source).node_source(nodes, 0.5)
+
+    # Act
+    values = FieldSource(source).node_source(nodes, 0.5)
+
+    # Assert
+    np.testing.assert_allclose(values, expected)
+
+
+def test_separable_sources_integrated_once():
+    # Arrange
+    setup = StaticSetup(mesh_descr=rectangle())
+    setup.inner_forces = lambda x, t=None: np.array([-0.2, -0.8]) * np.sin(t)
+    setup.outer_forces = lambda x, t=None: np.array([x[0], 0.0]) * np.sin(t)
+    forces = StaticSolver(setup, "direct").body.dynamics.force
+    expected = [forces.integrate(time) for time in (0.5, 1.0)]
+    calls = []
+
+    @vectorized
+    def spatial_outer_forces(x):
+        calls.append(len(x))
+        return np.stack((x[:, 0], np.zeros(len(x))), axis=1)
+
+    forces.inner.source = separable(lambda x: np.array([-0.2, -0.8]), np.sin)
+    forces.outer.source = separable(spatial_outer_forces, np.sin)
+
+    # Act
+    integrated = [forces.integrate(time) for time in (0.5, 1.0)]
+
+    # Assert
+    np.testing.assert_allclose(integrated, expected)
+    assert len(calls) == 1
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+import scipy.optimize
+from scipy import sparse
+
+from conmech.mesh.boundaries import ContactGeometry
+from conmech.solvers.solver_methods import (
+    make_cost_functional,
+    make_cost_functional_3d,
+    make_cost_functional_poisson,
+)
+from examples.p_slope_contact_law import make_slope_contact_law
+
+RHO = 1e-7
+
+
+def regularized_tangential_potential(u_tau):
+    # potential of the regularised Coulomb subderivative of the slope contact law
+    return np.sqrt(u_tau[0] * u_tau[0] + u_tau[1] * u_tau[1] + RHO**2)
+
+
+def friction_bound(u_nu):
+    return 0.3
+
+
+@pytest.mark.parametrize("subderivatives", (False, True))
+def test_cost_functional_derivatives(subderivatives):
+    # Arrange
+    nodes = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [0.0, 1.0], [1.0, 1.0], [2.0, 1.0]])
+    contact_boundary = np.array([[0, 1], [1, 2]])
+    contact_normals = np.array([[0.0, -1.0], [0.0, -1.0]])
+    random = np.random.default_rng(0)
+    matrix = random.random((12, 12))
+    lhs = sparse.csr_matrix(matrix @ matrix.T + np.eye(12))
+    rhs = random.random(12)
+    x = random.random(12) - 0.5
+    direction = random.random(12)
+    contact_geometry = ContactGeometry.from_surfaces(nodes, contact_boundary, contact_normals)
+    args = (contact_geometry, lhs, rhs, np.zeros(12), 0.1)
+    contact_law = make_slope_contact_law(slope=10)
+    cost_functional = make_cost_functional(
+        jn=contact_law.potential_normal_direction,
+        jt=regularized_tangential_potential,
+        h_functional=friction_bound,
+        jn_derivative=contact_law.subderivative_normal_direction if subderivatives else None,
+        jt_derivative=contact_law.regularized_subderivative_tangential_direction
+        if subderivatives
+        else None,
+    )
+
+    # Act
+    gradient = cost_functional.jac(x, *args)
+    hessian_product = cost_functional.hessp(x, direction, *args)
+
+    # Assert
+    expected_gradient = scipy.optimize.approx_fprime(x, lambda y: cost_functional(y, *args)[0])
+    np.testing.assert_allclose(gradient, expected_gradient, atol=1e-5)
+    step = 1e-6
+    expected_hessian_product = (
+        cost_functional.jac(x + step * direction, *args)
+        - cost_functional.jac(x - step * direction, *args)
+    ) / (2 * step)
+    np.testing.assert_allclose(hessian_product, expected_hessian_product, atol=1e-4)
+
+
+def test_cost_functionals_without_contact_kernels():
+    # Arrange
+    contact_law = make_slope_contact_law(slope=10)
+
+    # Act
+    cost_functionals = (
+        make_cost_functional(jn=contact_law.potential_normal_direction),
+        make_cost_functional_3d(jn=contact_law.potential_normal_direction),
+        make_cost_functional_poisson(jn=contact_law.potential_normal_direction),
+    )
+
+    # Assert
+    assert [cost_functional.has_contact_kernels for cost_functional in cost_functionals] == [
+        True,
+        False,
+        False,
+    ]
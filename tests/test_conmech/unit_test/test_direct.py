@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from conmech.simulations.problem_solver import (
+    QuasistaticRelaxation,
+    StaticSolver,
+    TimeDependentSolver,
+)
+from tests.test_conmech.unit_test.setups import (
+    DynamicSetup,
+    QuasistaticSetup,
+    RelaxationSetup,
+    StaticSetup,
+    rectangle,
+)
+
+
+def zeros(x):
+    return np.zeros_like(x)
+
+
+def solve_static(solving_method):
+    runner = StaticSolver(StaticSetup(mesh_descr=rectangle()), solving_method)
+    return runner.solve(initial_displacement=zeros)
+
+
+def solve_quasistatic(solving_method):
+    runner = TimeDependentSolver(QuasistaticSetup(mesh_descr=rectangle()), solving_method)
+    return runner.solve(n_steps=3, initial_displacement=zeros, initial_velocity=zeros)[-1]
+
+
+def solve_quasistatic_relaxation(solving_method):
+    runner = QuasistaticRelaxation(RelaxationSetup(mesh_descr=rectangle()), solving_method)
+    return runner.solve(n_steps=3, initial_absement=zeros, initial_displacement=zeros)[-1]
+
+
+def solve_dynamic(solving_method):
+    runner = TimeDependentSolver(DynamicSetup(mesh_descr=rectangle()), solving_method)
+    return runner.solve(n_steps=3, initial_displacement=zeros, initial_velocity=zeros)[-1]
+
+
+@pytest.mark.parametrize(
+    "solve", (solve_static, solve_quasistatic, solve_quasistatic_relaxation, solve_dynamic)
+)
+def test_direct_solvers(solve):
+    # Act
+    state = solve("direct")
+
+    # Assert
+    np.testing.assert_allclose(state.displacement, solve("global").displacement, atol=1e-8)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from conmech.solvers.linear_solver import DirectLinearSolver, KrylovLinearSolver
+
+MATRIX = np.array([[4.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 2.0]])
+RHS = np.array([1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize("lhs", (MATRIX, sparse.csr_matrix(MATRIX)))
+def test_direct_reuses_factorization(lhs):
+    # Arrange
+    solver = DirectLinearSolver()
+
+    # Act
+    first_solution = solver.solve(lhs, RHS)
+    first_solver = solver._lhs_solver
+    solver.solve(lhs.copy(), RHS)
+    same_solver = solver._lhs_solver
+    changed_solution = solver.solve(2 * lhs, RHS)
+
+    # Assert
+    assert same_solver is first_solver
+    assert solver._lhs_solver is not first_solver
+    np.testing.assert_almost_equal(first_solution, np.linalg.solve(MATRIX, RHS))
+    np.testing.assert_almost_equal(changed_solution, np.linalg.solve(2 * MATRIX, RHS))
+
+
+@pytest.mark.parametrize("method", ("cg", "minres", "gmres"))
+@pytest.mark.parametrize("preconditioner", (None, "jacobi", "ilu", "block"))
+def test_krylov_solution(method, preconditioner):
+    # Arrange
+    size = 50
+    lhs = sparse.diags(
+        (-np.ones(size - 1), 4 * np.ones(size), -np.ones(size - 1)), (-1, 0, 1), format="csr"
+    )
+    rhs = np.linspace(0, 1, size)
+    solver = KrylovLinearSolver(method, preconditioner=preconditioner, blocks=2)
+
+    # Act
+    solution = solver.solve(lhs, rhs)
+    cold_iterations = solver.iterations
+    warm_solution = solver.solve(lhs, rhs, initial_guess=solution)
+
+    # Assert
+    expected = np.linalg.solve(lhs.toarray(), rhs)
+    np.testing.assert_allclose(solution, expected, atol=1e-8)
+    np.testing.assert_allclose(warm_solution, expected, atol=1e-8)
+    assert solver.residual < 1e-8
+    assert solver.iterations <= min(cold_iterations, 2)
@@ -1,15 +1,14 @@
 import numpy as np
+import pytest
 
-from conmech.dynamics.factory._dynamics_factory_2d import (
-    get_edges_features_matrix_numba as sut_2d,
-)
-from conmech.dynamics.factory._dynamics_factory_3d import (
-    get_edges_features_matrix_numba as sut_3d,
-)
+from conmech.dynamics.factory._dynamics_factory_2d import DynamicsFactory2D
+from conmech.dynamics.factory._dynamics_factory_3d import DynamicsFactory3D
 from conmech.dynamics.dynamics import Dynamics
+from conmech.dynamics.factory.dynamics_factory_method import get_basic_matrices
 from conmech.simulations.problem_solver import Body
 from conmech.mesh.mesh import Mesh
 from conmech.mesh import mesh_builders
+from conmech.mesh.utils import get_elements_geometry
 from conmech.properties.mesh_description import RectangleMeshDescription, CubeMeshDescription
 
 
@@ -25,9 +24,11 @@ def test_matrices_2d_integrals():
     )
 
     # Act
-    edges_features_matrix, element_initial_volume, _ = sut_2d(
-        elements=elements, nodes=initial_nodes
-    )
+    (
+        edges_features_matrix,
+        element_initial_volume,
+        _,
+    ) = DynamicsFactory2D().get_edges_features_matrix(elements=elements, nodes=initial_nodes)
 
     # Assert
     np.testing.assert_allclose(element_initial_volume.sum(), area)
@@ -53,9 +54,11 @@ def test_matrices_3d_integrals():
     )
 
     # Act
-    edges_features_matrix, element_initial_volume, _ = sut_3d(
-        elements=elements, nodes=initial_nodes
-    )
+    (
+        edges_features_matrix,
+        element_initial_volume,
+        _,
+    ) = DynamicsFactory3D().get_edges_features_matrix(elements=elements, nodes=initial_nodes)
 
     # Assert
     np.testing.assert_allclose(element_initial_volume.sum(), 1)
@@ -84,12 +87,42 @@ def test_local_stiff_mats_assembly():
             initial_position=None, max_element_perimeter=(scale_x / 3), scale=[scale_x, scale_y]
         )
     )
-    edges_features_matrix, _, local_stiff_mats = sut_2d(elements=elements, nodes=initial_nodes)
-    expected_w_matrix = np.asarray(
-        [
-            [edges_features_matrix[2 + dimension * (k + 1) + j] for j in range(dimension)]
-            for k in range(dimension)
-        ]
+    *_, expected_w_matrix, local_stiff_mats = get_basic_matrices(
+        elements=elements, nodes=initial_nodes
+    )
+
+    mesh = object.__new__(Mesh)
+    mesh.nodes = initial_nodes
+    mesh.elements = elements
+
+    body = object.__new__(Body)
+    body.mesh = mesh
+
+    dynamics = object.__new__(Dynamics)
+    dynamics.body = body
+    dynamics._local_stifness_matrices = local_stiff_mats
+    dynamics._w_matrix = expected_w_matrix
+    density = np.ones(elements.shape[0])
+
+    # Act
+    assembled_w_mat = dynamics.asembly_w_matrix_with_density(density)
+
+    # Assert
+    for k in range(dimension):
+        for j in range(dimension):
+            np.testing.assert_almost_equal(
+                assembled_w_mat[k, j].toarray(), expected_w_matrix[k, j].toarray()
+            )
+
+
+def test_local_stiff_mats_assembly_3d():
+    # Arrange
+    dimension = 3
+    initial_nodes, elements = mesh_builders.build_mesh(
+        mesh_descr=CubeMeshDescription(initial_position=None)
+    )
+    *_, expected_w_matrix, local_stiff_mats = get_basic_matrices(
+        elements=elements, nodes=initial_nodes
     )
 
     mesh = object.__new__(Mesh)
@@ -109,4 +142,59 @@ def test_local_stiff_mats_assembly():
     assembled_w_mat = dynamics.asembly_w_matrix_with_density(density)
 
     # Assert
-    np.testing.assert_almost_equal(assembled_w_mat, expected_w_matrix)
+    assert local_stiff_mats.shape == (dimension, dimension, len(elements), 4, 4)
+    for k in range(dimension):
+        for j in range(dimension):
+            np.testing.assert_almost_equal(
+                assembled_w_mat[k, j].toarray(), expected_w_matrix[k, j].toarray()
+            )
+
+
+@pytest.mark.parametrize(
+    "mesh_descr",
+    (
+        RectangleMeshDescription(initial_position=None, max_element_perimeter=0.5, scale=[2, 3]),
+        CubeMeshDescription(initial_position=None),
+    ),
+)
+def test_parallel_assembly(mesh_descr):
+    # Arrange
+    initial_nodes, elements = mesh_builders.build_mesh(mesh_descr=mesh_descr)
+    expected = get_basic_matrices(elements=elements, nodes=initial_nodes)
+
+    # Act
+    result = get_basic_matrices(elements=elements, nodes=initial_nodes, parallel=True)
+
+    # Assert
+    element_initial_volume, volume_at_nodes, U, V, W, local_stiff_mats = result
+    np.testing.assert_almost_equal(element_initial_volume, expected[0])
+    np.testing.assert_almost_equal(volume_at_nodes.toarray(), expected[1].toarray())
+    np.testing.assert_almost_equal(U.toarray(), expected[2].toarray())
+    for k, V_k in enumerate(V):
+        np.testing.assert_almost_equal(V_k.toarray(), expected[3][k].toarray())
+    for (k, j), W_kj in np.ndenumerate(W):
+        np.testing.assert_almost_equal(W_kj.toarray(), expected[4][k, j].toarray())
+    np.testing.assert_almost_equal(local_stiff_mats, expected[5])
+
+
+def test_elements_geometry():
+    # Arrange
+    nodes = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 2.0]])
+    elements = np.array([[0, 1, 2], [1, 3, 2]])
+
+    # Act
+    coefficients_2d, gradients_2d, volumes_2d = get_elements_geometry(elements, nodes[:, :2])
+    coefficients_3d, gradients_3d, volumes_3d = get_elements_geometry(
+        np.array([[0, 1, 2, 3]]), nodes
+    )
+
+    # Assert
+    np.testing.assert_almost_equal(volumes_2d, [0.5, 0.5])
+    np.testing.assert_almost_equal(coefficients_2d[0], [[1, -1, -1], [0, 1, 0], [0, 0, 1]])
+    np.testing.assert_almost_equal(coefficients_2d[1], [[1, 0, -1], [-1, 1, 1], [1, -1, 0]])
+    np.testing.assert_almost_equal(gradients_2d, coefficients_2d[:, :, 1:])
+    np.testing.assert_almost_equal(volumes_3d, [1 / 3])
+    np.testing.assert_almost_equal(
+        gradients_3d[0], [[-1, -1, 0.5], [1, 0, -0.5], [0, 1, -0.5], [0, 0, 0.5]]
+    )
+    np.testing.assert_almost_equal(coefficients_3d[0, :, 0], [1, 0, 0, 0])
@@ -2,11 +2,13 @@
 Created at 12.02.2022
 """
 
+import numba
 import numpy as np
 import pytest
 
-from conmech.mesh.boundaries_description import BoundariesDescription
+from conmech.mesh.boundaries_description import BoundariesDescription, vectorized
 from conmech.mesh.boundaries_factory import BoundariesFactory
+from conmech.mesh.mesh import get_closest_to_axis, get_edges, get_node_adjacency
 from tests.test_conmech.regression.std_boundary import extract_boundary_paths_from_elements
 
 
@@ -196,6 +198,22 @@ def generate_test_suits():
         expected_dirichlet_boundary,
     )
 
+    yield "vectorized indicators", (
+        vectorized(lambda x: x[:, 0] == 0),
+        vectorized(lambda x: x[:, 1] == 0),
+        expected_contact_boundary,
+        expected_neumann_boundary,
+        expected_dirichlet_boundary,
+    )
+
+    yield "numba indicators", (
+        numba.njit(is_dirichlet),
+        numba.njit(is_contact),
+        expected_contact_boundary,
+        expected_neumann_boundary,
+        expected_dirichlet_boundary,
+    )
+
 
 @pytest.mark.parametrize("_test_name_, params", list(generate_test_suits()))
 def test_condition_boundaries(_test_name_, params):
@@ -230,3 +248,42 @@ def test_condition_boundaries(_test_name_, params):
     assert compare_surfaces(boundaries_data.contact_boundary, expected_contact_boundary)
     assert compare_surfaces(boundaries_data.neumann_boundary, expected_neumann_boundary)
     assert compare_surfaces(boundaries_data.dirichlet_boundary, expected_dirichlet_boundary)
+
+
+def test_edges_and_node_adjacency():
+    elements = np.array([[0, 1, 3], [1, 2, 3], [3, 2, 4]])
+
+    edges = get_edges(elements)
+    node_adjacency = get_node_adjacency(edges, nodes_count=6)
+
+    np.testing.assert_array_equal(edges, [[0, 1], [0, 3], [1, 2], [1, 3], [2, 3], [2, 4], [3, 4]])
+    expected = np.zeros((6, 6), dtype=bool)
+    expected[edges[:, 0], edges[:, 1]] = expected[edges[:, 1], edges[:, 0]] = True
+    np.testing.assert_array_equal(node_adjacency.toarray(), expected)
+
+
+def closest_to_axis_of_all_pairs(nodes, variable):
+    min_error = 1.0
+    final_i, final_j = 0, 0
+    for i in range(len(nodes)):
+        for j in range(i + 1, len(nodes)):
+            error = np.linalg.norm(np.delete(nodes[i] - nodes[j], variable))
+            if error < min_error:
+                min_error, final_i, final_j = error, i, j
+    correct_order = nodes[final_i, variable] < nodes[final_j, variable]
+    indices = (final_i, final_j) if correct_order else (final_j, final_i)
+    return np.array([min_error, indices[0], indices[1]])
+
+
+@pytest.mark.parametrize("dimension", (2, 3))
+def test_closest_to_axis_of_symmetric_mesh(dimension):
+    # Arrange
+    axis = np.linspace(-1, 1, 5 if dimension == 2 else 3)
+    nodes = np.stack(np.meshgrid(*[axis] * dimension), axis=-1).reshape(-1, dimension)
+
+    for variable in range(dimension):
+        # Act
+        result = get_closest_to_axis(nodes, variable)
+
+        # Assert
+        np.testing.assert_array_equal(result, closest_to_axis_of_all_pairs(nodes, variable))
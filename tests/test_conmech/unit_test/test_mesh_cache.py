@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+import pytest
+
+from conmech.mesh import mesh_builders
+from conmech.mesh.boundaries_description import BoundariesDescription
+from conmech.mesh.mesh import Mesh
+from conmech.mesh.mesh_cache import MeshCache
+from conmech.properties.mesh_description import RectangleMeshDescription
+
+MESH_DESCR = RectangleMeshDescription(
+    initial_position=None, max_element_perimeter=0.25, scale=[2, 1]
+)
+
+
+def build(cache, boundaries_description=None, cache_key=None):
+    if boundaries_description is None:
+        boundaries_description = BoundariesDescription(
+            contact=lambda x: x[1] == 0,
+            dirichlet=(lambda x: x[0] == 0, lambda x: np.full(len(x), 0.1)),
+        )
+    return Mesh(MESH_DESCR, boundaries_description, cache=cache, cache_key=cache_key)
+
+
+def test_mesh_loaded_from_cache(tmp_path, monkeypatch):
+    cache = MeshCache(str(tmp_path))
+    built = build(cache)
+
+    def fail(*_, **__):
+        raise AssertionError("Mesh built instead of loaded")
+
+    monkeypatch.setattr(mesh_builders, "build_mesh", fail)
+    loaded = build(cache)
+
+    assert len(os.listdir(tmp_path)) == 1
+    for name in ("nodes", "elements", "edges"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(built, name))
+    assert (loaded.node_adjacency != built.node_adjacency).nnz == 0
+    np.testing.assert_array_equal(
+        loaded.boundaries.surface_normals, built.boundaries.surface_normals
+    )
+    for name, boundary in built.boundaries.boundaries.items():
+        np.testing.assert_array_equal(
+            loaded.boundaries.boundaries[name].surfaces, boundary.surfaces
+        )
+        assert loaded.boundaries.boundaries[name].node_indices == boundary.node_indices
+    np.testing.assert_array_equal(loaded.boundaries.boundaries["dirichlet"].node_condition, 0.1)
+
+
+def test_mesh_cache_keys_and_eviction(tmp_path):
+    cache = MeshCache(str(tmp_path))
+    build(cache)
+    build(cache, BoundariesDescription(contact=lambda x: x[1] == 1))
+    build(cache, BoundariesDescription(), cache_key="sweep")
+    assert len(os.listdir(tmp_path)) == 3
+
+    cache.max_size = 1
+    cache.evict()
+    assert not os.listdir(tmp_path)
+
+
+def test_mesh_cache_keys_of_called_functions():
+    namespace = {}
+    exec("def is_bottom(x):\n    return x[1] == 0", namespace)
+    exec("def indicator(x):\n    return is_bottom(x)", namespace)
+    boundaries_description = BoundariesDescription(contact=namespace["indicator"])
+    key = MeshCache.key(MESH_DESCR, boundaries_description)
+    exec("def is_bottom(x):\n    return x[1] == 1", namespace)
+    assert MeshCache.key(MESH_DESCR, boundaries_description) != key
+
+    class Level:
+        value = 0
+
+    level = Level()
+    boundaries_description = BoundariesDescription(contact=lambda x: x[1] == level.value)
+    with pytest.raises(ValueError, match="explicit cache key"):
+        MeshCache.key(MESH_DESCR, boundaries_description)
+    assert MeshCache.key(MESH_DESCR, boundaries_description, key="level")
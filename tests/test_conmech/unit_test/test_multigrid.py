@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from conmech.mesh.mesh_builders import build_mesh
+from conmech.mesh.utils import get_elements_geometry
+from conmech.properties.mesh_description import RectangleMeshDescription
+from conmech.simulations.problem_solver import StaticSolver
+from conmech.solvers.linear_solver import KrylovLinearSolver
+from conmech.solvers.multigrid import get_prolongation, get_prolongations
+from tests.test_conmech.unit_test.setups import StaticSetup, rectangle
+
+
+def test_prolongation_interpolates_linear_functions():
+    # Arrange
+    coarse_nodes, coarse_elements = build_mesh(
+        RectangleMeshDescription(initial_position=None, max_element_perimeter=0.5, scale=[1, 1])
+    )
+    fine_nodes = np.random.default_rng(0).random((100, 2))
+
+    def linear_function(nodes):
+        return 1 + 2 * nodes[:, 0] - 3 * nodes[:, 1]
+
+    # Act
+    prolongation = get_prolongation(coarse_nodes, coarse_elements, fine_nodes)
+
+    # Assert
+    np.testing.assert_allclose(
+        prolongation @ linear_function(coarse_nodes), linear_function(fine_nodes)
+    )
+
+
+def test_multigrid_preconditioned_cg():
+    # Arrange
+    mesh_descr = RectangleMeshDescription(
+        initial_position=None, max_element_perimeter=0.05, scale=[1, 1]
+    )
+    nodes, elements = build_mesh(mesh_descr)
+    _, gradients, volumes = get_elements_geometry(elements, nodes)
+    local_matrices = volumes[:, np.newaxis, np.newaxis] * gradients @ gradients.transpose(0, 2, 1)
+    rows = np.repeat(elements, 3, axis=1).ravel()
+    columns = np.tile(elements, (1, 3)).ravel()
+    # stiffness matrix of the Laplace operator, shifted to be positive definite
+    lhs = sparse.csr_matrix((local_matrices.ravel(), (rows, columns))) + 1e-3 * sparse.eye(
+        len(nodes)
+    )
+    rhs = np.ones(len(nodes))
+    jacobi_solver = KrylovLinearSolver("cg", preconditioner="jacobi")
+    multigrid_solver = KrylovLinearSolver(
+        "cg", preconditioner="multigrid", prolongations=get_prolongations(mesh_descr, nodes)
+    )
+
+    # Act
+    jacobi_solver.solve(lhs, rhs)
+    solution = multigrid_solver.solve(lhs, rhs)
+
+    # Assert
+    np.testing.assert_allclose(lhs @ solution, rhs, rtol=1e-8)
+    assert multigrid_solver.iterations < jacobi_solver.iterations / 4
+
+
+def solve_static(method, **options):
+    runner = StaticSolver(
+        StaticSetup(mesh_descr=rectangle(max_element_perimeter=0.25), contact_law=None), "direct"
+    )
+    runner.set_linear_solver(method, **options)
+    return runner.solve(initial_displacement=np.zeros_like).displacement
+
+
+@pytest.mark.parametrize(
+    "options", ({"preconditioner": "jacobi"}, {"preconditioner": "multigrid", "levels": 2})
+)
+def test_problem_solver_with_krylov_linear_solver(options):
+    # Act
+    displacement = solve_static("cg", **options)
+
+    # Assert
+    np.testing.assert_allclose(displacement, solve_static("direct"), atol=1e-8)
+
+
+def test_problem_solver_with_multigrid_for_other_mesh():
+    # Arrange
+    nodes, _ = build_mesh(rectangle(max_element_perimeter=0.25))
+    # prolongations of a mesh with a node more than the problem one
+    prolongations = get_prolongations(rectangle(), np.vstack((nodes, nodes[:1])))
+
+    # Act and Assert
+    with pytest.raises(ValueError, match="not a multiple"):
+        solve_static("cg", preconditioner="multigrid", prolongations=prolongations)
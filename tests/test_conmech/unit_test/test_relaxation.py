@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from conmech.properties.body_properties import PronyRelaxation
+from conmech.simulations.problem_solver import QuasistaticRelaxation
+from tests.test_conmech.unit_test.setups import RELAXATION, RelaxationSetup, rectangle
+
+
+def solve(relaxation):
+    setup = RelaxationSetup(mesh_descr=rectangle())
+    setup.relaxation = relaxation
+    runner = QuasistaticRelaxation(setup, solving_method="schur")
+    states = runner.solve(
+        n_steps=4,
+        initial_absement=lambda x: np.zeros_like(x),
+        initial_displacement=lambda x: np.zeros_like(x),
+    )
+    return runner, states[-1].displacement
+
+
+def test_relaxation_operator_combines_unit_operators():
+    runner, _ = solve(RelaxationSetup.relaxation)
+    dynamics = runner.body.dynamics
+    coefficients = np.random.default_rng(0).normal(size=(2, 2, 2))
+
+    np.testing.assert_allclose(
+        dynamics.relaxation_operator(coefficients).toarray(),
+        dynamics.factory.get_relaxation_tensor(
+            dynamics._w_matrix, coefficients  # pylint: disable=protected-access
+        ).toarray(),
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("relaxation_time", (np.inf, 0.5))
+def test_prony_relaxation(relaxation_time):
+    kernel = PronyRelaxation(
+        coefficients=RELAXATION[None], relaxation_times=np.array([relaxation_time])
+    )
+    _, constant_displacement = solve(RelaxationSetup.relaxation)
+    _, prony_displacement = solve(kernel)
+
+    if relaxation_time == np.inf:
+        # constant kernel: hereditary integral is absement
+        np.testing.assert_allclose(prony_displacement, constant_displacement, atol=1e-10)
+    else:
+        # relaxing body is softer
+        assert np.abs(prony_displacement).max() > np.abs(constant_displacement).max()
+
+
+def test_relaxation_evaluated_once_per_step():
+    times = []
+
+    def relaxation(t):
+        times.append(t)
+        return RELAXATION * (1 + t)
+
+    solve(relaxation)
+
+    assert len(times) == len(set(times))
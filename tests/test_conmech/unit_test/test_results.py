@@ -0,0 +1,24 @@
+import numpy as np
+
+from conmech.state.results import ResultsReader, ResultsWriter
+from tests.test_conmech.unit_test.setups import solve_quasistatic
+
+
+def test_results_file(tmp_path):
+    # Arrange
+    states = solve_quasistatic()
+
+    # Act
+    with ResultsWriter(str(tmp_path), states.body, chunk_size=1) as writer:
+        for state in states:
+            writer.append(state)
+    reader = ResultsReader(str(tmp_path))
+
+    # Assert
+    assert len(reader) == len(states)
+    np.testing.assert_allclose(reader.time, states.time)
+    np.testing.assert_allclose(reader.mesh["nodes"], states.body.mesh.nodes)
+    np.testing.assert_allclose(reader.field("displacement")[-1], states[-1].displacement)
+    state = reader.state(-1, states.body)
+    np.testing.assert_allclose(state.velocity, states[-1].velocity)
+    np.testing.assert_allclose(state.displaced_nodes, states[-1].displaced_nodes)
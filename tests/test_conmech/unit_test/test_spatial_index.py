@@ -0,0 +1,27 @@
+import numpy as np
+
+from conmech.mesh.spatial_index import SpatialIndex
+
+NODES = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.5, 0.4]])
+ELEMENTS = np.array([[0, 1, 4], [1, 3, 4], [3, 2, 4], [2, 0, 4]])
+
+
+def test_nodes_queries():
+    index = SpatialIndex(NODES, ELEMENTS)
+
+    np.testing.assert_array_equal(index.nearest_node(np.array([[0.9, 0.1], [0.4, 0.5]])), [1, 4])
+    np.testing.assert_array_equal(index.nodes_within(np.array([0.0, 0.0]), 1.0), [0, 1, 2, 4])
+    assert index.closest_pair()[1:] == (0, 4)
+    # all sides of the square are equally long
+    assert SpatialIndex(NODES[:4]).closest_pair() == (1.0, 0, 1)
+
+
+def test_locate():
+    index = SpatialIndex(NODES, ELEMENTS)
+    points = np.array([[0.5, 0.1], [0.9, 0.5], [0.5, -0.5]])
+
+    elements, weights = index.locate(points)
+
+    np.testing.assert_array_equal(elements[:2], [0, 1])
+    np.testing.assert_allclose(np.einsum("pi,pij->pj", weights, NODES[ELEMENTS[elements]]), points)
+    np.testing.assert_array_equal(index.contains(points), [True, True, False])
@@ -0,0 +1,70 @@
+import numpy as np
+from scipy.sparse import linalg
+
+from conmech.dynamics.statement import Variables
+from conmech.mesh.boundaries_description import BoundariesDescription
+from conmech.simulations.problem_solver import StaticSolver, TimeDependentSolver
+from tests.test_conmech.unit_test.setups import QuasistaticSetup, StaticSetup, rectangle
+
+BOUNDARIES = BoundariesDescription(
+    contact=lambda x: x[1] == 0,
+    dirichlet=(lambda x: x[0] == 0, lambda x: np.full_like(x[:, 0], 0.1)),
+)
+
+
+def test_reduced_system():
+    # Arrange
+    setup = StaticSetup(mesh_descr=rectangle(), boundaries=BOUNDARIES)
+    statement = StaticSolver(setup, "direct").step_solver.statement
+    free = statement.free_dofs
+
+    # Act
+    reduced_solution = linalg.spsolve(
+        statement.reduced_left_hand_side.tocsc(), statement.right_hand_side[free]
+    )
+
+    # Assert
+    np.testing.assert_allclose(
+        statement.expand(reduced_solution),
+        linalg.spsolve(statement.left_hand_side.tocsc(), statement.right_hand_side),
+    )
+    constrained, lifting = statement.dirichlet_partition
+    np.testing.assert_array_equal(statement.expand(reduced_solution)[constrained], 0.1)
+    assert len(free) + constrained.sum() == len(lifting)
+
+
+def test_dirichlet_elimination_reused():
+    # Arrange
+    setup = StaticSetup(mesh_descr=rectangle(), boundaries=BOUNDARIES)
+    statement = StaticSolver(setup, "direct").step_solver.statement
+    left_hand_side = statement.left_hand_side
+    right_hand_side = statement.right_hand_side.copy()
+
+    # Act
+    statement.update_right_hand_side(Variables())
+    statement.apply_dirichlet_condition()
+
+    # Assert
+    assert statement.left_hand_side is left_hand_side
+    np.testing.assert_allclose(statement.right_hand_side, right_hand_side)
+
+
+def test_left_hand_side_rebuilt_only_when_inputs_change():
+    # Arrange
+    setup = QuasistaticSetup(mesh_descr=rectangle(), boundaries=BOUNDARIES)
+    solver = TimeDependentSolver(setup, "direct")
+    statement = solver.step_solver.statement
+    zeros = np.zeros(2 * solver.body.mesh.nodes_count)
+
+    def update(time_step):
+        statement.update(Variables(displacement=zeros, time_step=time_step, time=0))
+        return statement.left_hand_side_version
+
+    # Act & Assert
+    version = statement.left_hand_side_version
+    left_hand_side = statement.left_hand_side
+    assert update(0.1) == version
+    assert statement.left_hand_side is left_hand_side
+    assert update(0.2) == version + 1
+    solver.body.dynamics.reinitialize_matrices()
+    assert update(0.2) == version + 2
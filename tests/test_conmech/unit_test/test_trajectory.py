@@ -0,0 +1,43 @@
+import numpy as np
+
+from conmech.simulations.problem_solver import TimeDependentSolver
+from tests.test_conmech.unit_test.setups import QuasistaticSetup, rectangle, solve_quasistatic
+
+
+def test_trajectory(tmp_path):
+    # Act
+    states = solve_quasistatic()
+    mapped_states = solve_quasistatic(trajectory_path=str(tmp_path))
+
+    # Assert
+    assert len(states) == 2
+    np.testing.assert_allclose(states.time, [0.2, 0.4])
+    assert states[0].displacement.base is states.fields["displacement"]
+    assert not np.allclose(states[0].displacement, states[-1].displacement)
+    np.testing.assert_allclose([state.time for state in states[::-1]], [0.4, 0.2])
+    assert states[5:] == []
+    np.testing.assert_allclose(
+        states[-1].displaced_nodes[: len(states[-1].displacement)],
+        states.body.mesh.nodes[: len(states[-1].displacement)] + states[-1].displacement,
+    )
+    for state, mapped_state in zip(states, mapped_states):
+        np.testing.assert_allclose(mapped_state.velocity, state.velocity)
+    np.testing.assert_allclose(np.load(tmp_path / "displacement.npy")[-1], states[-1].displacement)
+
+
+def test_penetration_of_steps():
+    # Arrange
+    setup = QuasistaticSetup(mesh_descr=rectangle())
+    runner = TimeDependentSolver(setup, solving_method="schur")
+
+    # Act
+    states = runner.solve(
+        n_steps=5,
+        output_step=(2, 4),
+        initial_displacement=setup.initial_displacement,
+        initial_velocity=setup.initial_velocity,
+    )
+
+    # Assert
+    np.testing.assert_allclose(runner.penetration[:, 0], [0.1, 0.2, 0.3, 0.4])
+    np.testing.assert_allclose(runner.penetration[1::2, 1], states.penetration)